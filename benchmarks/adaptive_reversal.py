@@ -0,0 +1,70 @@
+"""
+Benchmarks reversal of files by lines
+with fixed batch size against adaptive batch size
+for files of different sizes.
+
+Usage:
+
+    python -m benchmarks.adaptive_reversal [--sizes SIZE [SIZE ...]]
+        [--batch-size BATCH_SIZE] [--max-batch-size MAX_BATCH_SIZE]
+        [--directory DIRECTORY]
+"""
+import argparse
+import io
+import tempfile
+import time
+import typing as t
+from collections import deque
+
+from lz.reversal import reverse_bytes_stream
+
+LINE = b'Lorem ipsum dolor sit amet, consectetur adipiscing elit.\n'
+
+
+def measure(file: t.BinaryIO,
+            *,
+            batch_size: int,
+            max_batch_size: t.Optional[int]) -> float:
+    start = time.perf_counter()
+    deque(reverse_bytes_stream(file,
+                               batch_size=batch_size,
+                               max_batch_size=max_batch_size),
+          maxlen=0)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes',
+                        help='sizes of files in bytes',
+                        nargs='+',
+                        type=int,
+                        default=[2 ** 20, 10 * 2 ** 20, 100 * 2 ** 20])
+    parser.add_argument('--batch-size',
+                        type=int,
+                        default=io.DEFAULT_BUFFER_SIZE)
+    parser.add_argument('--max-batch-size',
+                        type=int,
+                        default=2 ** 20)
+    parser.add_argument('--directory',
+                        help='directory to create files in, '
+                             'e.g. on a network filesystem')
+    namespace = parser.parse_args()
+    for size in namespace.sizes:
+        with tempfile.TemporaryFile(dir=namespace.directory) as file:
+            file.write(LINE * (size // len(LINE)))
+            file.flush()
+            fixed_elapsed = measure(file,
+                                    batch_size=namespace.batch_size,
+                                    max_batch_size=None)
+            adaptive_elapsed = measure(
+                    file,
+                    batch_size=namespace.batch_size,
+                    max_batch_size=namespace.max_batch_size
+            )
+        print(f'{size} bytes: fixed {fixed_elapsed:.3f}s, '
+              f'adaptive {adaptive_elapsed:.3f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmarks construction of compositions, cleavages & combinations
+from deep call stacks.
+
+Usage:
+
+    python -m benchmarks.construction [--depth DEPTH] [--number NUMBER]
+"""
+import argparse
+import inspect
+import timeit
+import typing as t
+
+from lz._core.functional import Composition
+from lz.functional import compose
+
+
+def construct_with_stack_inspection() -> t.Callable[..., t.Any]:
+    caller_frame_info = inspect.stack()[1]
+    return Composition(abs, int,
+                       file_path=caller_frame_info.filename,
+                       line_number=caller_frame_info.lineno,
+                       line_offset=0)
+
+
+def construct_with_location_capture() -> t.Callable[..., t.Any]:
+    return compose(abs, int)
+
+
+def construct_without_location_capture() -> t.Callable[..., t.Any]:
+    return compose(abs, int,
+                   capture_location=False)
+
+
+def construct_lazily() -> t.Callable[..., t.Any]:
+    return compose(abs, int,
+                   lazy=True)
+
+
+def run_at_depth(depth: int,
+                 function: t.Callable[[], t.Any],
+                 number: int) -> float:
+    if depth:
+        return run_at_depth(depth - 1, function, number)
+    return timeit.timeit(function,
+                         number=number)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--depth',
+                        type=int,
+                        default=100)
+    parser.add_argument('--number',
+                        type=int,
+                        default=1_000)
+    namespace = parser.parse_args()
+    for function in (construct_with_stack_inspection,
+                     construct_with_location_capture,
+                     construct_without_location_capture,
+                     construct_lazily):
+        for depth in sorted({0, namespace.depth}):
+            elapsed = run_at_depth(depth, function, namespace.number)
+            print(f'{function.__name__} at depth {depth}: '
+                  f'{elapsed / namespace.number * 10 ** 6:.2f} us per call')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmarks replication of whole containers
+against element-wise replication through the shared buffer.
+
+Usage:
+
+    python -m benchmarks.containers_replication [--count COUNT]
+                                                [--max-exponent EXPONENT]
+"""
+import argparse
+import time
+import typing as t
+
+from lz.replication import (_replicate_iterable,
+                            replicate)
+
+ContainersFactory = t.Callable[[int], t.Any]
+
+
+def replicate_element_wise(value: t.Any,
+                           *,
+                           count: int) -> t.List[t.Any]:
+    # dictionaries were replicated by items
+    return [type(value)(replica)
+            for replica in _replicate_iterable(
+                value.items() if isinstance(value, dict) else value,
+                count=count
+            )]
+
+
+def replicate_directly(value: t.Any,
+                       *,
+                       count: int) -> t.List[t.Any]:
+    return list(replicate(value,
+                          count=count))
+
+
+containers_factories: t.Dict[str, ContainersFactory] = {
+    'list': lambda size: list(range(size)),
+    'list of lists': lambda size: [[index] for index in range(size)],
+    'tuple': lambda size: tuple(range(size)),
+    'set': lambda size: set(range(size)),
+    'dict': lambda size: dict.fromkeys(range(size), 0),
+    'dict of lists': lambda size: {index: [index] for index in range(size)},
+}
+
+
+def measure(replicator: t.Callable[..., t.List[t.Any]],
+            value: t.Any,
+            *,
+            count: int) -> float:
+    start = time.perf_counter()
+    replicator(value,
+               count=count)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--count',
+                        type=int,
+                        default=4)
+    parser.add_argument('--max-exponent',
+                        type=int,
+                        default=6)
+    namespace = parser.parse_args()
+    for exponent in range(3, namespace.max_exponent + 1):
+        size = 10 ** exponent
+        for name, factory in containers_factories.items():
+            value = factory(size)
+            element_wise_time = measure(replicate_element_wise, value,
+                                        count=namespace.count)
+            direct_time = measure(replicate_directly, value,
+                                  count=namespace.count)
+            print(f'{name} of size 10^{exponent}: '
+                  f'element-wise {element_wise_time:.4f}s, '
+                  f'direct {direct_time:.4f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""
+Benchmarks partial application throughput of curried functions.
+
+Usage:
+
+    python -m benchmarks.currying [--number NUMBER]
+"""
+import argparse
+import timeit
+import typing as t
+
+from lz.functional import curry
+
+
+def ternary(first: int, second: int, third: int, *, scale: int = 1) -> int:
+    return (first + second + third) * scale
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--number',
+                        type=int,
+                        default=100_000)
+    namespace = parser.parse_args()
+    cases: t.Dict[str, t.Callable[[t.Callable[..., t.Any]], t.Any]] = {
+        'one by one': lambda curried: curried(1)(2)(3),
+        'by keyword': lambda curried: curried(1, scale=2)(2, 3),
+        'all at once': lambda curried: curried(1, 2, 3),
+    }
+    for planned in (False, True):
+        curried = curry(ternary,
+                        planned=planned)
+        for case_name, case in cases.items():
+            elapsed = timeit.timeit(lambda: case(curried),
+                                    number=namespace.number)
+            print(f'{"planned" if planned else "probing"} {case_name}: '
+                  f'{namespace.number / elapsed:,.0f} calls per second')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmarks reversal of a file by lines
+with memory mapping against reversal by segments in parallel
+with threads and processes.
+
+Usage:
+
+    python -m benchmarks.parallel_reversal [--size SIZE]
+        [--segment-size SEGMENT_SIZE] [--workers-count WORKERS_COUNT]
+        [--directory DIRECTORY]
+"""
+import argparse
+import tempfile
+import time
+import typing as t
+from collections import deque
+
+from lz.reversal import (reverse_mapped_file,
+                         reverse_segmented_file)
+
+LINE = b'Lorem ipsum dolor sit amet, consectetur adipiscing elit.\n'
+
+
+def measure(lines: t.Iterable[t.Any]) -> float:
+    start = time.perf_counter()
+    deque(lines,
+          maxlen=0)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size',
+                        help='size of file in bytes',
+                        type=int,
+                        default=2 ** 30)
+    parser.add_argument('--segment-size',
+                        type=int,
+                        default=2 ** 24)
+    parser.add_argument('--workers-count',
+                        type=int,
+                        default=None)
+    parser.add_argument('--directory',
+                        help='directory to create file in, '
+                             'e.g. on a network filesystem')
+    namespace = parser.parse_args()
+    with tempfile.NamedTemporaryFile(dir=namespace.directory) as file:
+        file.write(LINE * (namespace.size // len(LINE)))
+        file.flush()
+        print(f'mapped: {measure(reverse_mapped_file(file)):.3f}s')
+        for backend in ('thread', 'process'):
+            elapsed = measure(reverse_segmented_file(
+                    file,
+                    backend=backend,
+                    segment_size=namespace.segment_size,
+                    workers_count=namespace.workers_count
+            ))
+            print(f'{backend}: {elapsed:.3f}s')
+
+
+if __name__ == '__main__':
+    main()
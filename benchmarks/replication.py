@@ -0,0 +1,94 @@
+"""
+Benchmarks replication of long streams with lagging replicas
+against per-replica queues.
+
+Usage:
+
+    python -m benchmarks.replication [--size SIZE]
+"""
+import argparse
+import itertools
+import time
+import tracemalloc
+import typing as t
+from collections import deque
+
+from lz.replication import replicate
+
+
+def replicate_with_queues(value: t.Iterable[t.Any],
+                          *,
+                          count: int) -> t.Iterable[t.Iterable[t.Any]]:
+    iterator = iter(value)
+    queues: t.List[t.Deque[t.Any]] = [deque() for _ in range(count)]
+
+    def replica(queue: t.Deque[t.Any]) -> t.Iterable[t.Any]:
+        while True:
+            if not queue:
+                try:
+                    element = next(iterator)
+                except StopIteration:
+                    return
+                for sub_queue, element_copy in zip(
+                        queues, replicate(element,
+                                          count=count)
+                ):
+                    sub_queue.append(element_copy)
+            yield queue.popleft()
+
+    return list(map(replica, queues))
+
+
+def consume(
+        replicator: t.Callable[..., t.Iterable[t.Iterable[t.Any]]],
+        *,
+        count: int,
+        size: int
+) -> None:
+    replicas = list(replicator(range(size),
+                               count=count))
+    # the first replica runs ahead of others to create maximum lag
+    for replica in replicas:
+        deque(replica, maxlen=0)
+
+
+def measure(
+        replicator: t.Callable[..., t.Iterable[t.Iterable[t.Any]]],
+        *,
+        count: int,
+        size: int
+) -> t.Tuple[float, int]:
+    start = time.perf_counter()
+    consume(replicator,
+            count=count,
+            size=size)
+    elapsed = time.perf_counter() - start
+    # memory is traced separately since tracing slows allocations down
+    tracemalloc.start()
+    consume(replicator,
+            count=count,
+            size=size)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size',
+                        type=int,
+                        default=100_000)
+    namespace = parser.parse_args()
+    for count, (name, replicator) in itertools.product(
+            (2, 8, 64), (('queues', replicate_with_queues),
+                         ('shared buffer', replicate))
+    ):
+        elapsed, peak = measure(replicator,
+                                count=count,
+                                size=namespace.size)
+        print(f'{name} with count={count}: '
+              f'{elapsed:.3f}s, peak memory {peak / 2 ** 20:.1f} MiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmarks reversal of byte streams by lines
+with default, single-byte and multi-byte separators
+for regular lines, a single line and only line breaks.
+
+Usage:
+
+    python -m benchmarks.reversal [--size SIZE] [--batch-size BATCH_SIZE]
+"""
+import argparse
+import io
+import time
+import typing as t
+from collections import deque
+
+from lz.reversal import reverse_bytes_stream
+
+LINE = 'Lorem ipsum dolor sit amet, consectetur adipiscing elit.'
+
+
+def measure(contents: bytes,
+            *,
+            batch_size: int,
+            lines_separator: t.Optional[bytes],
+            code_unit_size: int = 1) -> float:
+    start = time.perf_counter()
+    deque(reverse_bytes_stream(io.BytesIO(contents),
+                               batch_size=batch_size,
+                               lines_separator=lines_separator,
+                               code_unit_size=code_unit_size),
+          maxlen=0)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size',
+                        help='size of contents in bytes',
+                        type=int,
+                        default=10 * 2 ** 20)
+    parser.add_argument('--batch-size',
+                        type=int,
+                        default=io.DEFAULT_BUFFER_SIZE)
+    namespace = parser.parse_args()
+    size = namespace.size
+    lines_count = size // (len(LINE) + 1)
+    cases: t.List[t.Tuple[str, bytes, t.Optional[bytes], int]] = [
+        ('default', (LINE + '\n').encode() * lines_count, None, 1),
+        ('single-byte', (LINE + '\n').encode() * lines_count, b'\n', 1),
+        ('multi-byte', (LINE + '\r\n').encode() * lines_count, b'\r\n', 1),
+        ('UTF-16', (LINE + '\n').encode('utf_16_le') * (lines_count // 2),
+         '\n'.encode('utf_16_le'), 2),
+        ('default on single line', b'x' * size, None, 1),
+        ('single-byte on single line', b'x' * size, b'\n', 1),
+        ('multi-byte on single line', b'x' * size, b'\r\n', 1),
+        ('default on line breaks', b'\n' * size, None, 1),
+        ('single-byte on line breaks', b'\n' * size, b'\n', 1),
+        ('multi-byte on line breaks', b'\r\n' * (size // 2), b'\r\n', 1),
+    ]
+    for name, contents, lines_separator, code_unit_size in cases:
+        elapsed = measure(contents,
+                          batch_size=namespace.batch_size,
+                          lines_separator=lines_separator,
+                          code_unit_size=code_unit_size)
+        print(f'{name}: {elapsed:.3f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmarks signature queries of right appliers
+of functions with many optional parameters.
+
+Usage:
+
+    python -m benchmarks.right_applier_signature [--number NUMBER]
+"""
+import argparse
+import timeit
+
+from lz import right
+from lz._core.signatures import (to_eager_signature,
+                                 to_signature)
+
+
+def many_optionals(first: int,
+                   second: int = 0,
+                   third: int = 0,
+                   fourth: int = 0,
+                   fifth: int = 0,
+                   sixth: int = 0,
+                   seventh: int = 0,
+                   eighth: int = 0,
+                   ninth: int = 0,
+                   tenth: int = 0) -> int:
+    return (first + second + third + fourth + fifth
+            + sixth + seventh + eighth + ninth + tenth)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--number',
+                        type=int,
+                        default=10_000)
+    namespace = parser.parse_args()
+    for applied_count in (1, 3, 6):
+        applied = right.applier(many_optionals, *range(applied_count))
+        for name, to_applied_signature in (
+                ('eager', lambda: to_eager_signature(to_signature(applied))),
+                ('lazy', lambda: to_signature(applied)),
+        ):
+            elapsed = timeit.timeit(
+                    lambda: to_applied_signature().expects(1),
+                    number=namespace.number
+            )
+            print(f'{name} with {applied_count} applied: '
+                  f'{namespace.number / elapsed:,.0f} queries per second')
+
+
+if __name__ == '__main__':
+    main()
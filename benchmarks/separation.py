@@ -0,0 +1,54 @@
+"""
+Benchmarks separation of streams of dictionaries
+with replicating of elements for the predicate against pure predicate.
+
+Usage:
+
+    python -m benchmarks.separation [--size SIZE] [--keys-count COUNT]
+"""
+import argparse
+import time
+import typing as t
+from collections import deque
+
+from lz.filtration import separate
+
+
+def is_even_identified(record: t.Dict[str, int]) -> bool:
+    return record['id'] % 2 == 0
+
+
+def measure(records: t.List[t.Dict[str, int]],
+            **options: t.Any) -> float:
+    start = time.perf_counter()
+    for part in separate(is_even_identified, records,
+                         **options):
+        deque(part, maxlen=0)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size',
+                        type=int,
+                        default=100_000)
+    parser.add_argument('--keys-count',
+                        type=int,
+                        default=8)
+    namespace = parser.parse_args()
+    records = [{'id': index,
+                **{f'field_{key_index}': key_index
+                   for key_index in range(namespace.keys_count - 1)}}
+               for index in range(namespace.size)]
+    start = time.perf_counter()
+    for part in (filter(is_even_identified, records),
+                 filter(lambda record: not is_even_identified(record),
+                        records)):
+        deque(part, maxlen=0)
+    print(f'two filters: {time.perf_counter() - start:.3f}s')
+    print(f'replicating: {measure(records):.3f}s')
+    print(f'pure: {measure(records, pure=True):.3f}s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,15 @@
+import sys
+import types
+import typing as _t
+
+
+def to_numpy_module(value: _t.Any) -> _t.Optional[types.ModuleType]:
+    """
+    Returns NumPy module if given value is a NumPy array.
+    """
+    # arrays can not be created without NumPy being imported,
+    # so it is looked up instead of being imported to stay optional
+    numpy = sys.modules.get('numpy')
+    return (numpy
+            if numpy is not None and isinstance(value, numpy.ndarray)
+            else None)
@@ -4,6 +4,7 @@ import ast
 import functools
 import itertools
 import sys
+import threading
 import types
 import typing as _t
 from abc import (ABC,
@@ -16,7 +17,10 @@ from paradigm.base import (OverloadedSignature,
 from reprit import seekers
 from reprit.base import generate_repr
 
-from lz._core.signatures import (Signature,
+from lz._core.signatures import (BindingPlan,
+                                 LazySignature,
+                                 Signature,
+                                 to_eager_signature,
                                  to_signature)
 
 _Arg = _t.TypeVar('_Arg')
@@ -26,23 +30,42 @@ _T = _t.TypeVar('_T')
 
 MIN_COMPOSABLE_FUNCTIONS_COUNT = 2
 
+# guards publication of lazily compiled functions,
+# so concurrent first calls compile independently
+# but all of them end up using the same function
+_publication_lock = threading.Lock()
+
+_Function = _t.TypeVar('_Function',
+                       bound=_t.Callable[..., _t.Any])
+
+
+def _publish_function(instance: _t.Any, function: _Function) -> _Function:
+    with _publication_lock:
+        try:
+            return _t.cast(_Function, instance._function)
+        except AttributeError:
+            instance._function = function
+            return function
+
 
 @_te.final
 class Composition(_t.Generic[_Arg, _KwArg, _Result]):
     _file_path: str
     _function: _t.Callable[..., _Result]
     _functions: _t.Tuple[_t.Callable[..., _t.Any], ...]
+    _lazy: bool
     _line_number: int
     _line_offset: int
 
-    __slots__ = ('_file_path', '_function', '_functions', '_line_number',
-                 '_line_offset')
+    __slots__ = ('_file_path', '_function', '_functions', '_lazy',
+                 '_line_number', '_line_offset')
 
     def __new__(cls,
                 *functions: _t.Callable[..., _t.Any],
                 file_path: str = __file__,
                 line_number: int = 0,
-                line_offset: int = 0) -> Composition[_Arg, _KwArg, _Result]:
+                line_offset: int = 0,
+                lazy: bool = False) -> Composition[_Arg, _KwArg, _Result]:
         if len(functions) < MIN_COMPOSABLE_FUNCTIONS_COUNT:
             raise ValueError('Composition is defined '
                              f'for {MIN_COMPOSABLE_FUNCTIONS_COUNT} '
@@ -61,17 +84,19 @@ class Composition(_t.Generic[_Arg, _KwArg, _Result]):
         self._functions = tuple(itertools.chain.from_iterable(map(flatten,
                                                                   functions)))
         self._file_path = file_path
+        self._lazy = lazy
         self._line_number = line_number
         self._line_offset = line_offset
-        self._function = _compose(*functions,
-                                  function_name='composition',
-                                  file_path=file_path,
-                                  line_number=line_number,
-                                  line_offset=line_offset)
+        if not lazy:
+            self._to_function()
         return self
 
     def __call__(self, *args: _Arg, **kwargs: _KwArg) -> _Result:
-        return self._function(*args, **kwargs)
+        try:
+            function = self._function
+        except AttributeError:
+            function = self._to_function()
+        return function(*args, **kwargs)
 
     def __get__(self,
                 instance: _T,
@@ -83,7 +108,8 @@ class Composition(_t.Generic[_Arg, _KwArg, _Result]):
     ]:
         return self._functions, {'file_path': self._file_path,
                                  'line_number': self._line_number,
-                                 'line_offset': self._line_offset}
+                                 'line_offset': self._line_offset,
+                                 'lazy': self._lazy}
 
     def __getstate__(self) -> None:
         return None
@@ -94,44 +120,59 @@ class Composition(_t.Generic[_Arg, _KwArg, _Result]):
     __repr__ = generate_repr(__new__,
                              field_seeker=seekers.complex_)
 
+    def _to_function(self) -> _t.Callable[..., _Result]:
+        result = _compose(
+                *self._functions,
+                function_name='composition',
+                file_path=self._file_path,
+                line_number=self._line_number,
+                line_offset=self._line_offset
+        )
+        return _publish_function(self, result)
+
 
 @_te.final
 class Combination(_t.Generic[_Arg, _Result]):
     _file_path: str
     _function: _t.Callable[..., _t.Tuple[_Result, ...]]
+    _lazy: bool
     _line_number: int
     _line_offset: int
     _maps: _t.Tuple[_t.Callable[[_Arg], _Result], ...]
 
-    __slots__ = ('_file_path', '_function', '_line_number', '_line_offset',
-                 '_maps')
+    __slots__ = ('_file_path', '_function', '_lazy', '_line_number',
+                 '_line_offset', '_maps')
 
     def __new__(cls,
                 *_maps: _t.Callable[[_Arg], _Result],
                 file_path: str = __file__,
                 line_number: int = 0,
-                line_offset: int = 0) -> Combination[_Arg, _Result]:
+                line_offset: int = 0,
+                lazy: bool = False) -> Combination[_Arg, _Result]:
         self = super().__new__(cls)
         self._maps = _maps
         self._file_path = file_path
+        self._lazy = lazy
         self._line_number = line_number
         self._line_offset = line_offset
-        self._function = _combine(*_maps,
-                                  function_name='combination',
-                                  file_path=file_path,
-                                  line_number=line_number,
-                                  line_offset=line_offset)
+        if not lazy:
+            self._to_function()
         return self
 
     def __call__(self, *args: _Arg) -> _t.Tuple[_Result, ...]:
-        return self._function(*args)
+        try:
+            function = self._function
+        except AttributeError:
+            function = self._to_function()
+        return function(*args)
 
     def __getnewargs_ex__(self) -> _t.Tuple[
         _t.Tuple[_t.Any, ...], _t.Dict[str, _t.Any]
     ]:
         return self._maps, {'file_path': self._file_path,
                             'line_number': self._line_number,
-                            'line_offset': self._line_offset}
+                            'line_offset': self._line_offset,
+                            'lazy': self._lazy}
 
     def __getstate__(self) -> None:
         return None
@@ -142,6 +183,16 @@ class Combination(_t.Generic[_Arg, _Result]):
     __repr__ = generate_repr(__new__,
                              field_seeker=seekers.complex_)
 
+    def _to_function(self) -> _t.Callable[..., _t.Tuple[_Result, ...]]:
+        result = _combine(
+                *self._maps,
+                function_name='combination',
+                file_path=self._file_path,
+                line_number=self._line_number,
+                line_offset=self._line_offset
+        )
+        return _publish_function(self, result)
+
 
 class ApplierBase(ABC, _t.Generic[_Arg, _KwArg, _Result]):
     def __init__(self,
@@ -214,6 +265,43 @@ class Curry(ApplierBase[_Arg, _KwArg, _Result]):
                              field_seeker=seekers.complex_)
 
 
+@_te.final
+class PlannedCurry(ApplierBase[_Arg, _KwArg, _Result]):
+    def __init__(self,
+                 function: _t.Callable[..., _Result],
+                 _plan: BindingPlan,
+                 *args: _Arg,
+                 **kwargs: _KwArg) -> None:
+        super().__init__(function, *args, **kwargs)
+        self._plan = _plan
+
+    def __call__(
+            self, *args: _Arg, **kwargs: _KwArg
+    ) -> _t.Union[PlannedCurry[_Arg, _KwArg, _Result], _Result]:
+        total_args = self.args + args
+        total_kwargs = {**self.kwargs, **kwargs}
+        if self._plan.is_partial(len(total_args), total_kwargs.keys()):
+            return type(self)(self.function, self._plan, *total_args,
+                              **total_kwargs)
+        return self.function(*total_args, **total_kwargs)
+
+    def __getstate__(self) -> _t.Tuple[
+        _t.Callable[..., _Result], _t.Tuple[_Arg, ...], _t.Dict[str, _KwArg]
+    ]:
+        return self.function, self.args, self.kwargs
+
+    def __setstate__(self,
+                     state: _t.Tuple[
+                         _t.Callable[..., _Result], _t.Tuple[_Arg, ...],
+                         _t.Dict[str, _KwArg]
+                     ]) -> None:
+        self._function, self._args, self._kwargs = state
+        self._plan = BindingPlan(to_signature(self._function))
+
+    __repr__ = generate_repr(__init__,
+                             field_seeker=seekers.complex_)
+
+
 @_te.final
 class Constant(_t.Generic[_T]):
     def __init__(self, _value: _T) -> None:
@@ -233,40 +321,45 @@ if sys.version_info < (3, 10):
         _file_path: str
         _function: _t.Callable[..., _t.Tuple[_Result, ...]]
         _functions: _t.Tuple[_t.Callable[..., _Result], ...]
+        _lazy: bool
         _line_number: int
         _line_offset: int
 
-        __slots__ = ('_file_path', '_function', '_functions', '_line_number',
-                     '_line_offset')
+        __slots__ = ('_file_path', '_function', '_functions', '_lazy',
+                     '_line_number', '_line_offset')
 
         def __new__(cls,
                     *functions: _t.Callable[_Params, _Result],
                     file_path: str = __file__,
                     line_number: int = 0,
-                    line_offset: int = 0) -> _te.Self:
+                    line_offset: int = 0,
+                    lazy: bool = False) -> _te.Self:
             self = super().__new__(cls)
             self._functions = functions
             self._file_path = file_path
+            self._lazy = lazy
             self._line_number = line_number
             self._line_offset = line_offset
-            self._function = _cleave(*functions,
-                                     function_name='cleavage',
-                                     file_path=file_path,
-                                     line_number=line_number,
-                                     line_offset=line_offset)
+            if not lazy:
+                self._to_function()
             return self
 
         def __call__(self,
                      *args: _Params.args,
                      **kwargs: _Params.kwargs) -> _t.Tuple[_Result, ...]:
-            return self._function(*args, **kwargs)
+            try:
+                function = self._function
+            except AttributeError:
+                function = self._to_function()
+            return function(*args, **kwargs)
 
         def __getnewargs_ex__(self) -> _t.Tuple[
             _t.Tuple[_t.Any, ...], _t.Dict[str, _t.Any]
         ]:
             return self._functions, {'file_path': self._file_path,
                                      'line_number': self._line_number,
-                                     'line_offset': self._line_offset}
+                                     'line_offset': self._line_offset,
+                                     'lazy': self._lazy}
 
         def __getstate__(self) -> None:
             return None
@@ -276,46 +369,61 @@ if sys.version_info < (3, 10):
 
         __repr__ = generate_repr(__new__,
                                  field_seeker=seekers.complex_)
+
+        def _to_function(self) -> _t.Callable[..., _t.Tuple[_Result, ...]]:
+            result = _cleave(
+                    *self._functions,
+                    function_name='cleavage',
+                    file_path=self._file_path,
+                    line_number=self._line_number,
+                    line_offset=self._line_offset
+            )
+            return _publish_function(self, result)
 else:
     @_te.final
     class Cleavage(_t.Generic[_Params, _Result]):
         _file_path: str
         _function: _t.Callable[_Params, _t.Tuple[_Result, ...]]
         _functions: _t.Tuple[_t.Callable[_Params, _Result], ...]
+        _lazy: bool
         _line_number: int
         _line_offset: int
 
-        __slots__ = ('_file_path', '_function', '_functions', '_line_number',
-                     '_line_offset')
+        __slots__ = ('_file_path', '_function', '_functions', '_lazy',
+                     '_line_number', '_line_offset')
 
         def __new__(cls,
                     *functions: _t.Callable[_Params, _Result],
                     file_path: str = __file__,
                     line_number: int = 0,
-                    line_offset: int = 0) -> _te.Self:
+                    line_offset: int = 0,
+                    lazy: bool = False) -> _te.Self:
             self = super().__new__(cls)
             self._functions = functions
             self._file_path = file_path
+            self._lazy = lazy
             self._line_number = line_number
             self._line_offset = line_offset
-            self._function = _cleave(*functions,
-                                     function_name='cleavage',
-                                     file_path=file_path,
-                                     line_number=line_number,
-                                     line_offset=line_offset)
+            if not lazy:
+                self._to_function()
             return self
 
         def __call__(self,
                      *args: _Params.args,
                      **kwargs: _Params.kwargs) -> _t.Tuple[_Result, ...]:
-            return self._function(*args, **kwargs)
+            try:
+                function = self._function
+            except AttributeError:
+                function = self._to_function()
+            return function(*args, **kwargs)
 
         def __getnewargs_ex__(self) -> _t.Tuple[
             _t.Tuple[_t.Any, ...], _t.Dict[str, _t.Any]
         ]:
             return self._functions, {'file_path': self._file_path,
                                      'line_number': self._line_number,
-                                     'line_offset': self._line_offset}
+                                     'line_offset': self._line_offset,
+                                     'lazy': self._lazy}
 
         def __getstate__(self) -> None:
             return None
@@ -326,6 +434,16 @@ else:
         __repr__ = generate_repr(__new__,
                                  field_seeker=seekers.complex_)
 
+        def _to_function(self) -> _t.Callable[_Params, _t.Tuple[_Result, ...]]:
+            result = _cleave(
+                    *self._functions,
+                    function_name='cleavage',
+                    file_path=self._file_path,
+                    line_number=self._line_number,
+                    line_offset=self._line_offset
+            )
+            return _publish_function(self, result)
+
 
 @_te.final
 class Flip(_t.Generic[_Result]):
@@ -378,13 +496,15 @@ class Flip(_t.Generic[_Result]):
                                   cls.from_function(_function._functions[-1]),
                                   file_path=_function._file_path,
                                   line_number=_function._line_number,
-                                  line_offset=_function._line_offset)
+                                  line_offset=_function._line_offset,
+                                  lazy=True)
                       if isinstance(_function, Composition)
                       else (Cleavage(*[cls.from_function(function)
                                        for function in _function._functions],
                                      file_path=_function._file_path,
                                      line_number=_function._line_number,
-                                     line_offset=_function._line_offset)
+                                     line_offset=_function._line_offset,
+                                     lazy=True)
                             if isinstance(_function, Cleavage)
                             else (_function
                                   if isinstance(_function, Constant)
@@ -415,15 +535,92 @@ def _cleave(
         function_name: str,
         file_path: str,
         line_number: int,
-        line_offset: int,
-        args_name: str = 'args',
-        kwargs_name: str = 'kwargs'
+        line_offset: int
 ) -> _t.Callable[_Params, _t.Tuple[_Result, ...]]:
-    functions_names = [_function_to_unique_name(function)
-                       for function in functions]
+    return _bind_function(_to_function_code(_to_cleavage_node,
+                                            len(functions),
+                                            function_name=function_name,
+                                            file_path=file_path,
+                                            line_number=line_number,
+                                            line_offset=line_offset),
+                          functions,
+                          function_name=function_name)
+
+
+def _combine(*maps: _t.Callable[[_T], _Result],
+             function_name: str,
+             file_path: str,
+             line_number: int,
+             line_offset: int) -> _t.Callable[..., _t.Tuple[_Result, ...]]:
+    return _bind_function(_to_function_code(_to_combination_node,
+                                            len(maps),
+                                            function_name=function_name,
+                                            file_path=file_path,
+                                            line_number=line_number,
+                                            line_offset=line_offset),
+                          maps,
+                          function_name=function_name)
+
+
+def _compose(*functions: _t.Callable[..., _t.Any],
+             function_name: str,
+             file_path: str,
+             line_number: int,
+             line_offset: int) -> _t.Callable[..., _Result]:
+    return _bind_function(_to_function_code(_to_composition_node,
+                                            len(functions),
+                                            function_name=function_name,
+                                            file_path=file_path,
+                                            line_number=line_number,
+                                            line_offset=line_offset),
+                          functions,
+                          function_name=function_name)
+
+
+def _bind_function(code: types.CodeType,
+                   functions: _t.Sequence[_t.Callable[..., _t.Any]],
+                   *,
+                   function_name: str) -> _t.Callable[..., _t.Any]:
+    namespace = {_to_function_name(index): function
+                 for index, function in enumerate(functions)}
+    return types.FunctionType(code, namespace, function_name)
+
+
+CODE_CACHE_MAX_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=CODE_CACHE_MAX_SIZE)
+def _to_function_code(
+        node_factory: _t.Callable[..., ast.FunctionDef],
+        functions_count: int,
+        *,
+        function_name: str,
+        file_path: str,
+        line_number: int,
+        line_offset: int
+) -> types.CodeType:
+    # generated code depends only on the shape of the function
+    # and its location, so it can be shared between functions
+    # which differ only in callables bound to them
+    function_definition_node = node_factory(functions_count,
+                                            function_name=function_name,
+                                            line_number=line_number,
+                                            line_offset=line_offset)
+    return _compile_function(function_definition_node,
+                             file_path=file_path,
+                             namespace={}).__code__
+
+
+def _to_cleavage_node(functions_count: int,
+                      *,
+                      function_name: str,
+                      line_number: int,
+                      line_offset: int,
+                      args_name: str = 'args',
+                      kwargs_name: str = 'kwargs') -> ast.FunctionDef:
     result_node = ast.Tuple(
             [
-                ast.Call(ast.Name(function_name, ast.Load(),
+                ast.Call(ast.Name(_to_function_name(index), ast.Load(),
                                   lineno=line_number,
                                   col_offset=line_offset),
                          [ast.Starred(ast.Name(args_name, ast.Load(),
@@ -439,13 +636,13 @@ def _cleave(
                                       col_offset=line_offset)],
                          lineno=line_number,
                          col_offset=line_offset)
-                for function_name in functions_names
+                for index in range(functions_count)
             ],
             ast.Load(),
             lineno=line_number,
             col_offset=line_offset
     )
-    function_definition_node = ast.FunctionDef(
+    return ast.FunctionDef(
             function_name,
             _to_signature_node(
                     variadic_positional_parameter=ast.arg(
@@ -464,19 +661,16 @@ def _cleave(
             lineno=line_number,
             col_offset=line_offset
     )
-    return _compile_function(function_definition_node,
-                             file_path=file_path,
-                             namespace=dict(zip(functions_names, functions)))
 
 
-def _combine(*maps: _t.Callable[[_T], _Result],
-             function_name: str,
-             file_path: str,
-             line_number: int,
-             line_offset: int) -> _t.Callable[..., _t.Tuple[_Result, ...]]:
-    maps_names = [_function_to_unique_name(map_) for map_ in maps]
-    args_names = [f'_arg{index}' for index in range(len(maps))]
-    function_definition_node = ast.FunctionDef(
+def _to_combination_node(maps_count: int,
+                         *,
+                         function_name: str,
+                         line_number: int,
+                         line_offset: int) -> ast.FunctionDef:
+    maps_names = [_to_function_name(index) for index in range(maps_count)]
+    args_names = [f'_arg{index}' for index in range(maps_count)]
+    return ast.FunctionDef(
             function_name,
             _to_signature_node([ast.arg(arg_name, None,
                                         lineno=line_number,
@@ -502,21 +696,15 @@ def _combine(*maps: _t.Callable[[_T], _Result],
             lineno=line_number,
             col_offset=line_offset
     )
-    return _compile_function(function_definition_node,
-                             file_path=file_path,
-                             namespace=dict(zip(maps_names, maps)))
-
 
-def _compose(*functions: _t.Callable[..., _t.Any],
-             function_name: str,
-             file_path: str,
-             line_number: int,
-             line_offset: int,
-             args_name: str = 'args',
-             kwargs_name: str = 'kwargs') -> _t.Callable[..., _Result]:
-    functions_names = [_function_to_unique_name(function)
-                       for function in functions]
 
+def _to_composition_node(functions_count: int,
+                         *,
+                         function_name: str,
+                         line_number: int,
+                         line_offset: int,
+                         args_name: str = 'args',
+                         kwargs_name: str = 'kwargs') -> ast.FunctionDef:
     def to_next_call_node(node: ast.Call, name: str) -> ast.Call:
         return ast.Call(to_name_node(name), [node], [],
                         lineno=line_number,
@@ -530,7 +718,8 @@ def _compose(*functions: _t.Callable[..., _t.Any],
                         lineno=line_number,
                         col_offset=line_offset)
 
-    reversed_functions_names = reversed(functions_names)
+    reversed_functions_names = map(_to_function_name,
+                                   reversed(range(functions_count)))
     calls_node = ast.Call(to_name_node(next(reversed_functions_names)),
                           [ast.Starred(to_name_node(args_name), ast.Load(),
                                        lineno=line_number,
@@ -543,7 +732,7 @@ def _compose(*functions: _t.Callable[..., _t.Any],
     calls_node = functools.reduce(to_next_call_node,
                                   reversed_functions_names,
                                   calls_node)
-    function_definition_node = ast.FunctionDef(
+    return ast.FunctionDef(
             function_name,
             _to_signature_node(
                     variadic_positional_parameter=ast.arg(
@@ -563,9 +752,6 @@ def _compose(*functions: _t.Callable[..., _t.Any],
             lineno=line_number,
             col_offset=line_offset
     )
-    return _compile_function(function_definition_node,
-                             file_path=file_path,
-                             namespace=dict(zip(functions_names, functions)))
 
 
 def _compile_function(
@@ -629,20 +815,21 @@ else:
                              positionals_defaults or [])
 
 
-def _function_to_unique_name(function: _t.Callable[..., _t.Any]) -> str:
+def _to_function_name(index: int) -> str:
     # we are not using `__name__`/`__qualname__` attributes
-    # due to their potential non-uniqueness
-    return '_' + str(id(function)).replace('-', '_')
+    # due to their potential non-uniqueness,
+    # positional names also allow sharing generated code
+    return f'_function{index}'
 
 
 @to_signature.register(Combination)
 def _(_value: Combination[_Arg, _Result]) -> Signature:
-    return to_signature(_value._function)
+    return to_signature(_value._to_function())
 
 
 @to_signature.register(Composition)
 def _(_value: Composition[_Arg, _KwArg, _Result]) -> Signature:
-    last_signature = to_signature(_value._functions[0])
+    last_signature = to_eager_signature(to_signature(_value._functions[0]))
     returns = (_t.Union[tuple(signature.returns
                               for signature in last_signature.signatures
                               if signature.expects(None))]
@@ -666,6 +853,11 @@ def _replace_returns(signature: Signature, returns: _t.Any) -> Signature:
     raise TypeError(type(signature))
 
 
+@_replace_returns.register(LazySignature)
+def _(signature: LazySignature, returns: _t.Any) -> Signature:
+    return _replace_returns(signature.materialize(), returns)
+
+
 @_replace_returns.register(OverloadedSignature)
 def _(signature: OverloadedSignature, returns: _t.Any) -> OverloadedSignature:
     return OverloadedSignature(
@@ -691,6 +883,11 @@ def _(_value: Curry[_Arg, _KwArg, _Result]) -> Signature:
     return _value._signature
 
 
+@to_signature.register(PlannedCurry)
+def _(_value: PlannedCurry[_Arg, _KwArg, _Result]) -> Signature:
+    return _value._plan.signature
+
+
 @to_signature.register(Flip)
 def _(_value: Flip[_Result]) -> Signature:
     return to_signature(_value._function)
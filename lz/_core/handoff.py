@@ -0,0 +1,148 @@
+import threading
+import typing as _t
+from collections import deque
+
+import typing_extensions as _te
+
+_T = _t.TypeVar('_T')
+Distribute = _t.Callable[[_T, _t.Sequence[int]],
+                         _t.Iterable[_t.Tuple[int, _t.Any]]]
+
+
+@_te.final
+class BlockingFanOut(_t.Generic[_T]):
+    """
+    Thread-safe distributor of iterator elements
+    over given number of streams with bounded queues.
+
+    Element is pulled from the iterator by the stream which needs it
+    and is distributed to queues of still open streams,
+    if some of them have maximum number of buffered elements
+    the stream waits until they are consumed.
+    If distribution of an element fails
+    the error is raised by the stream which pulled the element
+    and then by every stream which needs further elements.
+    """
+
+    __slots__ = ('_condition', '_distribute', '_error', '_exhausted',
+                 '_iterator', '_max_buffered', '_queues')
+
+    def __init__(self,
+                 iterator: _t.Iterator[_T],
+                 distribute: Distribute[_T],
+                 *,
+                 count: int,
+                 max_buffered: _t.Optional[int] = None) -> None:
+        if max_buffered is not None and max_buffered < 1:
+            raise ValueError('Maximum number of buffered elements '
+                             'should be positive for thread-safe streams, '
+                             f'but found {max_buffered}.')
+        self._distribute, self._iterator, self._max_buffered = (
+            distribute, iterator, max_buffered
+        )
+        self._condition = threading.Condition()
+        self._error: _t.Optional[Exception] = None
+        self._exhausted = False
+        self._queues: _t.List[_t.Optional[_t.Deque[_t.Any]]] = [
+            deque() for _ in range(count)
+        ]
+
+    def stream(self, index: int) -> _t.Iterator[_t.Any]:
+        queue = self._queues[index]
+        assert queue is not None, f'Stream #{index} is already closed.'
+        return FanOutStream(self, index, queue)
+
+    def _next(self, queue: _t.Deque[_t.Any]) -> _t.Any:
+        condition = self._condition
+        with condition:
+            while not queue:
+                if self._error is not None:
+                    raise self._error
+                elif self._exhausted:
+                    raise StopIteration
+                elif self._has_room():
+                    self._pull()
+                else:
+                    condition.wait()
+            result = queue.popleft()
+            if self._max_buffered is not None:
+                condition.notify_all()
+            return result
+
+    def _release(self, index: int) -> None:
+        # closed stream should not hold back the rest
+        with self._condition:
+            queue = self._queues[index]
+            if queue is not None:
+                self._queues[index] = None
+                queue.clear()
+                self._condition.notify_all()
+
+    def _has_room(self) -> bool:
+        max_buffered = self._max_buffered
+        return max_buffered is None or all(queue is None
+                                           or len(queue) < max_buffered
+                                           for queue in self._queues)
+
+    def _pull(self) -> None:
+        try:
+            element = next(self._iterator)
+        except StopIteration:
+            self._exhausted = True
+            self._condition.notify_all()
+            return
+        queues = self._queues
+        try:
+            distribution = list(self._distribute(
+                    element, [index
+                              for index, queue in enumerate(queues)
+                              if queue is not None]
+            ))
+        except Exception as error:
+            # element is dropped, so streams can not proceed
+            self._error = error
+            self._condition.notify_all()
+            raise
+        for index, value in distribution:
+            queue = queues[index]
+            if queue is not None:
+                queue.append(value)
+
+
+@_te.final
+class FanOutStream(_t.Iterator[_t.Any]):
+    """
+    Stream of a fan-out which releases its queue
+    once it is exhausted, fails, is closed or is garbage collected,
+    even if it has never been started.
+    """
+
+    __slots__ = '_fan_out', '_index', '_queue'
+
+    def __init__(self,
+                 fan_out: BlockingFanOut[_t.Any],
+                 index: int,
+                 queue: _t.Deque[_t.Any]) -> None:
+        self._fan_out, self._index = fan_out, index
+        self._queue: _t.Optional[_t.Deque[_t.Any]] = queue
+
+    def __del__(self) -> None:
+        self.close()
+
+    def __iter__(self) -> 'FanOutStream':
+        return self
+
+    def __next__(self) -> _t.Any:
+        queue = self._queue
+        if queue is None:
+            raise StopIteration
+        try:
+            return self._fan_out._next(queue)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self._queue is not None:
+            self._queue = None
+            self._fan_out._release(self._index)
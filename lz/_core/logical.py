@@ -0,0 +1,485 @@
+from __future__ import annotations
+
+import ast
+import functools
+import math
+import threading
+import time
+import typing as _t
+from abc import ABC
+from itertools import chain
+
+import typing_extensions as _te
+from reprit import seekers
+from reprit.base import generate_repr
+
+from lz._core.functional import (_bind_function,
+                                 _replace_returns,
+                                 _to_function_code,
+                                 _to_function_name,
+                                 _to_signature_node)
+from lz._core.signatures import (Signature,
+                                 to_signature)
+
+_Predicate = _t.Callable[..., bool]
+
+
+class _Location(_te.TypedDict):
+    lineno: int
+    col_offset: int
+
+
+class Junction(ABC):
+    _file_path: str
+    _function: _Predicate
+    _function_name: _t.ClassVar[str]
+    _line_number: int
+    _line_offset: int
+    _negated: bool
+    _node_factories: _t.ClassVar[
+        _t.Tuple[_t.Callable[..., ast.FunctionDef],
+                 _t.Callable[..., ast.FunctionDef]]
+    ]
+    _predicates: _t.Tuple[_Predicate, ...]
+
+    __slots__ = ('_file_path', '_function', '_line_number', '_line_offset',
+                 '_negated', '_predicates')
+
+    @classmethod
+    def from_predicates(cls,
+                        *predicates: _Predicate,
+                        file_path: str = __file__,
+                        line_number: int = 0,
+                        line_offset: int = 0) -> _te.Self:
+        # nested non-negated junctions of the same kind are inlined,
+        # so the result is compiled into a single function
+        inlined_predicates = chain.from_iterable(
+                predicate._predicates
+                if type(predicate) is cls and not predicate._negated
+                else (predicate,)
+                for predicate in predicates
+        )
+        return cls(*inlined_predicates,
+                   file_path=file_path,
+                   line_number=line_number,
+                   line_offset=line_offset)
+
+    def __new__(cls,
+                *predicates: _Predicate,
+                file_path: str = __file__,
+                line_number: int = 0,
+                line_offset: int = 0,
+                negated: bool = False) -> _te.Self:
+        self = super().__new__(cls)
+        self._negated, self._predicates = negated, predicates
+        self._file_path, self._line_number, self._line_offset = (
+            file_path, line_number, line_offset
+        )
+        self._function = _bind_function(
+                _to_function_code(cls._node_factories[negated],
+                                  len(predicates),
+                                  function_name=cls._function_name,
+                                  file_path=file_path,
+                                  line_number=line_number,
+                                  line_offset=line_offset),
+                predicates,
+                function_name=cls._function_name
+        )
+        return self
+
+    def __call__(self, *args: _t.Any, **kwargs: _t.Any) -> bool:
+        return self._function(*args, **kwargs)
+
+    def __getnewargs_ex__(self) -> _t.Tuple[
+        _t.Tuple[_t.Any, ...], _t.Dict[str, _t.Any]
+    ]:
+        return self._predicates, {'file_path': self._file_path,
+                                  'line_number': self._line_number,
+                                  'line_offset': self._line_offset,
+                                  'negated': self._negated}
+
+    def __getstate__(self) -> None:
+        return None
+
+    def __setstate__(self, _state: None) -> None:
+        pass
+
+    __repr__ = generate_repr(__new__,
+                             field_seeker=seekers.complex_)
+
+    def negate(self) -> _te.Self:
+        return type(self)(*self._predicates,
+                          file_path=self._file_path,
+                          line_number=self._line_number,
+                          line_offset=self._line_offset,
+                          negated=not self._negated)
+
+
+def _to_short_circuit_node(predicates_count: int,
+                           *,
+                           function_name: str,
+                           line_number: int,
+                           line_offset: int,
+                           negated: bool,
+                           stop_on: bool,
+                           args_name: str = 'args',
+                           kwargs_name: str = 'kwargs') -> ast.FunctionDef:
+    # predicates are called in order
+    # until one of them returns value with truthiness of `stop_on`
+    location = _Location(lineno=line_number,
+                         col_offset=line_offset)
+    stop_result = stop_on is not negated
+    calls_nodes = [_to_predicate_call_node(index,
+                                           args_name=args_name,
+                                           kwargs_name=kwargs_name,
+                                           location=location)
+                   for index in range(predicates_count)]
+    return ast.FunctionDef(
+            function_name,
+            _to_signature_node(
+                    variadic_positional_parameter=ast.arg(args_name, None,
+                                                          **location),
+                    variadic_keyword_parameter=ast.arg(kwargs_name, None,
+                                                       **location)
+            ),
+            [
+                *[ast.If(_to_condition_node(call_node,
+                                            negated=not stop_on,
+                                            location=location),
+                         [ast.Return(ast.Constant(stop_result, **location),
+                                     **location)],
+                         [],
+                         **location)
+                  for call_node in calls_nodes],
+                ast.Return(ast.Constant(not stop_result, **location),
+                           **location)
+            ],
+            [], None,
+            **location
+    )
+
+
+def _to_parity_node(predicates_count: int,
+                    *,
+                    function_name: str,
+                    line_number: int,
+                    line_offset: int,
+                    negated: bool,
+                    args_name: str = 'args',
+                    kwargs_name: str = 'kwargs') -> ast.FunctionDef:
+    location = _Location(lineno=line_number,
+                         col_offset=line_offset)
+    result_node: ast.expr = ast.Constant(False, **location)
+    for index in range(predicates_count):
+        # double negation coerces result of the predicate to boolean
+        call_node = _to_predicate_call_node(index,
+                                            args_name=args_name,
+                                            kwargs_name=kwargs_name,
+                                            location=location)
+        result_node = ast.BinOp(
+                result_node, ast.BitXor(),
+                ast.UnaryOp(ast.Not(), ast.UnaryOp(ast.Not(), call_node,
+                                                   **location),
+                            **location),
+                **location
+        )
+    return ast.FunctionDef(
+            function_name,
+            _to_signature_node(
+                    variadic_positional_parameter=ast.arg(args_name, None,
+                                                          **location),
+                    variadic_keyword_parameter=ast.arg(kwargs_name, None,
+                                                       **location)
+            ),
+            [ast.Return(_to_condition_node(result_node,
+                                           negated=negated,
+                                           location=location),
+                        **location)],
+            [], None,
+            **location
+    )
+
+
+def _to_condition_node(node: ast.expr,
+                       *,
+                       negated: bool,
+                       location: _Location) -> ast.expr:
+    return ast.UnaryOp(ast.Not(), node, **location) if negated else node
+
+
+def _to_predicate_call_node(index: int,
+                            *,
+                            args_name: str,
+                            kwargs_name: str,
+                            location: _Location) -> ast.Call:
+    return ast.Call(ast.Name(_to_function_name(index), ast.Load(),
+                             **location),
+                    [ast.Starred(ast.Name(args_name, ast.Load(), **location),
+                                 ast.Load(),
+                                 **location)],
+                    [ast.keyword(None, ast.Name(kwargs_name, ast.Load(),
+                                                **location),
+                                 **location)],
+                    **location)
+
+
+@_te.final
+class Conjunction(Junction):
+    __slots__ = ()
+
+    _function_name = 'conjunction'
+    _node_factories = (
+        functools.partial(_to_short_circuit_node,
+                          negated=False,
+                          stop_on=False),
+        functools.partial(_to_short_circuit_node,
+                          negated=True,
+                          stop_on=False)
+    )
+
+
+@_te.final
+class Disjunction(Junction):
+    __slots__ = ()
+
+    _function_name = 'disjunction'
+    _node_factories = (
+        functools.partial(_to_short_circuit_node,
+                          negated=False,
+                          stop_on=True),
+        functools.partial(_to_short_circuit_node,
+                          negated=True,
+                          stop_on=True)
+    )
+
+
+@_te.final
+class ExclusiveDisjunction(Junction):
+    __slots__ = ()
+
+    _function_name = 'exclusive_disjunction'
+    _node_factories = (functools.partial(_to_parity_node,
+                                         negated=False),
+                       functools.partial(_to_parity_node,
+                                         negated=True))
+
+
+@_te.final
+class PredicateStatistics:
+    """
+    Runtime statistics of a predicate gathered by an adaptive junction.
+    """
+
+    __slots__ = '_calls_count', '_predicate', '_stops_count', '_total_time'
+
+    def __init__(self,
+                 predicate: _Predicate,
+                 calls_count: int = 0,
+                 stops_count: int = 0,
+                 total_time: float = 0.) -> None:
+        self._predicate = predicate
+        self._calls_count, self._stops_count, self._total_time = (
+            calls_count, stops_count, total_time
+        )
+
+    @property
+    def calls_count(self) -> int:
+        """Number of sampled calls of the predicate."""
+        return self._calls_count
+
+    @property
+    def mean_time(self) -> float:
+        """Mean duration of a sampled call of the predicate in seconds."""
+        return (self._total_time / self._calls_count
+                if self._calls_count
+                else 0.)
+
+    @property
+    def predicate(self) -> _Predicate:
+        return self._predicate
+
+    @property
+    def stop_rate(self) -> float:
+        """Fraction of sampled calls which decided the result."""
+        return (self._stops_count / self._calls_count
+                if self._calls_count
+                else 0.)
+
+    @property
+    def stops_count(self) -> int:
+        """Number of sampled calls which decided the result."""
+        return self._stops_count
+
+    @property
+    def total_time(self) -> float:
+        """Total duration of sampled calls of the predicate in seconds."""
+        return self._total_time
+
+    __repr__ = generate_repr(__init__,
+                             field_seeker=seekers.complex_)
+
+    def _rank(self) -> float:
+        # expected cost of reaching the decision with the predicate,
+        # not yet sampled predicates are ranked first to get sampled
+        return (0.
+                if not self._calls_count
+                else (self.mean_time / self.stop_rate
+                      if self._stops_count
+                      else math.inf))
+
+    def _register(self, time: float, stopped: bool) -> None:
+        self._calls_count += 1
+        self._stops_count += stopped
+        self._total_time += time
+
+
+class AdaptiveJunction(ABC):
+    _calls_count: int
+    _junction: Junction
+    _junction_cls: _t.ClassVar[_t.Type[Junction]]
+    _reordering_lock: threading.Lock
+    _reordering_period: int
+    _samples_count: int
+    _sampling_period: int
+    _statistics: _t.Tuple[PredicateStatistics, ...]
+    _stop_on: _t.ClassVar[bool]
+
+    __slots__ = ('_calls_count', '_junction', '_reordering_period',
+                 '_reordering_lock', '_samples_count', '_sampling_period',
+                 '_statistics')
+
+    def __new__(cls,
+                *predicates: _Predicate,
+                file_path: str = __file__,
+                line_number: int = 0,
+                line_offset: int = 0,
+                sampling_period: int = 16,
+                reordering_period: int = 64) -> _te.Self:
+        if sampling_period < 1:
+            raise ValueError('Sampling period should be positive, '
+                             f'but found {sampling_period}.')
+        if reordering_period < 1:
+            raise ValueError('Reordering period should be positive, '
+                             f'but found {reordering_period}.')
+        self = super().__new__(cls)
+        self._sampling_period, self._reordering_period = (sampling_period,
+                                                          reordering_period)
+        self._calls_count = self._samples_count = 0
+        self._reordering_lock = threading.Lock()
+        self._statistics = tuple(map(PredicateStatistics, predicates))
+        self._junction = cls._junction_cls(*predicates,
+                                           file_path=file_path,
+                                           line_number=line_number,
+                                           line_offset=line_offset)
+        return self
+
+    @property
+    def _file_path(self) -> str:
+        return self._junction._file_path
+
+    @property
+    def _line_number(self) -> int:
+        return self._junction._line_number
+
+    @property
+    def _line_offset(self) -> int:
+        return self._junction._line_offset
+
+    @property
+    def _predicates(self) -> _t.Tuple[_Predicate, ...]:
+        return self._junction._predicates
+
+    @property
+    def statistics(self) -> _t.Sequence[PredicateStatistics]:
+        """Statistics of predicates in their current evaluation order."""
+        return self._statistics
+
+    def __call__(self, *args: _t.Any, **kwargs: _t.Any) -> bool:
+        # counters are updated without synchronization,
+        # so under contention they are approximate which is fine
+        # for deciding when to sample
+        self._calls_count += 1
+        return (self._junction(*args, **kwargs)
+                if self._calls_count % self._sampling_period
+                else self._sample(args, kwargs))
+
+    def __getnewargs_ex__(self) -> _t.Tuple[
+        _t.Tuple[_t.Any, ...], _t.Dict[str, _t.Any]
+    ]:
+        return self._predicates, {
+            'file_path': self._file_path,
+            'line_number': self._line_number,
+            'line_offset': self._line_offset,
+            'sampling_period': self._sampling_period,
+            'reordering_period': self._reordering_period
+        }
+
+    def __getstate__(self) -> None:
+        return None
+
+    def __setstate__(self, _state: None) -> None:
+        pass
+
+    __repr__ = generate_repr(__new__,
+                             field_seeker=seekers.complex_)
+
+    def _reorder(self) -> None:
+        with self._reordering_lock:
+            statistics = tuple(sorted(self._statistics,
+                                      key=PredicateStatistics._rank))
+            if statistics != self._statistics:
+                junction = self._junction_cls(
+                        *[predicate_statistics.predicate
+                          for predicate_statistics in statistics],
+                        file_path=self._file_path,
+                        line_number=self._line_number,
+                        line_offset=self._line_offset
+                )
+                self._statistics, self._junction = statistics, junction
+
+    def _sample(self,
+                args: _t.Tuple[_t.Any, ...],
+                kwargs: _t.Dict[str, _t.Any]) -> bool:
+        stop_on = self._stop_on
+        result = not stop_on
+        for predicate_statistics in self._statistics:
+            start = time.perf_counter()
+            stopped = (bool(predicate_statistics.predicate(*args, **kwargs))
+                       is stop_on)
+            predicate_statistics._register(time.perf_counter() - start,
+                                           stopped)
+            if stopped:
+                result = stop_on
+                break
+        self._samples_count += 1
+        if not self._samples_count % self._reordering_period:
+            self._reorder()
+        return result
+
+
+@_te.final
+class AdaptiveConjunction(AdaptiveJunction):
+    __slots__ = ()
+
+    _junction_cls = Conjunction
+    _stop_on = False
+
+
+@_te.final
+class AdaptiveDisjunction(AdaptiveJunction):
+    __slots__ = ()
+
+    _junction_cls = Disjunction
+    _stop_on = True
+
+
+@to_signature.register(Junction)
+def _(_value: Junction) -> Signature:
+    return (_replace_returns(to_signature(_value._predicates[0]), bool)
+            if _value._predicates
+            else to_signature(_value._function))
+
+
+@to_signature.register(AdaptiveJunction)
+def _(_value: AdaptiveJunction) -> Signature:
+    return to_signature(_value._junction)
@@ -0,0 +1,126 @@
+import pickle
+import typing as _t
+from collections import deque
+
+import typing_extensions as _te
+
+from .spilling import (Serializer,
+                       SpillingQueue)
+
+_Key = _t.TypeVar('_Key', bound=_t.Hashable)
+_T = _t.TypeVar('_T')
+_Queue = _t.Union[_t.Deque[_T], SpillingQueue[_T]]
+
+
+@_te.final
+class Partition(_t.Mapping[_Key, _t.Iterator[_T]]):
+    """
+    Mapping from keys to lazy streams of elements with such keys.
+
+    Elements are pulled from the iterator by streams which need them
+    and are buffered for other streams,
+    unless keys are given they are discovered on the fly,
+    so looking up, iterating over & measuring the partition
+    pulls elements until corresponding keys are found.
+
+    Key of an element is computed when the element is pulled,
+    so if it is not among given keys the error is raised there
+    and is raised again by every further pull.
+    """
+
+    __slots__ = ('_discover', '_error', '_exhausted', '_iterator', '_key',
+                 '_keys', '_max_buffered', '_queues', '_serializer',
+                 '_streams')
+
+    def __init__(self,
+                 key: _t.Callable[[_T], _Key],
+                 iterator: _t.Iterator[_T],
+                 *,
+                 keys: _t.Optional[_t.Iterable[_Key]] = None,
+                 max_buffered: _t.Optional[int] = None,
+                 serializer: Serializer = pickle) -> None:
+        if max_buffered is not None and max_buffered < 0:
+            raise ValueError('Maximum number of buffered elements '
+                             'should be non-negative, '
+                             f'but found {max_buffered}.')
+        self._iterator, self._key = iterator, key
+        self._max_buffered, self._serializer = max_buffered, serializer
+        self._discover, self._exhausted = keys is None, False
+        self._error: _t.Optional[ValueError] = None
+        self._keys: _t.List[_Key] = []
+        # queues of closed streams are removed,
+        # so their elements are dropped
+        self._queues: _t.Dict[_Key, _Queue[_T]] = {}
+        self._streams: _t.Dict[_Key, _t.Iterator[_T]] = {}
+        for known_key in keys or ():
+            if known_key not in self._streams:
+                self._add(known_key)
+
+    def __getitem__(self, key: _Key) -> _t.Iterator[_T]:
+        if self._discover:
+            while key not in self._streams and not self._exhausted:
+                self._pull()
+        return self._streams[key]
+
+    def __iter__(self) -> _t.Iterator[_Key]:
+        keys = self._keys
+        index = 0
+        while True:
+            while index < len(keys):
+                yield keys[index]
+                index += 1
+            if self._exhausted or not self._discover:
+                return
+            self._pull()
+
+    def __len__(self) -> int:
+        if self._discover:
+            while not self._exhausted:
+                self._pull()
+        return len(self._keys)
+
+    def _add(self, key: _Key) -> _Queue[_T]:
+        queue: _Queue[_T] = (
+            deque()
+            if self._max_buffered is None
+            else SpillingQueue(self._max_buffered, self._serializer)
+        )
+        self._keys.append(key)
+        self._queues[key], self._streams[key] = queue, self._stream(key,
+                                                                    queue)
+        return queue
+
+    def _pull(self) -> None:
+        if self._error is not None:
+            raise self._error
+        try:
+            element = next(self._iterator)
+        except StopIteration:
+            self._exhausted = True
+            return
+        key = self._key(element)
+        if key in self._streams:
+            queue = self._queues.get(key)
+            if queue is None:
+                return
+        elif self._discover:
+            queue = self._add(key)
+        else:
+            # element is dropped, so the partition can not proceed
+            self._error = ValueError(f'Key {key!r} of element {element!r} '
+                                     'is not among partition keys.')
+            raise self._error
+        queue.append(element)
+
+    def _stream(self, key: _Key, queue: _Queue[_T]) -> _t.Iterator[_T]:
+        try:
+            while True:
+                while not queue:
+                    if self._exhausted:
+                        return
+                    self._pull()
+                yield queue.popleft()
+        finally:
+            del self._queues[key]
+            if isinstance(queue, SpillingQueue):
+                queue.close()
@@ -12,9 +12,12 @@ from reprit.base import generate_repr
 from typing_extensions import final
 
 from lz._core.functional import ApplierBase
-from lz._core.signatures import (Parameter,
+from lz._core.signatures import (EagerSignature,
+                                 LazySignature,
+                                 Parameter,
                                  Signature,
                                  plain_signature_to_parameters_by_kind,
+                                 to_eager_signature,
                                  to_signature)
 
 _Arg = _t.TypeVar('_Arg')
@@ -38,22 +41,59 @@ class Applier(ApplierBase[_Arg, _KwArg, _Result]):
                              field_seeker=seekers.complex_)
 
 
+@final
+class AppliedSignature(LazySignature):
+    """
+    Signature of a function with positional arguments applied to the right,
+    queries are answered by the signature of the function itself
+    with applied arguments placed after given ones.
+    """
+
+    __slots__ = '_args', '_signature'
+
+    def __init__(self, signature: Signature, args: _t.Tuple[_T, ...]) -> None:
+        if not signature.expects(*args):
+            raise TypeError(f'No corresponding signature found '
+                            f'for {len(args)} positional '
+                            f'argument{"s" * (len(args) != 1)}.')
+        self._args, self._signature = args, signature
+
+    def all_set(self, *args: _t.Any, **kwargs: _t.Any) -> bool:
+        return self._signature.all_set(*args, *self._args, **kwargs)
+
+    def bind(self, *args: _t.Any, **kwargs: _t.Any) -> 'AppliedSignature':
+        return AppliedSignature(self._signature.bind(*args, **kwargs),
+                                self._args)
+
+    def expects(self, *args: _t.Any, **kwargs: _t.Any) -> bool:
+        return self._signature.expects(*args, *self._args, **kwargs)
+
+    def materialize(self) -> EagerSignature:
+        return _bind_positionals_to_applier(
+                to_eager_signature(self._signature), self._args
+        )
+
+    __repr__ = generate_repr(__init__,
+                             field_seeker=seekers.complex_)
+
+
 @to_signature.register(Applier)
 def _(value: Applier[_Arg, _KwArg, _Result]) -> Signature:
-    return _bind_positionals_to_applier(
-            to_signature(value.function).bind(**value.kwargs), value.args
-    )
+    signature = to_signature(value.function).bind(**value.kwargs)
+    return (AppliedSignature(signature, value.args)
+            if value.args
+            else signature)
 
 
 @functools.singledispatch
-def _bind_positionals_to_applier(signature: Signature,
-                                 args: _t.Tuple[_T, ...]) -> Signature:
+def _bind_positionals_to_applier(signature: EagerSignature,
+                                 args: _t.Tuple[_T, ...]) -> EagerSignature:
     raise TypeError('Unsupported signature type: {type}.'
                     .format(type=type(signature)))
 
 
 @_bind_positionals_to_applier.register(PlainSignature)
-def _(signature: PlainSignature, args: _t.Tuple[_T, ...]) -> Signature:
+def _(signature: PlainSignature, args: _t.Tuple[_T, ...]) -> EagerSignature:
     if not args:
         return signature
     parameters_by_kind = plain_signature_to_parameters_by_kind(signature)
@@ -109,7 +149,9 @@ def _(signature: PlainSignature, args: _t.Tuple[_T, ...]) -> Signature:
             else OverloadedSignature(*sub_signatures))
 
 
-def flatten_signature(signature: Signature) -> _t.Iterable[PlainSignature]:
+def flatten_signature(
+        signature: EagerSignature
+) -> _t.Iterable[PlainSignature]:
     if isinstance(signature, OverloadedSignature):
         yield from signature.signatures
     else:
@@ -117,7 +159,8 @@ def flatten_signature(signature: Signature) -> _t.Iterable[PlainSignature]:
 
 
 @_bind_positionals_to_applier.register(OverloadedSignature)
-def _(signature: OverloadedSignature, args: _t.Tuple[_T, ...]) -> Signature:
+def _(signature: OverloadedSignature,
+      args: _t.Tuple[_T, ...]) -> EagerSignature:
     sub_signatures = [_bind_positionals_to_applier(sub_signature, args)
                       for sub_signature in signature.signatures
                       if sub_signature.expects(*args)]
@@ -1,7 +1,23 @@
+import copyreg
 import functools
-from typing import (Any,
+import importlib
+import io
+import pickle
+import sys
+import threading
+import types
+import weakref
+from abc import (ABC,
+                 abstractmethod)
+from collections import OrderedDict
+from os import PathLike
+from typing import (AbstractSet,
+                    Any,
                     Dict,
+                    ForwardRef,
                     List,
+                    Optional,
+                    Tuple,
                     Union)
 
 from paradigm.base import (OptionalParameter,
@@ -10,14 +26,291 @@ from paradigm.base import (OptionalParameter,
                            PlainSignature,
                            RequiredParameter,
                            signature_from_callable)
+from typing_extensions import final
 
-Signature = Union[PlainSignature, OverloadedSignature]
+EagerSignature = Union[PlainSignature, OverloadedSignature]
 Parameter = Union[OptionalParameter, RequiredParameter]
 
 
+class LazySignature(ABC):
+    """
+    Signature which answers queries without building its parameters,
+    materializing them only when the structure is needed.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def all_set(self, *args: Any, **kwargs: Any) -> bool:
+        """
+        Checks if the signature has no unspecified parameters left
+        with given arguments.
+        """
+
+    @abstractmethod
+    def bind(self, *args: Any, **kwargs: Any) -> 'Signature':
+        """Binds given arguments to the signature."""
+
+    @abstractmethod
+    def expects(self, *args: Any, **kwargs: Any) -> bool:
+        """Checks if the signature accepts given arguments."""
+
+    @abstractmethod
+    def materialize(self) -> EagerSignature:
+        """Returns equivalent signature with parameters built."""
+
+
+Signature = Union[EagerSignature, LazySignature]
+
+
+def to_eager_signature(signature: Signature) -> EagerSignature:
+    return (signature.materialize()
+            if isinstance(signature, LazySignature)
+            else signature)
+
+
+_WeakKey = Tuple[int, ...]
+_WeakEntry = Tuple[Tuple['weakref.KeyedRef[_WeakKey, Any]', ...], Signature]
+
+
+@final
+class SignaturesCache:
+    """
+    Cache of signatures keyed by callables.
+
+    Built-in callables live as long as the interpreter,
+    so they are held strongly and looked up by equality,
+    other callables are held weakly to not prolong their lifetime
+    and looked up by identity to not mix up equal callables
+    with different signatures
+    (bound methods are created anew on each attribute access,
+    so they are looked up by identities of their functions & instances).
+    Each of the storages holds at most ``max_size`` entries
+    with least recently used ones evicted.
+    """
+
+    __slots__ = ('_dead_references', '_hits', '_lock', '_max_size',
+                 '_misses', '_strong', '_weak')
+
+    def __init__(self, max_size: int) -> None:
+        self._dead_references: 'List[weakref.KeyedRef[_WeakKey, Any]]' = []
+        self._hits = self._misses = 0
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._strong: 'OrderedDict[Any, Signature]' = OrderedDict()
+        self._weak: 'OrderedDict[_WeakKey, _WeakEntry]' = OrderedDict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._hits = self._misses = 0
+            self._dead_references.clear()
+            self._strong.clear()
+            self._weak.clear()
+
+    def get(self, value: Any) -> Signature:
+        is_built_in = _is_built_in(value)
+        with self._lock:
+            self._purge()
+            try:
+                result = (self._get_strong(value)
+                          if is_built_in
+                          else self._get_weak(value))
+            except (KeyError, TypeError):
+                pass
+            else:
+                self._hits += 1
+                return result
+        result = signature_from_callable(value)
+        with self._lock:
+            self._misses += 1
+        self.set(value, result)
+        return result
+
+    def info(self) -> 'functools._CacheInfo':
+        with self._lock:
+            self._purge()
+            return functools._CacheInfo(self._hits, self._misses,
+                                        self._max_size,
+                                        len(self._strong) + len(self._weak))
+
+    def load(self, path: Union[str, 'PathLike[str]']) -> None:
+        with open(path, 'rb') as file:
+            table: Dict[Tuple[str, str], Signature] = pickle.load(file)
+        for (module_name, qualified_name), signature in table.items():
+            value = _qualified_name_to_object(module_name, qualified_name)
+            if value is not None:
+                self.set(value, signature)
+
+    def save(self, path: Union[str, 'PathLike[str]']) -> None:
+        with self._lock:
+            items = list(self._strong.items())
+        table = {}
+        for value, signature in items:
+            name = _object_to_qualified_name(value)
+            if name is None:
+                continue
+            try:
+                _SignaturesPickler(io.BytesIO()).dump(signature)
+            except (AttributeError, TypeError, pickle.PicklingError):
+                continue
+            table[name] = signature
+        with open(path, 'wb') as file:
+            _SignaturesPickler(file).dump(table)
+
+    def set(self, value: Any, signature: Signature) -> None:
+        is_built_in = _is_built_in(value)
+        try:
+            with self._lock:
+                self._purge()
+                if is_built_in:
+                    self._set_strong(value, signature)
+                else:
+                    self._set_weak(value, signature)
+        except TypeError:
+            # unhashable or not weakly referenceable
+            pass
+
+    def _get_strong(self, value: Any) -> Signature:
+        result = self._strong[value]
+        self._strong.move_to_end(value)
+        return result
+
+    def _get_weak(self, value: Any) -> Signature:
+        referents = _to_weak_referents(value)
+        key = _to_weak_key(referents)
+        references, result = self._weak[key]
+        if any(reference() is not referent
+               for reference, referent in zip(references, referents)):
+            # identifier of dead object is reused
+            raise KeyError(key)
+        self._weak.move_to_end(key)
+        return result
+
+    def _purge(self) -> None:
+        # weak references callbacks can be called
+        # while the lock is held by the same thread,
+        # so dead entries are removed later under the lock
+        while self._dead_references:
+            reference = self._dead_references.pop()
+            entry = self._weak.get(reference.key)
+            if entry is not None and reference in entry[0]:
+                del self._weak[reference.key]
+
+    def _set_strong(self, value: Any, signature: Signature) -> None:
+        self._strong[value] = signature
+        self._strong.move_to_end(value)
+        if len(self._strong) > self._max_size:
+            self._strong.popitem(last=False)
+
+    def _set_weak(self, value: Any, signature: Signature) -> None:
+        referents = _to_weak_referents(value)
+        key = _to_weak_key(referents)
+        self._weak[key] = (
+            tuple(weakref.KeyedRef(referent, self._dead_references.append,
+                                   key)
+                  for referent in referents),
+            signature
+        )
+        self._weak.move_to_end(key)
+        if len(self._weak) > self._max_size:
+            self._weak.popitem(last=False)
+
+
+def _is_built_in(value: Any) -> bool:
+    return (isinstance(value, (types.ClassMethodDescriptorType,
+                               types.MethodDescriptorType,
+                               types.WrapperDescriptorType))
+            or (isinstance(value, types.BuiltinFunctionType)
+                and (value.__self__ is None
+                     or isinstance(value.__self__, (type, types.ModuleType))))
+            or (isinstance(value, type)
+                and value.__module__ == 'builtins'))
+
+
+def _object_to_qualified_name(value: Any) -> Optional[Tuple[str, str]]:
+    module_name = getattr(value, '__module__', None)
+    if module_name is None:
+        owner = getattr(value, '__objclass__', None)
+        module_name = getattr(owner, '__module__', None)
+    qualified_name = getattr(value, '__qualname__', None)
+    if (not isinstance(module_name, str)
+            or not isinstance(qualified_name, str)
+            # bound methods are created anew on each attribute access
+            # so equality is checked instead of identity
+            or _qualified_name_to_object(module_name,
+                                         qualified_name) != value):
+        return None
+    return module_name, qualified_name
+
+
+def _qualified_name_to_object(module_name: str,
+                              qualified_name: str) -> Optional[Any]:
+    try:
+        result: Any = importlib.import_module(module_name)
+        for name in qualified_name.split('.'):
+            result = getattr(result, name)
+    except (AttributeError, ImportError):
+        return None
+    return result
+
+
+def _reduce_forward_reference(
+        value: ForwardRef
+) -> Tuple[Any, Tuple[Any, ...], Tuple[None, Dict[str, Any]]]:
+    # forward references hold compiled code of their arguments
+    # which can not be pickled, so it is recompiled on unpickling
+    # with the rest of the fields restored as is
+    return ForwardRef, (value.__forward_arg__,), (None, {
+        name: getattr(value, name)
+        for name in ForwardRef.__slots__
+        if name != '__forward_code__' and hasattr(value, name)
+    })
+
+
+_STANDARD_STREAMS_NAMES = ('stderr', 'stdin', 'stdout',
+                           '__stderr__', '__stdin__', '__stdout__')
+
+
+def _reduce_text_stream(
+        value: io.TextIOWrapper
+) -> Tuple[Any, Tuple[str]]:
+    # standard streams are common defaults (e.g. of `faulthandler`)
+    # which are pickled by reference
+    for name in _STANDARD_STREAMS_NAMES:
+        if getattr(sys, name, None) is value:
+            return _to_standard_stream, (name,)
+    raise pickle.PicklingError(f'Can not pickle stream {value!r}.')
+
+
+def _to_standard_stream(name: str) -> Any:
+    return getattr(sys, name)
+
+
+class _SignaturesPickler(pickle.Pickler):
+    # annotations of signatures can contain forward references
+    dispatch_table = {**copyreg.dispatch_table,
+                      ForwardRef: _reduce_forward_reference,
+                      io.TextIOWrapper: _reduce_text_stream}
+
+
+def _to_weak_key(referents: Tuple[Any, ...]) -> _WeakKey:
+    return tuple(map(id, referents))
+
+
+def _to_weak_referents(value: Any) -> Tuple[Any, ...]:
+    return ((value.__func__, value.__self__)
+            if isinstance(value, types.MethodType)
+            else (value,))
+
+
+SIGNATURES_CACHE_MAX_SIZE = 4096
+
+signatures_cache = SignaturesCache(SIGNATURES_CACHE_MAX_SIZE)
+
+
 @functools.singledispatch
 def to_signature(value: Any) -> Signature:
-    return signature_from_callable(value)
+    return signatures_cache.get(value)
 
 
 def plain_signature_to_parameters_by_kind(
@@ -28,3 +321,113 @@ def plain_signature_to_parameters_by_kind(
     for parameter in signature.parameters:
         result[parameter.kind].append(parameter)
     return result
+
+
+@final
+class BindingPlan:
+    """
+    Precomputed parameters layout of a signature
+    which allows checking arguments by their count & names
+    without binding them.
+    """
+
+    @property
+    def signature(self) -> Signature:
+        return self._signature
+
+    __slots__ = '_plain_plans', '_signature'
+
+    def __init__(self, signature: Signature) -> None:
+        self._signature = signature
+        eager_signature = to_eager_signature(signature)
+        self._plain_plans = tuple(
+                map(_PlainBindingPlan,
+                    eager_signature.signatures
+                    if isinstance(eager_signature, OverloadedSignature)
+                    else [eager_signature])
+        )
+
+    def all_set(self, args_count: int, keywords: AbstractSet[str]) -> bool:
+        return any(plan.expects(args_count, keywords)
+                   and plan.completes(args_count, keywords)
+                   for plan in self._plain_plans)
+
+    def expects(self, args_count: int, keywords: AbstractSet[str]) -> bool:
+        return any(plan.expects(args_count, keywords)
+                   for plan in self._plain_plans)
+
+    def is_partial(self, args_count: int, keywords: AbstractSet[str]) -> bool:
+        """
+        Checks if the signature accepts given arguments,
+        but has unspecified parameters left with them.
+        """
+        result = False
+        for plan in self._plain_plans:
+            if plan.expects(args_count, keywords):
+                if plan.completes(args_count, keywords):
+                    return False
+                result = True
+        return result
+
+
+@final
+class _PlainBindingPlan:
+    __slots__ = ('_has_variadic_keyword', '_has_variadic_positional',
+                 '_keywords_indices', '_positionals_count',
+                 '_required_keywords_indices',
+                 '_required_positionals_only_count')
+
+    def __init__(self, signature: PlainSignature[Any]) -> None:
+        parameters_by_kind = plain_signature_to_parameters_by_kind(signature)
+        positionals_only = parameters_by_kind[ParameterKind.POSITIONAL_ONLY]
+        positionals_or_keywords = parameters_by_kind[
+            ParameterKind.POSITIONAL_OR_KEYWORD
+        ]
+        keywords_only = parameters_by_kind[ParameterKind.KEYWORD_ONLY]
+        self._has_variadic_keyword = bool(
+                parameters_by_kind[ParameterKind.VARIADIC_KEYWORD]
+        )
+        self._has_variadic_positional = bool(
+                parameters_by_kind[ParameterKind.VARIADIC_POSITIONAL]
+        )
+        self._positionals_count = (len(positionals_only)
+                                   + len(positionals_or_keywords))
+        keywords_indices = {
+            parameter.name: index
+            for index, parameter in enumerate(positionals_or_keywords,
+                                              start=len(positionals_only))
+        }
+        # keyword-only parameters can't be bound positionally,
+        # so their indices are placed after any possible positional one
+        keywords_indices.update((parameter.name, sys.maxsize)
+                                for parameter in keywords_only)
+        self._keywords_indices = keywords_indices
+        self._required_keywords_indices = {
+            parameter.name: keywords_indices[parameter.name]
+            for parameter in positionals_or_keywords + keywords_only
+            if isinstance(parameter, RequiredParameter)
+        }
+        self._required_positionals_only_count = sum(
+                isinstance(parameter, RequiredParameter)
+                for parameter in positionals_only
+        )
+
+    def completes(self, args_count: int, keywords: AbstractSet[str]) -> bool:
+        # assumes that given arguments are expected
+        if args_count < self._required_positionals_only_count:
+            return False
+        return all(index < args_count or name in keywords
+                   for name, index in self._required_keywords_indices.items())
+
+    def expects(self, args_count: int, keywords: AbstractSet[str]) -> bool:
+        if (args_count > self._positionals_count
+                and not self._has_variadic_positional):
+            return False
+        if self._has_variadic_keyword:
+            return True
+        keywords_indices = self._keywords_indices
+        for name in keywords:
+            index = keywords_indices.get(name)
+            if index is None or index < args_count:
+                return False
+        return True
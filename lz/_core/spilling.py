@@ -0,0 +1,115 @@
+import os
+import tempfile
+import typing as _t
+from collections import deque
+
+import typing_extensions as _te
+from reprit import seekers
+from reprit.base import generate_repr
+
+_T = _t.TypeVar('_T')
+
+
+class Serializer(_te.Protocol):
+    def dump(self, value: _t.Any, file: _t.BinaryIO) -> None:
+        ...
+
+    def load(self, file: _t.BinaryIO) -> _t.Any:
+        ...
+
+
+@_te.final
+class SpillFile:
+    """
+    Temporary file with serialized values which is created on first dump.
+    """
+
+    __slots__ = '_file', '_serializer'
+
+    def __init__(self, serializer: Serializer) -> None:
+        self._file: _t.Optional[_t.BinaryIO] = None
+        self._serializer = serializer
+
+    def clear(self) -> None:
+        if self._file is not None:
+            self._file.seek(0)
+            self._file.truncate()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def dump(self, value: _t.Any) -> None:
+        if self._file is None:
+            self._file = _t.cast(_t.BinaryIO, tempfile.TemporaryFile())
+        self._file.seek(0, os.SEEK_END)
+        self._serializer.dump(value, self._file)
+
+    def load(self, offset: int, count: int) -> _t.Tuple[_t.List[_t.Any], int]:
+        """
+        Loads given number of consecutive values starting from given offset,
+        returns them with offset of the next value.
+        """
+        assert self._file is not None, 'Nothing was dumped.'
+        self._file.seek(offset)
+        values = [self._serializer.load(self._file)
+                  for _ in range(count)]
+        return values, self._file.tell()
+
+
+@_te.final
+class SpillingQueue(_t.Generic[_T]):
+    """
+    FIFO queue which keeps at most given number of values in memory
+    spilling the rest to a temporary file.
+    """
+
+    __slots__ = ('_max_in_memory', '_memory', '_read_offset', '_serializer',
+                 '_spill_file', '_spilled_count')
+
+    def __init__(self,
+                 max_in_memory: int,
+                 serializer: Serializer) -> None:
+        if max_in_memory < 0:
+            raise ValueError('Maximum number of values in memory '
+                             'should be non-negative, '
+                             f'but found {max_in_memory}.')
+        self._max_in_memory, self._serializer = max_in_memory, serializer
+        self._memory: _t.Deque[_T] = deque()
+        self._read_offset = self._spilled_count = 0
+        self._spill_file = SpillFile(serializer)
+
+    __repr__ = generate_repr(__init__,
+                             field_seeker=seekers.complex_)
+
+    def __bool__(self) -> bool:
+        return bool(self._memory or self._spilled_count)
+
+    def __len__(self) -> int:
+        return len(self._memory) + self._spilled_count
+
+    def append(self, value: _T) -> None:
+        # once spilling has started values go to the file
+        # until it is drained to preserve the order
+        if self._spilled_count or len(self._memory) >= self._max_in_memory:
+            self._spill_file.dump(value)
+            self._spilled_count += 1
+        else:
+            self._memory.append(value)
+
+    def close(self) -> None:
+        self._spill_file.close()
+
+    def popleft(self) -> _T:
+        if not self._memory and self._spilled_count:
+            count = min(self._spilled_count, max(self._max_in_memory, 1))
+            values, self._read_offset = self._spill_file.load(
+                    self._read_offset, count
+            )
+            self._memory.extend(values)
+            self._spilled_count -= count
+            if not self._spilled_count:
+                self._spill_file.clear()
+                self._read_offset = 0
+        return self._memory.popleft()
@@ -1,15 +1,47 @@
+import array as _array
 import functools as _functools
 import itertools as _itertools
+import pickle as _pickle
 import typing as _t
-from collections import deque as _deque
+from collections import (abc as _abc,
+                         deque as _deque)
+from operator import not_ as _not
 
+import typing_extensions as _te
+
+from ._core import (arrays as _arrays,
+                    handoff as _handoff,
+                    spilling as _spilling)
+from ._core.partitioning import Partition as _Partition
+from ._core.spilling import Serializer as _Serializer
 from .replication import duplicate as _duplicate
 
+_Batch = _t.TypeVar('_Batch', bound=_t.Sequence[_t.Any])
+_Key = _t.TypeVar('_Key', bound=_t.Hashable)
 _T = _t.TypeVar('_T')
+_Mask = _t.Iterable[bool]
 
 
+@_t.overload
 def sift(_predicate: _t.Callable[[_T], bool],
-         _value: _t.Iterable[_T]) -> _t.Iterable[_T]:
+         _value: _t.Iterable[_T],
+         *,
+         batched: _te.Literal[False] = ...) -> _t.Iterable[_T]:
+    pass
+
+
+@_t.overload
+def sift(_predicate: _t.Callable[[_Batch], _Mask],
+         _value: _t.Iterable[_Batch],
+         *,
+         batched: _te.Literal[True]) -> _t.Iterable[_Batch]:
+    pass
+
+
+def sift(_predicate: _t.Callable[[_t.Any], _t.Any],
+         _value: _t.Iterable[_t.Any],
+         *,
+         batched: bool = False) -> _t.Iterable[_t.Any]:
     """
     Selects elements from iterable which satisfy given predicate.
 
@@ -20,13 +52,50 @@ def sift(_predicate: _t.Callable[[_T], bool],
     ...     return number % 2 == 0
     >>> list(sift(is_even, range(10)))
     [0, 2, 4, 6, 8]
+
+    In batched mode iterable consists of batches (e.g. NumPy arrays
+    or ``array.array``s produced by ``lz.iterating.chop``)
+    and predicate returns boolean mask for a whole batch,
+    so batches of selected elements are produced.
+
+    >>> from array import array
+    >>> from lz.iterating import chop
+    >>> def are_even(numbers: array) -> list:
+    ...     return [number % 2 == 0 for number in numbers]
+    >>> list(sift(are_even, chop(array('i', range(10)), size=4),
+    ...           batched=True))
+    [array('i', [0, 2]), array('i', [4, 6]), array('i', [8])]
     """
-    return filter(_predicate, _value)
+    return (map(_functools.partial(_mask_batch, _predicate,
+                                   negated=False),
+                _value)
+            if batched
+            else filter(_predicate, _value))
 
 
+@_t.overload
 def sifter(
-        _predicate: _t.Callable[[_T], bool]
+        _predicate: _t.Callable[[_T], bool],
+        *,
+        batched: _te.Literal[False] = ...
 ) -> _t.Callable[[_t.Iterable[_T]], _t.Iterable[_T]]:
+    pass
+
+
+@_t.overload
+def sifter(
+        _predicate: _t.Callable[[_Batch], _Mask],
+        *,
+        batched: _te.Literal[True]
+) -> _t.Callable[[_t.Iterable[_Batch]], _t.Iterable[_Batch]]:
+    pass
+
+
+def sifter(
+        _predicate: _t.Callable[[_t.Any], _t.Any],
+        *,
+        batched: bool = False
+) -> _t.Callable[[_t.Iterable[_t.Any]], _t.Iterable[_t.Any]]:
     """
     Returns function that selects elements from iterable
     which satisfy given predicate.
@@ -41,11 +110,32 @@ def sifter(
     >>> list(to_even(range(10)))
     [0, 2, 4, 6, 8]
     """
-    return _functools.partial(sift, _predicate)
+    return (_functools.partial(sift, _predicate,
+                               batched=batched)
+            if batched
+            else _functools.partial(sift, _predicate))
 
 
+@_t.overload
 def scavenge(_predicate: _t.Callable[[_T], bool],
-             _value: _t.Iterable[_T]) -> _t.Iterable[_T]:
+             _value: _t.Iterable[_T],
+             *,
+             batched: _te.Literal[False] = ...) -> _t.Iterable[_T]:
+    pass
+
+
+@_t.overload
+def scavenge(_predicate: _t.Callable[[_Batch], _Mask],
+             _value: _t.Iterable[_Batch],
+             *,
+             batched: _te.Literal[True]) -> _t.Iterable[_Batch]:
+    pass
+
+
+def scavenge(_predicate: _t.Callable[[_t.Any], _t.Any],
+             _value: _t.Iterable[_t.Any],
+             *,
+             batched: bool = False) -> _t.Iterable[_t.Any]:
     """
     Selects elements from iterable which dissatisfy given predicate.
 
@@ -56,13 +146,50 @@ def scavenge(_predicate: _t.Callable[[_T], bool],
     ...     return number % 2 == 0
     >>> list(scavenge(is_even, range(10)))
     [1, 3, 5, 7, 9]
+
+    In batched mode iterable consists of batches (e.g. NumPy arrays
+    or ``array.array``s produced by ``lz.iterating.chop``)
+    and predicate returns boolean mask for a whole batch,
+    so batches of not selected elements are produced.
+
+    >>> from array import array
+    >>> from lz.iterating import chop
+    >>> def are_even(numbers: array) -> list:
+    ...     return [number % 2 == 0 for number in numbers]
+    >>> list(scavenge(are_even, chop(array('i', range(10)), size=4),
+    ...               batched=True))
+    [array('i', [1, 3]), array('i', [5, 7]), array('i', [9])]
     """
-    return _itertools.filterfalse(_predicate, _value)
+    return (map(_functools.partial(_mask_batch, _predicate,
+                                   negated=True),
+                _value)
+            if batched
+            else _itertools.filterfalse(_predicate, _value))
 
 
+@_t.overload
 def scavenger(
-        _predicate: _t.Callable[[_T], bool]
+        _predicate: _t.Callable[[_T], bool],
+        *,
+        batched: _te.Literal[False] = ...
 ) -> _t.Callable[[_t.Iterable[_T]], _t.Iterable[_T]]:
+    pass
+
+
+@_t.overload
+def scavenger(
+        _predicate: _t.Callable[[_Batch], _Mask],
+        *,
+        batched: _te.Literal[True]
+) -> _t.Callable[[_t.Iterable[_Batch]], _t.Iterable[_Batch]]:
+    pass
+
+
+def scavenger(
+        _predicate: _t.Callable[[_t.Any], _t.Any],
+        *,
+        batched: bool = False
+) -> _t.Callable[[_t.Iterable[_t.Any]], _t.Iterable[_t.Any]]:
     """
     Returns function that selects elements from iterable
     which dissatisfy given predicate.
@@ -77,11 +204,60 @@ def scavenger(
     >>> list(to_odd(range(10)))
     [1, 3, 5, 7, 9]
     """
-    return _functools.partial(scavenge, _predicate)
+    return (_functools.partial(scavenge, _predicate,
+                               batched=batched)
+            if batched
+            else _functools.partial(scavenge, _predicate))
+
+
+def _mask_batch(_predicate: _t.Callable[[_Batch], _Mask],
+                _batch: _Batch,
+                *,
+                negated: bool) -> _Batch:
+    mask = _predicate(_batch)
+    numpy = _arrays.to_numpy_module(_batch)
+    if numpy is not None:
+        mask = numpy.asarray(mask,
+                             dtype=bool)
+        return _t.cast(_Batch, _batch[~mask if negated else mask])
+    return _t.cast(_Batch, _compress_batch(_batch, _itertools.compress(
+            _batch, map(_not, mask) if negated else mask
+    )))
+
+
+@_functools.singledispatch
+def _compress_batch(_batch: _t.Any,
+                    _elements: _t.Iterable[_t.Any]) -> _t.Any:
+    return list(_elements)
+
+
+@_compress_batch.register(bytearray)
+@_compress_batch.register(bytes)
+@_compress_batch.register(list)
+@_compress_batch.register(tuple)
+def _(_batch: _t.Union[bytearray, bytes, _t.List[_t.Any],
+                       _t.Tuple[_t.Any, ...]],
+      _elements: _t.Iterable[_t.Any]) -> _t.Sequence[_t.Any]:
+    return type(_batch)(_elements)
+
+
+@_compress_batch.register(_array.array)
+def _(_batch: '_array.array[_t.Any]',
+      _elements: _t.Iterable[_t.Any]) -> '_array.array[_t.Any]':
+    return _array.array(_batch.typecode, _elements)
+
+
+_Queue = _t.Union[_t.Deque[_T], _spilling.SpillingQueue[_T]]
 
 
 def separate(
-        _predicate: _t.Callable[[_T], bool], _value: _t.Iterable[_T]
+        _predicate: _t.Callable[[_T], bool],
+        _value: _t.Iterable[_T],
+        *,
+        max_buffered: _t.Optional[int] = None,
+        pure: bool = False,
+        serializer: _Serializer = _pickle,
+        thread_safe: bool = False
 ) -> _t.Tuple[_t.Iterable[_T], _t.Iterable[_T]]:
     """
     Returns pair of iterables
@@ -95,19 +271,66 @@ def separate(
     ...     return number % 2 == 0
     >>> tuple(map(list, separate(is_even, range(10))))
     ([1, 3, 5, 7, 9], [0, 2, 4, 6, 8])
+
+    With given maximum number of buffered elements per iterable
+    the rest are dumped with given serializer to a temporary file.
+
+    >>> tuple(map(list, separate(is_even, range(10),
+    ...                          max_buffered=2)))
+    ([1, 3, 5, 7, 9], [0, 2, 4, 6, 8])
+
+    By default predicate is called on a replica of each element,
+    so it can not affect elements by mutating its argument,
+    pure predicate is called on elements themselves
+    which avoids replicating them.
+
+    >>> tuple(map(list, separate(is_even, range(10),
+    ...                          pure=True)))
+    ([1, 3, 5, 7, 9], [0, 2, 4, 6, 8])
+
+    Thread-safe iterables can be consumed from different threads,
+    with given maximum number of buffered elements
+    an iterable which runs ahead waits for the other one to catch up
+    instead of spilling, so each of them should be either consumed or closed.
+
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> with ThreadPoolExecutor() as executor:
+    ...     list(executor.map(list, separate(is_even, range(10),
+    ...                                      max_buffered=1,
+    ...                                      thread_safe=True)))
+    [[1, 3, 5, 7, 9], [0, 2, 4, 6, 8]]
     """
+    if thread_safe:
+        fan_out = _handoff.BlockingFanOut(
+                iter(_value),
+                _functools.partial(_distribute_by_predicate, _predicate,
+                                   pure=pure),
+                count=2,
+                max_buffered=max_buffered
+        )
+        return fan_out.stream(0), fan_out.stream(1)
     iterator = iter(_value)
-    unsatisfying: _t.Deque[_T] = _deque()
-    satisfying: _t.Deque[_T] = _deque()
-
-    def fill(queue: _t.Deque[_T]) -> _t.Iterable[_T]:
+    unsatisfying: _Queue[_T]
+    satisfying: _Queue[_T]
+    if max_buffered is None:
+        unsatisfying, satisfying = _deque(), _deque()
+    else:
+        unsatisfying, satisfying = (
+            _spilling.SpillingQueue(max_buffered, serializer),
+            _spilling.SpillingQueue(max_buffered, serializer)
+        )
+
+    def fill(queue: _Queue[_T]) -> _t.Iterable[_T]:
         while True:
             while not queue:
                 try:
                     element = next(iterator)
                 except StopIteration:
                     return
-                subject, element = _duplicate(element)
+                if pure:
+                    subject = element
+                else:
+                    subject, element = _duplicate(element)
                 (satisfying
                  if _predicate(subject)
                  else unsatisfying).append(element)
@@ -116,8 +339,26 @@ def separate(
     return fill(unsatisfying), fill(satisfying)
 
 
+def _distribute_by_predicate(
+        _predicate: _t.Callable[[_T], bool],
+        _element: _T,
+        _indices: _t.Sequence[int],
+        *,
+        pure: bool
+) -> _t.Iterable[_t.Tuple[int, _T]]:
+    subject, element = ((_element, _element)
+                        if pure
+                        else _duplicate(_element))
+    return ((1 if _predicate(subject) else 0, element),)
+
+
 def separator(
-        _predicate: _t.Callable[[_T], bool]
+        _predicate: _t.Callable[[_T], bool],
+        *,
+        max_buffered: _t.Optional[int] = None,
+        pure: bool = False,
+        serializer: _Serializer = _pickle,
+        thread_safe: bool = False
 ) -> _t.Callable[[_t.Iterable[_T]],
                  _t.Tuple[_t.Iterable[_T], _t.Iterable[_T]]]:
     """
@@ -135,15 +376,229 @@ def separator(
     >>> tuple(map(list, split_by_evenness(range(10))))
     ([1, 3, 5, 7, 9], [0, 2, 4, 6, 8])
     """
-    return _functools.partial(separate, _predicate)
+    options: _t.Dict[str, _t.Any] = {}
+    if max_buffered is not None:
+        options.update(max_buffered=max_buffered,
+                       serializer=serializer)
+    if pure:
+        options.update(pure=pure)
+    if thread_safe:
+        options.update(thread_safe=thread_safe)
+    return _functools.partial(separate, _predicate,
+                              **options)
+
+
+@_t.overload
+def partition(
+        _key: _t.Callable[[_T], _Key],
+        _value: _t.Iterable[_T],
+        *,
+        keys: None = ...,
+        max_buffered: _t.Optional[int] = ...,
+        serializer: _Serializer = ...,
+        thread_safe: _te.Literal[False] = ...
+) -> _t.Mapping[_Key, _t.Iterable[_T]]:
+    pass
+
+
+@_t.overload
+def partition(
+        _key: _t.Callable[[_T], _Key],
+        _value: _t.Iterable[_T],
+        *,
+        keys: _t.Iterable[_Key],
+        max_buffered: _t.Optional[int] = ...,
+        serializer: _Serializer = ...,
+        thread_safe: bool = ...
+) -> _t.Tuple[_t.Iterable[_T], ...]:
+    pass
+
+
+def partition(
+        _key: _t.Callable[[_T], _Key],
+        _value: _t.Iterable[_T],
+        *,
+        keys: _t.Optional[_t.Iterable[_Key]] = None,
+        max_buffered: _t.Optional[int] = None,
+        serializer: _Serializer = _pickle,
+        thread_safe: bool = False
+) -> _t.Any:
+    """
+    Returns iterables of elements grouped by given key function
+    for given keys in the same order
+    or mapping from keys to such iterables
+    with keys discovered while elements are pulled.
+
+    >>> def to_remainder(number: int) -> int:
+    ...     return number % 3
+    >>> tuple(map(list, partition(to_remainder, range(10),
+    ...                           keys=range(3))))
+    ([0, 3, 6, 9], [1, 4, 7], [2, 5, 8])
+
+    >>> by_remainder = partition(to_remainder, range(10))
+    >>> list(by_remainder[1])
+    [1, 4, 7]
+    >>> list(by_remainder)
+    [0, 1, 2]
+
+    With given maximum number of buffered elements per iterable
+    the rest are dumped with given serializer to a temporary file.
+
+    >>> tuple(map(list, partition(to_remainder, range(10),
+    ...                           keys=range(3),
+    ...                           max_buffered=1)))
+    ([0, 3, 6, 9], [1, 4, 7], [2, 5, 8])
+
+    Key of an element is computed when the element is pulled
+    by an iterable which needs it,
+    so if the key is not among given ones
+    ``ValueError`` is raised by that iterable
+    and then by every iterable which needs further elements.
+
+    >>> first, second = partition(to_remainder, range(10),
+    ...                           keys=range(2))
+    >>> list(first)
+    Traceback (most recent call last):
+      ...
+    ValueError: Key 2 of element 2 is not among partition keys.
+    >>> list(second)
+    Traceback (most recent call last):
+      ...
+    ValueError: Key 2 of element 2 is not among partition keys.
+
+    Thread-safe iterables for given keys
+    can be consumed from different threads,
+    with given maximum number of buffered elements
+    an iterable which runs ahead waits for others to catch up
+    instead of spilling, so each of them should be either consumed or closed.
+
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> with ThreadPoolExecutor() as executor:
+    ...     list(executor.map(list, partition(to_remainder, range(10),
+    ...                                       keys=range(3),
+    ...                                       max_buffered=1,
+    ...                                       thread_safe=True)))
+    [[0, 3, 6, 9], [1, 4, 7], [2, 5, 8]]
+    """
+    if keys is None:
+        if thread_safe:
+            raise ValueError('Thread-safe partition requires keys.')
+        return _Partition(_key, iter(_value),
+                          max_buffered=max_buffered,
+                          serializer=serializer)
+    keys = tuple(keys)
+    if thread_safe:
+        indices = {key: index
+                   for index, key in reversed(list(enumerate(keys)))}
+        fan_out = _handoff.BlockingFanOut(
+                iter(_value),
+                _functools.partial(_distribute_by_key, _key, indices),
+                count=len(keys),
+                max_buffered=max_buffered
+        )
+        streams = [fan_out.stream(index) for index in range(len(keys))]
+        return tuple(streams[indices[key]] for key in keys)
+    result = _Partition(_key, iter(_value),
+                        keys=keys,
+                        max_buffered=max_buffered,
+                        serializer=serializer)
+    return tuple(map(result.__getitem__, keys))
+
+
+@_t.overload
+def partitioner(
+        _key: _t.Callable[[_T], _Key],
+        *,
+        keys: None = ...,
+        max_buffered: _t.Optional[int] = ...,
+        serializer: _Serializer = ...,
+        thread_safe: _te.Literal[False] = ...
+) -> _t.Callable[[_t.Iterable[_T]], _t.Mapping[_Key, _t.Iterable[_T]]]:
+    pass
+
+
+@_t.overload
+def partitioner(
+        _key: _t.Callable[[_T], _Key],
+        *,
+        keys: _t.Iterable[_Key],
+        max_buffered: _t.Optional[int] = ...,
+        serializer: _Serializer = ...,
+        thread_safe: bool = ...
+) -> _t.Callable[[_t.Iterable[_T]], _t.Tuple[_t.Iterable[_T], ...]]:
+    pass
+
+
+def partitioner(
+        _key: _t.Callable[[_T], _Key],
+        *,
+        keys: _t.Optional[_t.Iterable[_Key]] = None,
+        max_buffered: _t.Optional[int] = None,
+        serializer: _Serializer = _pickle,
+        thread_safe: bool = False
+) -> _t.Callable[[_t.Iterable[_T]], _t.Any]:
+    """
+    Returns function that returns iterables of elements
+    grouped by given key function
+    for given keys in the same order
+    or mapping from keys to such iterables
+    with keys discovered while elements are pulled.
+
+    >>> def to_remainder(number: int) -> int:
+    ...     return number % 3
+    >>> split_by_remainder = partitioner(to_remainder,
+    ...                                  keys=range(3))
+    >>> tuple(map(list, split_by_remainder(range(10))))
+    ([0, 3, 6, 9], [1, 4, 7], [2, 5, 8])
+    """
+    options: _t.Dict[str, _t.Any] = {}
+    if keys is not None:
+        options.update(keys=tuple(keys))
+    elif thread_safe:
+        raise ValueError('Thread-safe partition requires keys.')
+    if max_buffered is not None:
+        options.update(max_buffered=max_buffered,
+                       serializer=serializer)
+    if thread_safe:
+        options.update(thread_safe=thread_safe)
+    return _functools.partial(partition, _key,
+                              **options)
+
+
+def _distribute_by_key(
+        _key: _t.Callable[[_T], _Key],
+        _indices: _t.Mapping[_Key, int],
+        _element: _T,
+        _open_indices: _t.Sequence[int]
+) -> _t.Iterable[_t.Tuple[int, _T]]:
+    key = _key(_element)
+    try:
+        index = _indices[key]
+    except KeyError:
+        raise ValueError(f'Key {key!r} of element {_element!r} '
+                         'is not among partition keys.') from None
+    return ((index, _element),)
 
 
 def grab(_predicate: _t.Callable[[_T], bool],
-         _value: _t.Iterable[_T]) -> _t.Iterable[_T]:
+         _value: _t.Iterable[_T],
+         *,
+         monotone: bool = False) -> _t.Iterable[_T]:
     """
     Selects elements from the beginning of iterable
     while given predicate is satisfied.
 
+    Monotone predicate (the one which is satisfied by a prefix of sequence
+    and is not by the rest, e.g. comparison with a threshold
+    for a sorted sequence) is found by bisection
+    and the prefix is returned as a slice
+    (or ``memoryview`` for buffers).
+
+    >>> from operator import gt
+    >>> from functools import partial
+    >>> grab(partial(gt, 5), range(10), monotone=True)
+    range(0, 5)
+
     >>> grab_while_true_like = grabber(bool)
     >>> list(grab_while_true_like(range(10)))
     []
@@ -154,11 +609,15 @@ def grab(_predicate: _t.Callable[[_T], bool],
     >>> list(grab_while_less_than_five(range(10)))
     [0, 1, 2, 3, 4]
     """
+    if monotone and isinstance(_value, _abc.Sequence):
+        return _to_slice(_value, 0, _bisect(_predicate, _value))
     return _itertools.takewhile(_predicate, _value)
 
 
 def grabber(
-        _predicate: _t.Callable[[_T], bool]
+        _predicate: _t.Callable[[_T], bool],
+        *,
+        monotone: bool = False
 ) -> _t.Callable[[_t.Iterable[_T]], _t.Iterable[_T]]:
     """
     Returns function that selects elements from the beginning of iterable
@@ -174,15 +633,31 @@ def grabber(
     >>> list(grab_while_less_than_five(range(10)))
     [0, 1, 2, 3, 4]
     """
-    return _functools.partial(grab, _predicate)
+    return (_functools.partial(grab, _predicate,
+                               monotone=monotone)
+            if monotone
+            else _functools.partial(grab, _predicate))
 
 
 def kick(_predicate: _t.Callable[[_T], bool],
-         _value: _t.Iterable[_T]) -> _t.Iterable[_T]:
+         _value: _t.Iterable[_T],
+         *,
+         monotone: bool = False) -> _t.Iterable[_T]:
     """
     Skips elements from the beginning of iterable
     while given predicate is satisfied.
 
+    Monotone predicate (the one which is satisfied by a prefix of sequence
+    and is not by the rest, e.g. comparison with a threshold
+    for a sorted sequence) is found by bisection
+    and the rest is returned as a slice
+    (or ``memoryview`` for buffers).
+
+    >>> from operator import gt
+    >>> from functools import partial
+    >>> kick(partial(gt, 5), range(10), monotone=True)
+    range(5, 10)
+
     >>> list(kick(bool, range(10)))
     [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
 
@@ -191,11 +666,15 @@ def kick(_predicate: _t.Callable[[_T], bool],
     >>> list(kick(partial(gt, 5), range(10)))
     [5, 6, 7, 8, 9]
     """
+    if monotone and isinstance(_value, _abc.Sequence):
+        return _to_slice(_value, _bisect(_predicate, _value), len(_value))
     return _itertools.dropwhile(_predicate, _value)
 
 
 def kicker(
-        _predicate: _t.Callable[[_T], bool]
+        _predicate: _t.Callable[[_T], bool],
+        *,
+        monotone: bool = False
 ) -> _t.Callable[[_t.Iterable[_T]], _t.Iterable[_T]]:
     """
     Returns function that skips elements from the beginning of iterable
@@ -211,4 +690,33 @@ def kicker(
     >>> list(kick_while_less_than_five(range(10)))
     [5, 6, 7, 8, 9]
     """
-    return _functools.partial(kick, _predicate)
+    return (_functools.partial(kick, _predicate,
+                               monotone=monotone)
+            if monotone
+            else _functools.partial(kick, _predicate))
+
+
+def _bisect(_predicate: _t.Callable[[_T], bool],
+            _value: _t.Sequence[_T]) -> int:
+    # finds index of the first element
+    # which does not satisfy monotone predicate
+    low, high = 0, len(_value)
+    while low < high:
+        middle = (low + high) // 2
+        if _predicate(_value[middle]):
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+_BUFFERS_TYPES = (_array.array, bytearray, bytes, memoryview)
+
+
+def _to_slice(_value: _t.Sequence[_T],
+              start: int,
+              stop: int) -> _t.Sequence[_T]:
+    # buffers are sliced without copying
+    return (_t.cast(_t.Sequence[_T], memoryview(_value)[start:stop])
+            if isinstance(_value, _BUFFERS_TYPES)
+            else _value[start:stop])
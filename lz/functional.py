@@ -1,13 +1,16 @@
 import functools as _functools
-import inspect as _inspect
 import itertools as _itertools
+import os as _os
+import sys as _sys
 import types as _types
 import typing as _t
 
 import typing_extensions as _te
 
 from ._core import functional as _functional
-from ._core.signatures import to_signature as _to_signature
+from ._core.signatures import (BindingPlan as _BindingPlan,
+                               signatures_cache as _signatures_cache,
+                               to_signature as _to_signature)
 
 _Arg = _t.TypeVar('_Arg')
 _KwArg = _t.TypeVar('_KwArg')
@@ -28,8 +31,30 @@ def identity(_value: _T) -> _T:
     return _value
 
 
+_capture_location = True
+
+
+def set_location_capture(enabled: bool) -> None:
+    """
+    Sets whether caller location is captured by default
+    when constructing cleavages, combinations & compositions.
+
+    Captured location is used in tracebacks of constructed functions,
+    otherwise they point to the library internals.
+
+    >>> set_location_capture(False)
+    >>> compose(abs, int)('-1')
+    1
+    >>> set_location_capture(True)
+    """
+    global _capture_location
+    _capture_location = enabled
+
+
 def cleave(
-        *functions: _t.Callable[..., _T]
+        *functions: _t.Callable[..., _T],
+        capture_location: _t.Optional[bool] = None,
+        lazy: bool = False
 ) -> _t.Callable[..., _t.Iterable[_T]]:
     """
     Returns function that separately applies
@@ -41,15 +66,15 @@ def cleave(
     >>> list(to_min_and_max(range(0), default=None))
     [None, None]
     """
-    caller_frame_info = _inspect.stack()[1]
     return _functional.Cleavage(*functions,
-                                file_path=caller_frame_info.filename,
-                                line_number=caller_frame_info.lineno,
-                                line_offset=0)
+                                **_to_caller_location(capture_location),
+                                lazy=lazy)
 
 
 def combine(
-        *maps: _t.Callable[[_T], _T2]
+        *maps: _t.Callable[[_T], _T2],
+        capture_location: _t.Optional[bool] = None,
+        lazy: bool = False
 ) -> _t.Callable[..., _t.Tuple[_T2, ...]]:
     """
     Returns function that applies each map to corresponding argument.
@@ -58,17 +83,17 @@ def combine(
     >>> encoder_decoder('hello', b'world')
     (b'hello', 'world')
     """
-    caller_frame_info = _inspect.stack()[1]
     return _functional.Combination(*maps,
-                                   file_path=caller_frame_info.filename,
-                                   line_number=caller_frame_info.lineno,
-                                   line_offset=0)
+                                   **_to_caller_location(capture_location),
+                                   lazy=lazy)
 
 
 def compose(
         _last_function: _t.Callable[[_T2], _T3],
         _penult_function: _t.Callable[..., _T2],
-        *_rest_functions: _t.Callable[..., _t.Any]
+        *_rest_functions: _t.Callable[..., _t.Any],
+        capture_location: _t.Optional[bool] = None,
+        lazy: bool = False
 ) -> _t.Callable[_Params, _T3]:
     """
     Returns functions composition.
@@ -76,30 +101,82 @@ def compose(
     >>> sum_of_first_n_natural_numbers = compose(sum, range)
     >>> sum_of_first_n_natural_numbers(10)
     45
+
+    Lazy composition is compiled on the first call.
+
+    >>> lazy_sum_of_first_n_natural_numbers = compose(sum, range,
+    ...                                               lazy=True)
+    >>> lazy_sum_of_first_n_natural_numbers(10)
+    45
     """
-    caller_frame_info = _inspect.stack()[1]
     return _t.cast(
             _t.Callable[_Params, _T3],
             _functional.Composition(_last_function, _penult_function,
                                     *_rest_functions,
-                                    file_path=caller_frame_info.filename,
-                                    line_number=caller_frame_info.lineno,
-                                    line_offset=0)
+                                    **_to_caller_location(capture_location),
+                                    lazy=lazy)
     )
 
 
+def _to_caller_location(capture: _t.Optional[bool]) -> _t.Dict[str, _t.Any]:
+    if not (_capture_location if capture is None else capture):
+        return {}
+    # unlike `inspect.stack` this does not materialize the whole stack
+    # with source code context, so it takes constant time,
+    # offset skips this function & the factory that called it
+    caller_frame = _sys._getframe(2)
+    return {'file_path': caller_frame.f_code.co_filename,
+            'line_number': caller_frame.f_lineno,
+            'line_offset': 0}
+
+
+@_t.overload
 def curry(
-        _function: _t.Callable[..., _T2]
+        _function: _t.Callable[..., _T2],
+        *,
+        planned: _te.Literal[False] = ...
 ) -> _functional.Curry[_Arg, _KwArg, _T2]:
+    ...
+
+
+@_t.overload
+def curry(
+        _function: _t.Callable[..., _T2],
+        *,
+        planned: _te.Literal[True]
+) -> _functional.PlannedCurry[_Arg, _KwArg, _T2]:
+    ...
+
+
+def curry(
+        _function: _t.Callable[..., _T2],
+        *,
+        planned: bool = False
+) -> _t.Union[_functional.Curry[_Arg, _KwArg, _T2],
+              _functional.PlannedCurry[_Arg, _KwArg, _T2]]:
     """
     Returns curried version of given function.
 
+    By default partial application is detected
+    by calling the function and checking its signature
+    if the call fails with `TypeError`.
+    Planned curried function decides it beforehand
+    based on the number & names of arguments
+    without calling the function.
+
     >>> curried_pow = curry(pow)
     >>> two_to_power = curried_pow(2)
     >>> two_to_power(10)
     1024
+    >>> planned_curried_pow = curry(pow,
+    ...                             planned=True)
+    >>> planned_curried_pow(2)(10)
+    1024
     """
-    return _functional.Curry(_function, _to_signature(_function))
+    signature = _to_signature(_function)
+    return (_functional.PlannedCurry(_function, _BindingPlan(signature))
+            if planned
+            else _functional.Curry(_function, signature))
 
 
 def pack(_function: _t.Callable[_Params, _T2]) -> _t.Callable[[_T, _T2], _T2]:
@@ -152,6 +229,104 @@ def flip(_function: _t.Callable[..., _T2]) -> _t.Callable[..., _T2]:
                    _functional.Flip.from_function(_function))
 
 
+def clear_code_cache() -> None:
+    """
+    Clears cache of code generated for compositions, cleavages & combinations.
+
+    >>> clear_code_cache()
+    >>> code_cache_info().currsize
+    0
+    """
+    _functional._to_function_code.cache_clear()
+
+
+def code_cache_info() -> _functools._CacheInfo:
+    """
+    Returns statistics of cache of code generated
+    for compositions, cleavages & combinations.
+
+    Generated code depends only on the kind & the number of functions
+    and the location of the caller,
+    so it is compiled once and then shared with only functions rebound.
+
+    >>> clear_code_cache()
+    >>> def parse_magnitude(string: str) -> int:
+    ...     return compose(abs, int)(string)
+    >>> parse_magnitude('-1')
+    1
+    >>> parse_magnitude('-2')
+    2
+    >>> cache_info = code_cache_info()
+    >>> cache_info.hits, cache_info.misses
+    (1, 1)
+    """
+    return _functional._to_function_code.cache_info()
+
+
+def clear_signature_cache() -> None:
+    """
+    Clears cache of signatures used by curried functions.
+
+    >>> clear_signature_cache()
+    >>> signature_cache_info().currsize
+    0
+    """
+    _signatures_cache.clear()
+
+
+def signature_cache_info() -> _functools._CacheInfo:
+    """
+    Returns statistics of cache of signatures used by curried functions.
+
+    Signatures of built-ins are held strongly,
+    signatures of other callables are held while callables are alive
+    and are looked up by identity rather than equality,
+    in both cases least recently used ones are evicted.
+
+    >>> clear_signature_cache()
+    >>> curry(pow)(2)(10)
+    1024
+    >>> curry(pow)(3)(2)
+    9
+    >>> cache_info = signature_cache_info()
+    >>> cache_info.hits, cache_info.misses
+    (1, 1)
+    """
+    return _signatures_cache.info()
+
+
+def load_signature_cache(path: _t.Union[str, '_os.PathLike[str]']) -> None:
+    """
+    Loads signatures of built-ins into the cache
+    from the file previously written by `save_signature_cache`,
+    e.g. to avoid their computation in every worker process.
+
+    Loaded file is unpickled, so it should come from a trusted source.
+    """
+    _signatures_cache.load(path)
+
+
+def save_signature_cache(path: _t.Union[str, '_os.PathLike[str]']) -> None:
+    """
+    Saves cached signatures of built-ins to the file
+    which can be loaded with `load_signature_cache`.
+
+    Signatures which can't be pickled are skipped.
+
+    >>> import os, tempfile
+    >>> curry(int)('10')
+    10
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     path = os.path.join(directory, 'signatures.pickle')
+    ...     save_signature_cache(path)
+    ...     clear_signature_cache()
+    ...     load_signature_cache(path)
+    >>> signature_cache_info().currsize > 0
+    True
+    """
+    _signatures_cache.save(path)
+
+
 def flatmap(_function: _t.Callable[[_T], _t.Iterable[_T2]],
             *iterables: _t.Iterable[_T]) -> _t.Iterable[_T2]:
     """
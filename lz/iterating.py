@@ -1,9 +1,18 @@
 import collections as _collections
+import concurrent.futures as _futures
+import contextlib as _contextlib
 import functools as _functools
 import itertools as _itertools
+import multiprocessing as _multiprocessing
+import os as _os
+import queue as _queue
+import threading as _threading
 import typing as _t
 from operator import is_not as _is_not
 
+import typing_extensions as _te
+
+from ._core import arrays as _arrays
 from .functional import flatmap as _flatmap
 
 _T = _t.TypeVar('_T')
@@ -147,14 +156,20 @@ def chop(_iterable: _t.Iterable[_T],
     """
     Splits iterable into chunks of given size.
     """
+    if _arrays.to_numpy_module(_iterable) is not None:
+        # NumPy arrays are not registered as sequences,
+        # but are split by slicing into views
+        yield from _chop_sequence(_t.cast(_t.Sequence[_T], _iterable),
+                                  size=size)
+        return
     iterator = iter(_iterable)
     yield from iter(lambda: tuple(_itertools.islice(iterator, size)), ())
 
 
 @chop.register(_collections.abc.Sequence)
-def _(_iterable: _t.Sequence[_T],
-      *,
-      size: int) -> _t.Iterable[_t.Sequence[_T]]:
+def _chop_sequence(_iterable: _t.Sequence[_T],
+                   *,
+                   size: int) -> _t.Iterable[_t.Sequence[_T]]:
     """
     Splits sequence into chunks of given size.
     """
@@ -275,6 +290,344 @@ def mapper(
                    _functools.partial(map, _map))
 
 
+Backend = _te.Literal['process', 'thread']
+
+
+def parallel_mapper(
+        _map: _t.Callable[[_T], _T2],
+        *,
+        backend: Backend = 'thread',
+        chunk_size: int = 1,
+        max_in_flight: _t.Optional[int] = None,
+        ordered: bool = True,
+        workers_count: _t.Optional[int] = None
+) -> _t.Callable[[_t.Iterable[_T]], _t.Iterable[_T2]]:
+    """
+    Returns function that applies given map to the each element of iterable
+    in parallel using pool of threads or processes.
+
+    Elements are taken from iterable lazily by chunks of given size,
+    at most given number of chunks is processed at once
+    (twice the number of workers by default).
+    Unordered results are produced in chunks completion order.
+
+    >>> to_str = parallel_mapper(str,
+    ...                          chunk_size=3)
+    >>> list(to_str(range(10)))
+    ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9']
+    >>> to_str = parallel_mapper(str,
+    ...                          backend='process',
+    ...                          ordered=False)
+    >>> sorted(to_str(range(10)))
+    ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9']
+    """
+    _validate_parallel_parameters(backend=backend,
+                                  chunk_size=chunk_size,
+                                  max_in_flight=max_in_flight,
+                                  workers_count=workers_count)
+    return _functools.partial(parallel_map, _map,
+                              backend=backend,
+                              chunk_size=chunk_size,
+                              max_in_flight=max_in_flight,
+                              ordered=ordered,
+                              workers_count=workers_count)
+
+
+def parallel_map(_map: _t.Callable[[_T], _T2],
+                 _iterable: _t.Iterable[_T],
+                 *,
+                 backend: Backend = 'thread',
+                 chunk_size: int = 1,
+                 max_in_flight: _t.Optional[int] = None,
+                 ordered: bool = True,
+                 workers_count: _t.Optional[int] = None) -> _t.Iterable[_T2]:
+    """
+    Applies given map to the each element of iterable in parallel.
+    """
+    _validate_parallel_parameters(backend=backend,
+                                  chunk_size=chunk_size,
+                                  max_in_flight=max_in_flight,
+                                  workers_count=workers_count)
+    yield from _itertools.chain.from_iterable(
+            _execute_by_chunks(_functools.partial(_map_chunk, _map),
+                               _iterable,
+                               backend=backend,
+                               chunk_size=chunk_size,
+                               max_in_flight=max_in_flight,
+                               ordered=ordered,
+                               workers_count=workers_count)
+    )
+
+
+def _execute_by_chunks(
+        _function: _t.Callable[[_t.Sequence[_T]], _T2],
+        _iterable: _t.Iterable[_T],
+        *,
+        backend: Backend,
+        chunk_size: int,
+        max_in_flight: _t.Optional[int],
+        ordered: bool,
+        workers_count: _t.Optional[int]
+) -> _t.Iterable[_T2]:
+    if workers_count is None:
+        workers_count = _os.cpu_count() or 1
+    if max_in_flight is None:
+        max_in_flight = 2 * workers_count
+    chunks = chop(_iterable,
+                  size=chunk_size)
+    with _executors_factories[backend](workers_count) as executor:
+        pending: _t.Deque[_futures.Future[_T2]] = _collections.deque(
+                executor.submit(_function, chunk)
+                for chunk in _itertools.islice(chunks, max_in_flight)
+        )
+        try:
+            if ordered:
+                while pending:
+                    result = pending.popleft().result()
+                    for chunk in _itertools.islice(chunks, 1):
+                        pending.append(executor.submit(_function, chunk))
+                    yield result
+            else:
+                while pending:
+                    done, not_done = _futures.wait(
+                            pending,
+                            return_when=_futures.FIRST_COMPLETED
+                    )
+                    pending = _collections.deque(not_done)
+                    pending.extend(
+                            executor.submit(_function, chunk)
+                            for chunk in _itertools.islice(chunks, len(done))
+                    )
+                    for future in done:
+                        yield future.result()
+        finally:
+            # generator can be closed before exhaustion,
+            # so not yet started chunks should not hold the executor
+            for future in pending:
+                future.cancel()
+
+
+def parallel_flatmapper(
+        _map: _t.Callable[[_T], _t.Iterable[_T2]],
+        *,
+        backend: Backend = 'thread',
+        chunk_size: int = 1,
+        max_buffered: int = 1024,
+        max_in_flight: _t.Optional[int] = None,
+        workers_count: _t.Optional[int] = None
+) -> _t.Callable[[_t.Iterable[_T]], _t.Iterable[_T2]]:
+    """
+    Returns function that applies map to the each element of iterable
+    in parallel using pool of threads or processes and flattens results.
+
+    Results of at most given number of elements are computed at once
+    (the number of workers by default),
+    each of them streams its results by chunks of given size
+    buffering at most given number of them,
+    results are produced in input order.
+
+    >>> relay = parallel_flatmapper(range,
+    ...                             max_buffered=2)
+    >>> list(relay(range(5)))
+    [0, 0, 1, 0, 1, 2, 0, 1, 2, 3]
+    >>> relay = parallel_flatmapper(range,
+    ...                             backend='process',
+    ...                             chunk_size=2)
+    >>> list(relay(range(5)))
+    [0, 0, 1, 0, 1, 2, 0, 1, 2, 3]
+    """
+    _validate_parallel_flatmap_parameters(backend=backend,
+                                          chunk_size=chunk_size,
+                                          max_buffered=max_buffered,
+                                          max_in_flight=max_in_flight,
+                                          workers_count=workers_count)
+    return _functools.partial(parallel_flatmap, _map,
+                              backend=backend,
+                              chunk_size=chunk_size,
+                              max_buffered=max_buffered,
+                              max_in_flight=max_in_flight,
+                              workers_count=workers_count)
+
+
+def parallel_flatmap(
+        _map: _t.Callable[[_T], _t.Iterable[_T2]],
+        _iterable: _t.Iterable[_T],
+        *,
+        backend: Backend = 'thread',
+        chunk_size: int = 1,
+        max_buffered: int = 1024,
+        max_in_flight: _t.Optional[int] = None,
+        workers_count: _t.Optional[int] = None
+) -> _t.Iterable[_T2]:
+    """
+    Applies given map to the each element of iterable in parallel
+    and concatenates results into plain iterable.
+    """
+    _validate_parallel_flatmap_parameters(backend=backend,
+                                          chunk_size=chunk_size,
+                                          max_buffered=max_buffered,
+                                          max_in_flight=max_in_flight,
+                                          workers_count=workers_count)
+    if workers_count is None:
+        workers_count = _os.cpu_count() or 1
+    if max_in_flight is None:
+        max_in_flight = workers_count
+    batch_size = min(chunk_size, max_buffered)
+    iterator = iter(_iterable)
+    with _contextlib.ExitStack() as stack:
+        stopped: _t.Any
+        if backend == 'process':
+            manager = stack.enter_context(_multiprocessing.Manager())
+            queue_factory: _t.Callable[[int], _t.Any] = manager.Queue
+            stopped = manager.Event()
+        else:
+            queue_factory, stopped = _queue.Queue, _threading.Event()
+        executor = stack.enter_context(
+                _executors_factories[backend](workers_count)
+        )
+        pending: _t.Deque[_t.Tuple[_t.Any, _futures.Future[None]]] = (
+            _collections.deque()
+        )
+
+        def submit(element: _T) -> None:
+            results_queue = queue_factory(max_buffered // batch_size)
+            pending.append((results_queue,
+                            executor.submit(_expand_into, _map, element,
+                                            results_queue, stopped,
+                                            batch_size)))
+
+        for element in _itertools.islice(iterator, max_in_flight):
+            submit(element)
+        try:
+            while pending:
+                results_queue, future = pending.popleft()
+                while True:
+                    kind, payload = _get_expansion_item(results_queue,
+                                                        future)
+                    if kind == _EXPANSION_BATCH:
+                        yield from payload
+                    elif kind == _EXPANSION_ERROR:
+                        raise payload
+                    else:
+                        break
+                for element in _itertools.islice(iterator, 1):
+                    submit(element)
+        finally:
+            # generator can be closed before exhaustion,
+            # so workers blocked on full buffers should be released
+            stopped.set()
+            for _, future in pending:
+                future.cancel()
+
+
+_EXPANSION_BATCH, _EXPANSION_END, _EXPANSION_ERROR = range(3)
+# period of checking if consumer has stopped by blocked workers
+# & if task has failed by waiting consumer in seconds
+_EXPANSION_POLL_INTERVAL = 0.1
+
+
+def _expand_into(map_: _t.Callable[[_T], _t.Iterable[_T2]],
+                 element: _T,
+                 results_queue: _t.Any,
+                 stopped: _t.Any,
+                 batch_size: int) -> None:
+    try:
+        iterator = iter(map_(element))
+        for batch in iter(lambda: list(_itertools.islice(iterator,
+                                                         batch_size)),
+                          []):
+            if not _put_until_stopped(results_queue,
+                                      (_EXPANSION_BATCH, batch),
+                                      stopped):
+                return
+    except Exception as error:
+        _put_until_stopped(results_queue, (_EXPANSION_ERROR, error),
+                           stopped)
+    else:
+        _put_until_stopped(results_queue, (_EXPANSION_END, None), stopped)
+
+
+def _get_expansion_item(results_queue: _t.Any,
+                        future: _futures.Future[None]) -> _t.Any:
+    while not future.done():
+        try:
+            return results_queue.get(timeout=_EXPANSION_POLL_INTERVAL)
+        except _queue.Empty:
+            continue
+    # finished task has already put all of its items
+    try:
+        return results_queue.get_nowait()
+    except _queue.Empty:
+        pass
+    # task can fail without putting an error,
+    # e.g. when its arguments can not be pickled
+    # or it is interrupted by an exception which is not an `Exception`
+    future.result()
+    return _EXPANSION_END, None
+
+
+def _put_until_stopped(results_queue: _t.Any,
+                       item: _t.Any,
+                       stopped: _t.Any) -> bool:
+    while not stopped.is_set():
+        try:
+            results_queue.put(item,
+                              timeout=_EXPANSION_POLL_INTERVAL)
+        except _queue.Full:
+            continue
+        else:
+            return True
+    return False
+
+
+_executors_factories: _t.Dict[
+    str, _t.Callable[[int], _futures.Executor]
+] = {'process': _futures.ProcessPoolExecutor,
+     'thread': _futures.ThreadPoolExecutor}
+
+
+def _map_chunk(_map: _t.Callable[[_T], _T2],
+               _chunk: _t.Sequence[_T]) -> _t.List[_T2]:
+    return list(map(_map, _chunk))
+
+
+def _validate_parallel_flatmap_parameters(
+        *,
+        backend: str,
+        chunk_size: int,
+        max_buffered: int,
+        max_in_flight: _t.Optional[int],
+        workers_count: _t.Optional[int]
+) -> None:
+    _validate_parallel_parameters(backend=backend,
+                                  chunk_size=chunk_size,
+                                  max_in_flight=max_in_flight,
+                                  workers_count=workers_count)
+    if max_buffered < 1:
+        raise ValueError('Maximum number of buffered results '
+                         f'should be positive, but found {max_buffered}.')
+
+
+def _validate_parallel_parameters(*,
+                                  backend: str,
+                                  chunk_size: int,
+                                  max_in_flight: _t.Optional[int],
+                                  workers_count: _t.Optional[int]) -> None:
+    if backend not in _executors_factories:
+        raise ValueError('Backend should be one of '
+                         f'{", ".join(map(repr, _executors_factories))}, '
+                         f'but found {backend!r}.')
+    if chunk_size < 1:
+        raise ValueError('Chunk size should be positive, '
+                         f'but found {chunk_size}.')
+    if max_in_flight is not None and max_in_flight < 1:
+        raise ValueError('Maximum number of chunks in flight '
+                         f'should be positive, but found {max_in_flight}.')
+    if workers_count is not None and workers_count < 1:
+        raise ValueError('Workers count should be positive, '
+                         f'but found {workers_count}.')
+
+
 def flatmapper(
         _map: _t.Callable[[_T], _t.Iterable[_T2]]
 ) -> _t.Callable[[_t.Iterable[_T]], _t.Iterable[_T2]]:
@@ -1,19 +1,18 @@
 import typing as _t
-from operator import (not_,
-                      xor)
 
 import typing_extensions as _te
 
-from . import left as _left
-from .functional import (cleave as _cleave,
-                         compose as _compose)
+from ._core import logical as _logical
+from .functional import _to_caller_location
 
 _Params = _te.ParamSpec('_Params')
 _T = _t.TypeVar('_T')
 
 
 def conjoin(
-        *predicates: _t.Callable[_Params, bool]
+        *predicates: _t.Callable[_Params, bool],
+        adaptive: bool = False,
+        capture_location: _t.Optional[bool] = None
 ) -> _t.Callable[_Params, bool]:
     """
     Returns conjunction of given predicates.
@@ -23,12 +22,32 @@ def conjoin(
     True
     >>> is_valid_constant_identifier('2ND_SECTION')
     False
+
+    Predicates are evaluated in order until the first falsy result.
+
+    Adaptive conjunction samples cost & selectivity of side-effect free
+    predicates and periodically reorders them
+    to minimize expected evaluation cost.
+
+    >>> is_valid_constant_identifier = conjoin(str.isupper, str.isidentifier,
+    ...                                        adaptive=True)
+    >>> is_valid_constant_identifier('SECOND_SECTION')
+    True
+    >>> is_valid_constant_identifier('2ND_SECTION')
+    False
     """
-    return _compose(all, _cleave(*predicates))
+    location = _to_caller_location(capture_location)
+    return _t.cast(_t.Callable[_Params, bool],
+                   _logical.AdaptiveConjunction(*predicates, **location)
+                   if adaptive
+                   else _logical.Conjunction.from_predicates(*predicates,
+                                                             **location))
 
 
 def disjoin(
-        *predicates: _t.Callable[_Params, bool]
+        *predicates: _t.Callable[_Params, bool],
+        adaptive: bool = False,
+        capture_location: _t.Optional[bool] = None
 ) -> _t.Callable[_Params, bool]:
     """
     Returns disjunction of given predicates.
@@ -40,12 +59,31 @@ def disjoin(
     True
     >>> alphabetic_or_numeric('Hello42')
     False
+
+    Predicates are evaluated in order until the first truthy result.
+
+    Adaptive disjunction samples cost & selectivity of side-effect free
+    predicates and periodically reorders them
+    to minimize expected evaluation cost.
+
+    >>> alphabetic_or_numeric = disjoin(str.isalpha, str.isnumeric,
+    ...                                 adaptive=True)
+    >>> alphabetic_or_numeric('Hello')
+    True
+    >>> alphabetic_or_numeric('Hello42')
+    False
     """
-    return _compose(any, _cleave(*predicates))
+    location = _to_caller_location(capture_location)
+    return _t.cast(_t.Callable[_Params, bool],
+                   _logical.AdaptiveDisjunction(*predicates, **location)
+                   if adaptive
+                   else _logical.Disjunction.from_predicates(*predicates,
+                                                             **location))
 
 
 def exclusive_disjoin(
-        *predicates: _t.Callable[_Params, bool]
+        *predicates: _t.Callable[_Params, bool],
+        capture_location: _t.Optional[bool] = None
 ) -> _t.Callable[_Params, bool]:
     """
     Returns exclusive disjunction of given predicates.
@@ -61,11 +99,18 @@ def exclusive_disjoin(
     >>> valid_object_name('lambda')
     False
     """
-    return _compose(_left.folder(xor, False), _cleave(*predicates))
+    return _t.cast(
+            _t.Callable[_Params, bool],
+            _logical.ExclusiveDisjunction.from_predicates(
+                    *predicates,
+                    **_to_caller_location(capture_location)
+            )
+    )
 
 
 def negate(
-        predicate: _t.Callable[_Params, bool]
+        predicate: _t.Callable[_Params, bool],
+        capture_location: _t.Optional[bool] = None
 ) -> _t.Callable[_Params, bool]:
     """
     Returns negated version of given predicate.
@@ -76,4 +121,35 @@ def negate(
     >>> false_like([0])
     False
     """
-    return _compose(not_, predicate)
+    return _t.cast(_t.Callable[_Params, bool],
+                   predicate.negate()
+                   if isinstance(predicate, _logical.Junction)
+                   else _logical.Conjunction(
+                           predicate,
+                           **_to_caller_location(capture_location),
+                           negated=True
+                   ))
+
+
+def predicates_statistics(
+        junction: _t.Callable[..., bool]
+) -> _t.Sequence[_logical.PredicateStatistics]:
+    """
+    Returns runtime statistics of predicates of given adaptive junction
+    in their current evaluation order.
+
+    >>> from lz.filtration import sifter
+    >>> is_valid_constant_identifier = conjoin(str.isupper, str.isidentifier,
+    ...                                        adaptive=True)
+    >>> to_constants_names = sifter(is_valid_constant_identifier)
+    >>> list(to_constants_names(['FIRST', 'second', '3RD']))
+    ['FIRST']
+    >>> [statistics.predicate
+    ...  for statistics in predicates_statistics(is_valid_constant_identifier)]
+    [<method 'isupper' of 'str' objects>, <method 'isidentifier' of \
+'str' objects>]
+    """
+    if not isinstance(junction, _logical.AdaptiveJunction):
+        raise TypeError('Statistics are gathered only by adaptive junctions, '
+                        f'but found {type(junction).__qualname__!r}.')
+    return junction.statistics
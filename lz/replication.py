@@ -1,8 +1,16 @@
+import array as _array
 import functools as _functools
 import itertools as _itertools
+import pickle as _pickle
+import sys as _sys
 import typing as _t
-from collections import (abc as _abc,
-                         deque as _deque)
+from collections import abc as _abc
+
+import typing_extensions as _te
+
+from ._core import (handoff as _handoff,
+                    spilling as _spilling)
+from ._core.spilling import Serializer as _Serializer
 
 _T = _t.TypeVar('_T')
 
@@ -10,9 +18,27 @@ _T = _t.TypeVar('_T')
 @_functools.singledispatch
 def replicate(_value: _t.Any,
               *,
-              count: int) -> _t.Iterable[_t.Any]:
+              count: int,
+              max_buffered: _t.Optional[int] = None,
+              read_only: bool = False,
+              serializer: _Serializer = _pickle,
+              thread_safe: bool = False) -> _t.Iterable[_t.Any]:
     """
     Returns given number of object replicas.
+
+    Replicas of iterables keep at most given number of buffered elements
+    in memory, the rest are dumped with given serializer
+    to a temporary file and loaded back when replicas reach them.
+
+    Thread-safe replicas of iterables can be consumed from different threads,
+    with given maximum number of buffered elements
+    a replica which runs ahead waits for others to catch up
+    instead of spilling, so each replica should be either consumed or closed.
+
+    Read-only replicas of buffers (``bytearray``, ``array.array``,
+    ``memoryview``) are read-only ``memoryview``s of the original buffer
+    which share its memory, a writable copy of such replica
+    can be made on request with ``bytearray(replica)``.
     """
     raise TypeError('Unsupported object type: {type}.'
                     .format(type=type(_value)))
@@ -26,83 +52,283 @@ _Immutable = _t.TypeVar('_Immutable', bytes, object, str)
 # that can be replicated by simply repeating
 @replicate.register(bytes)
 @replicate.register(str)
-def _(_value: _Immutable, *, count: int) -> _t.Iterable[_Immutable]:
+def _(_value: _Immutable,
+      *,
+      count: int,
+      **_options: _t.Any) -> _t.Iterable[_Immutable]:
     """
     Returns object repeated given number of times.
     """
-    yield from _itertools.repeat(_value, count)
+    # plain iterator is cheaper to keep in buffer than a generator
+    return _itertools.repeat(_value, count)
 
 
 @replicate.register(_abc.Iterable)
-def _replicate_iterable(_value: _t.Iterable[_T],
-                        *,
-                        count: int) -> _t.Iterable[_t.Iterable[_T]]:
+def _replicate_iterable(
+        _value: _t.Iterable[_T],
+        *,
+        count: int,
+        max_buffered: _t.Optional[int] = None,
+        serializer: _Serializer = _pickle,
+        thread_safe: bool = False,
+        **_options: _t.Any
+) -> _t.Iterable[_t.Iterable[_T]]:
     """
     Returns given number of iterable replicas.
     """
+    if thread_safe:
+        fan_out = _handoff.BlockingFanOut(iter(_value), _distribute_copies,
+                                          count=count,
+                                          max_buffered=max_buffered)
+        yield from map(fan_out.stream, range(count))
+        return
+    if max_buffered is not None and max_buffered < 0:
+        raise ValueError('Maximum number of buffered elements '
+                         f'should be non-negative, but found {max_buffered}.')
     iterator = iter(_value)
-    queues: _t.Sequence[_t.Deque[_T]] = [
-        _deque() for _ in _itertools.repeat(None, count)
-    ]
+    # single buffer shared by all replicas with elements
+    # (immutable ones are shared by replicas as is,
+    # copies of others are produced on pulling,
+    # spilled ones are loaded by each replica separately)
+    # & numbers of replicas which have not read them yet,
+    # buffer is indexed by positions of replicas shifted by `offset`
+    # with already read by all replicas prefix of size `start`
+    elements: _t.List[_t.Any] = []
+    copies: _t.List[_t.Optional[_t.Iterator[_T]]] = []
+    unread_counts: _t.List[int] = []
+    offset = start = 0
+    readers_count = count
+    spill_file = (None
+                  if max_buffered is None
+                  else _spilling.SpillFile(serializer))
+    # spilled elements are dumped in order of positions,
+    # so each replica reads them sequentially from its own file offset
+    # which becomes invalid after file is cleared
+    in_memory_count = spilled_count = spill_generation = 0
+
+    def replica() -> _t.Iterable[_T]:
+        nonlocal in_memory_count, readers_count, spilled_count
+        position = offset + start
+        spill_offset, replica_spill_generation = 0, spill_generation
+        try:
+            while True:
+                index = position - offset
+                if index == len(elements):
+                    try:
+                        element = next(iterator)
+                    except StopIteration:
+                        return
+                    if (spill_file is not None
+                            and in_memory_count >= _t.cast(int,
+                                                           max_buffered)):
+                        spill_file.dump(element)
+                        elements.append(None)
+                        copies.append(_spilled_copies)
+                        spilled_count += 1
+                    else:
+                        if _is_immutable(element):
+                            elements.append(element)
+                            copies.append(None)
+                        else:
+                            # copies are made at once
+                            # since iterable can mutate yielded element
+                            elements.append(None)
+                            copies.append(
+                                    iter(list(replicate(element,
+                                                        count=readers_count)))
+                            )
+                        in_memory_count += 1
+                    unread_counts.append(readers_count)
+                element_copies = copies[index]
+                if element_copies is None:
+                    element_copy = elements[index]
+                elif element_copies is _spilled_copies:
+                    assert spill_file is not None
+                    if replica_spill_generation != spill_generation:
+                        spill_offset, replica_spill_generation = (
+                            0, spill_generation
+                        )
+                    (element_copy,), spill_offset = spill_file.load(
+                            spill_offset, 1
+                    )
+                else:
+                    element_copy = next(element_copies)
+                position += 1
+                unread_count = unread_counts[index] - 1
+                unread_counts[index] = unread_count
+                if not unread_count:
+                    release()
+                yield element_copy
+        finally:
+            # unread elements should not wait for the finished replica
+            readers_count -= 1
+            for index in range(position - offset, len(elements)):
+                unread_counts[index] -= 1
+            release()
+            if not readers_count and spill_file is not None:
+                spill_file.close()
+
+    def release() -> None:
+        nonlocal in_memory_count, offset, spill_generation, spilled_count
+        nonlocal start
+        while start < len(elements) and not unread_counts[start]:
+            if copies[start] is _spilled_copies:
+                spilled_count -= 1
+                if not spilled_count:
+                    assert spill_file is not None
+                    spill_file.clear()
+                    spill_generation += 1
+            else:
+                in_memory_count -= 1
+            elements[start] = copies[start] = None
+            start += 1
+        if start > len(elements) // 2:
+            del elements[:start], copies[:start], unread_counts[:start]
+            offset += start
+            start = 0
+
+    for _ in _itertools.repeat(None, count):
+        yield replica()
+
+
+_spilled_copies: _t.Iterator[_t.Any] = iter(())
+
+
+def _distribute_copies(
+        _element: _T, _indices: _t.Sequence[int]
+) -> _t.Iterable[_t.Tuple[int, _T]]:
+    return zip(_indices, replicate(_element,
+                                   count=len(_indices)))
+
 
-    def replica(queue: _t.Deque[_T]) -> _t.Iterable[_T]:
-        while True:
-            if not queue:
-                try:
-                    element = next(iterator)
-                except StopIteration:
-                    return
-                element_copies = replicate(element,
-                                           count=count)
-                for sub_queue, element_copy in zip(queues, element_copies):
-                    sub_queue.append(element_copy)
-            yield queue.popleft()
+_IMMUTABLE_SCALARS_TYPES = frozenset({bool, bytes, complex, float, int, str,
+                                      type(None), type(Ellipsis)})
+_FROZEN_CONTAINERS_TYPES = frozenset({frozenset, tuple})
+_IMMUTABLE_TYPES = _IMMUTABLE_SCALARS_TYPES | _FROZEN_CONTAINERS_TYPES
 
-    yield from map(replica, queues)
+
+def _is_immutable(_value: _t.Any) -> bool:
+    # exact types are checked since subclasses can add mutable state
+    value_type = type(_value)
+    return (value_type in _IMMUTABLE_SCALARS_TYPES
+            or (value_type in _FROZEN_CONTAINERS_TYPES
+                and all(map(_is_immutable, _value))))
 
 
 @replicate.register(bytearray)
 def _(_value: bytearray,
       *,
-      count: int) -> _t.Iterable[bytearray]:
+      count: int,
+      read_only: bool = False,
+      **_options: _t.Any) -> _t.Iterable[_t.Union[bytearray, memoryview]]:
+    return (_to_read_only_views(_value,
+                                count=count)
+            if read_only
+            else (_value[:] for _ in _itertools.repeat(None, count)))
+
+
+@replicate.register(_array.array)
+def _(_value: '_array.array[_t.Any]',
+      *,
+      count: int,
+      read_only: bool = False,
+      **_options: _t.Any
+) -> _t.Iterable[_t.Union['_array.array[_t.Any]', memoryview]]:
+    return (_to_read_only_views(_value,
+                                count=count)
+            if read_only
+            else (_value[:] for _ in _itertools.repeat(None, count)))
+
+
+@replicate.register(memoryview)
+def _(_value: memoryview,
+      *,
+      count: int,
+      read_only: bool = False,
+      **_options: _t.Any) -> _t.Iterable[memoryview]:
+    return (_to_read_only_views(_value,
+                                count=count)
+            if read_only
+            else (_copy_memoryview(_value)
+                  for _ in _itertools.repeat(None, count)))
+
+
+def _copy_memoryview(_value: memoryview) -> memoryview:
+    result = memoryview(bytearray(_value.tobytes()))
+    if _value.format == 'B' and _value.ndim == 1:
+        return result
+    # format is checked by `memoryview.cast` at runtime
+    format_ = _t.cast(_te.Literal['B'], _value.format)
+    return result.cast(format_, _t.cast(_t.Tuple[int, ...], _value.shape))
+
+
+if _sys.version_info < (3, 8):
+    def _to_read_only_view(_value: _t.Any) -> memoryview:
+        view = memoryview(_value)
+        # read-only views can be made only from immutable objects
+        return view if view.readonly else memoryview(view.tobytes())
+else:
+    def _to_read_only_view(_value: _t.Any) -> memoryview:
+        return memoryview(_value).toreadonly()
+
+
+def _to_read_only_views(_value: _t.Any,
+                        *,
+                        count: int) -> _t.Iterable[memoryview]:
+    # each replica is a separate view,
+    # so releasing one of them does not affect others
     for _ in _itertools.repeat(None, count):
-        yield _value[:]
+        yield _to_read_only_view(_value)
 
 
 @replicate.register(frozenset)
 def _(_value: _t.FrozenSet[_T],
       *,
-      count: int) -> _t.Iterable[_t.FrozenSet[_T]]:
-    for replica in _replicate_iterable(_value,
-                                       count=count):
-        yield frozenset(replica)
+      count: int,
+      **_options: _t.Any) -> _t.Iterable[_t.FrozenSet[_T]]:
+    if _are_immutable(_value):
+        yield from _itertools.repeat(_value, count)
+    else:
+        yield from map(frozenset, _replicate_elements(_value,
+                                                      count=count))
 
 
 @replicate.register(list)
 def _(_value: _t.List[_T],
       *,
-      count: int) -> _t.Iterable[_t.List[_T]]:
-    for replica in _replicate_iterable(_value,
-                                       count=count):
-        yield list(replica)
+      count: int,
+      **_options: _t.Any) -> _t.Iterable[_t.List[_T]]:
+    if _are_immutable(_value):
+        for _ in _itertools.repeat(None, count):
+            yield _value.copy()
+    else:
+        yield from _replicate_elements(_value,
+                                       count=count)
 
 
 @replicate.register(set)
 def _(_value: _t.Set[_T],
       *,
-      count: int) -> _t.Iterable[_t.Set[_T]]:
-    for replica in _replicate_iterable(_value,
-                                       count=count):
-        yield set(replica)
+      count: int,
+      **_options: _t.Any) -> _t.Iterable[_t.Set[_T]]:
+    if _are_immutable(_value):
+        for _ in _itertools.repeat(None, count):
+            yield _value.copy()
+    else:
+        yield from map(set, _replicate_elements(_value,
+                                                count=count))
 
 
 @replicate.register(tuple)
 def _(_value: _t.Tuple[_T, ...],
       *,
-      count: int) -> _t.Iterable[_t.Tuple[_T, ...]]:
-    for replica in _replicate_iterable(_value,
-                                       count=count):
-        yield tuple(replica)
+      count: int,
+      **_options: _t.Any) -> _t.Iterable[_t.Tuple[_T, ...]]:
+    if _are_immutable(_value):
+        yield from _itertools.repeat(_value, count)
+    else:
+        yield from map(tuple, _replicate_elements(_value,
+                                                  count=count))
 
 
 _Key = _t.TypeVar('_Key')
@@ -112,22 +338,107 @@ _Value = _t.TypeVar('_Value')
 @replicate.register(dict)
 def _(_value: _t.Dict[_Key, _Value],
       *,
-      count: int) -> _t.Iterable[_t.Dict[_Key, _Value]]:
-    for replica in _replicate_iterable(_value.items(),
-                                       count=count):
-        yield dict(replica)
+      count: int,
+      **_options: _t.Any) -> _t.Iterable[_t.Dict[_Key, _Value]]:
+    if _are_immutable(_value.values()):
+        for _ in _itertools.repeat(None, count):
+            yield _value.copy()
+        return
+    # keys are hashable, so their replicas are indistinguishable
+    # and can be shared
+    replicas: _t.List[_t.Dict[_Key, _Value]] = [
+        {} for _ in _itertools.repeat(None, count)
+    ]
+    for key, value in _value.items():
+        if _is_immutable(value):
+            for replica in replicas:
+                replica[key] = value
+        else:
+            for replica, value_copy in zip(replicas,
+                                           replicate(value,
+                                                     count=count)):
+                replica[key] = value_copy
+    yield from replicas
+
 
+def _are_immutable(_values: _t.Iterable[_t.Any]) -> bool:
+    values_types = set(map(type, _values))
+    return (values_types <= _IMMUTABLE_SCALARS_TYPES
+            or (values_types <= _IMMUTABLE_TYPES
+                and all(map(_is_immutable, _values))))
 
-def replicator(count: int) -> _t.Callable[[_T], _t.Iterable[_T]]:
+
+def _replicate_elements(_value: _t.Iterable[_T],
+                        *,
+                        count: int) -> _t.List[_t.List[_T]]:
+    # all replicas are filled during a single traversal
+    replicas: _t.List[_t.List[_T]] = [
+        [] for _ in _itertools.repeat(None, count)
+    ]
+    appenders = [replica.append for replica in replicas]
+    for element in _value:
+        if _is_immutable(element):
+            for append in appenders:
+                append(element)
+        else:
+            for append, element_copy in zip(appenders,
+                                            replicate(element,
+                                                      count=count)):
+                append(element_copy)
+    return replicas
+
+
+def replicator(
+        count: int,
+        *,
+        max_buffered: _t.Optional[int] = None,
+        read_only: bool = False,
+        serializer: _Serializer = _pickle,
+        thread_safe: bool = False
+) -> _t.Callable[[_T], _t.Iterable[_T]]:
     """
     Returns function that replicates passed object.
 
     >>> triplicate = replicator(3)
     >>> list(map(tuple, triplicate(range(5))))
     [(0, 1, 2, 3, 4), (0, 1, 2, 3, 4), (0, 1, 2, 3, 4)]
+
+    With given maximum number of buffered elements
+    replicas of iterables spill the rest to a temporary file.
+
+    >>> original, copy = replicator(2, max_buffered=2)(iter(range(5)))
+    >>> list(original), list(copy)
+    ([0, 1, 2, 3, 4], [0, 1, 2, 3, 4])
+
+    Read-only replicas of buffers share memory of the original.
+
+    >>> buffer = bytearray(b'buffer')
+    >>> first_view, second_view = replicator(2, read_only=True)(buffer)
+    >>> first_view.obj is second_view.obj is buffer
+    True
+    >>> bytes(first_view)
+    b'buffer'
+
+    Thread-safe replicas can be consumed concurrently.
+
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> replicas = replicator(2, max_buffered=16,
+    ...                       thread_safe=True)(iter(range(100)))
+    >>> with ThreadPoolExecutor() as executor:
+    ...     list(executor.map(sum, replicas))
+    [4950, 4950]
     """
+    options: _t.Dict[str, _t.Any] = {}
+    if max_buffered is not None:
+        options.update(max_buffered=max_buffered,
+                       serializer=serializer)
+    if read_only:
+        options.update(read_only=read_only)
+    if thread_safe:
+        options.update(thread_safe=thread_safe)
     return _functools.partial(replicate,
-                              count=count)
+                              count=count,
+                              **options)
 
 
 duplicate = replicator(2)
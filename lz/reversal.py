@@ -1,14 +1,15 @@
 import codecs as _codecs
 import functools as _functools
 import io as _io
-import itertools as _itertools
-import operator as _operator
+import mmap as _mmap
+import os as _os
+import stat as _stat
 import typing as _t
 from collections import abc as _abc
 
-from lz._core.arithmetical import ceil_division as _ceil_division
-from lz._core.textual import (code_units_sizes as _code_units_sizes,
-                              read_batch_from_end as _read_batch_from_end)
+from lz._core.textual import code_units_sizes as _code_units_sizes
+from lz.iterating import (Backend as _Backend,
+                          parallel_map as _parallel_map)
 
 _T = _t.TypeVar('_T')
 
@@ -49,7 +50,9 @@ def reverse_file_object(_value: _t.TextIO,
                         *,
                         batch_size: int = _io.DEFAULT_BUFFER_SIZE,
                         lines_separator: _t.Optional[str] = None,
-                        keep_lines_separator: bool = True) -> _t.Iterable[str]:
+                        keep_lines_separator: bool = True,
+                        max_batch_size: _t.Optional[int] = None,
+                        parallel: bool = False) -> _t.Iterable[str]:
     """
     Returns reversed file object.
     """
@@ -61,92 +64,753 @@ def reverse_file_object(_value: _t.TextIO,
     yield from map(
             _functools.partial(_codecs.decode,
                                encoding=encoding),
-            reverse_bytes_stream(_value.buffer,
-                                 batch_size=batch_size,
-                                 lines_separator=bytes_lines_separator,
-                                 keep_lines_separator=keep_lines_separator,
-                                 code_unit_size=code_unit_size)
+            reverse_binary_file(_value.buffer,
+                                batch_size=batch_size,
+                                lines_separator=bytes_lines_separator,
+                                keep_lines_separator=keep_lines_separator,
+                                code_unit_size=code_unit_size,
+                                max_batch_size=max_batch_size,
+                                parallel=parallel)
     )
 
 
-@reverse.register(_io.BufferedReader)
 @reverse.register(_io.BytesIO)
 def reverse_bytes_stream(_value: _t.BinaryIO,
                          *,
                          batch_size: int = _io.DEFAULT_BUFFER_SIZE,
                          lines_separator: _t.Optional[bytes] = None,
                          keep_lines_separator: bool = True,
-                         code_unit_size: int = 1) -> _t.Iterable[bytes]:
+                         code_unit_size: int = 1,
+                         max_batch_size: _t.Optional[int] = None
+                         ) -> _t.Iterable[bytes]:
     """
     Returns reversed byte stream.
+
+    Custom lines separator is matched like by ``bytes.split``,
+    i.e. from the start of the stream,
+    even though the stream is read from the end.
+
+    If maximum batch size is given, batches grow twice each time
+    from the batch size up to it,
+    and streams backed by file descriptors are read with positional reads
+    after advising the kernel of the backward access pattern.
     """
-    lines_separators: _t.Union[bytes, _t.Tuple[bytes, ...]]
-    lines_splitter: _t.Callable[[bytes], _t.List[bytes]]
-    if lines_separator is None:
-        lines_separators = (b'\r', b'\n', b'\r\n')
-        lines_splitter = _operator.methodcaller(bytes.splitlines.__name__,
-                                                keep_lines_separator)
+    _validate_batches_sizes(batch_size, max_batch_size)
+    size = _value.seek(0, _io.SEEK_END)
+    file_descriptor = (None
+                       if max_batch_size is None
+                       else _to_file_descriptor(_value))
+    # windows are read into the same buffer
+    # which fits the largest of them
+    buffer = bytearray((batch_size
+                        if max_batch_size is None
+                        else max_batch_size)
+                       + _to_overlap(lines_separator))
+    read_batch: _t.Callable[[int, int], bytearray]
+    prefetch: _t.Optional[_t.Callable[[int, int], None]]
+    if file_descriptor is None:
+        read_batch = _functools.partial(_read_batch_into, _value, buffer)
+        prefetch = None
     else:
-        lines_separators = lines_separator
-        _separator = lines_separator
-
-        def lines_splitter(byte_sequence: bytes,
-                           separator: bytes = _separator) -> _t.List[bytes]:
-            result: _t.List[bytes] = []
-            part = bytearray()
-            offset = 0
-            add_part = result.append
-            while offset < len(byte_sequence):
-                if (byte_sequence[offset:offset + len(separator)]
-                        != separator):
-                    part += byte_sequence[offset:offset + code_unit_size]
-                    offset += code_unit_size
+        read_batch = _functools.partial(_read_file_batch_into,
+                                        file_descriptor, buffer)
+        prefetch = _functools.partial(_advise_file, file_descriptor,
+                                      advice=_POSIX_FADV_WILLNEED)
+        # kernel readahead goes forward, so it is disabled
+        # for the contents to be read
+        _advise_file(file_descriptor, 0, size, _POSIX_FADV_RANDOM)
+    try:
+        # lines are not views, so they are `bytes`
+        yield from _t.cast(_t.Iterable[bytes], _reverse_windows(
+                read_batch, size,
+                batch_size=batch_size,
+                max_batch_size=max_batch_size,
+                lines_separator=lines_separator,
+                keep_lines_separator=keep_lines_separator,
+                code_unit_size=code_unit_size,
+                prefetch=prefetch
+        ))
+    finally:
+        if file_descriptor is not None:
+            _advise_file(file_descriptor, 0, size, _POSIX_FADV_NORMAL)
+
+
+def _read_batch(stream: _t.BinaryIO, start: int, size: int) -> bytes:
+    stream.seek(start)
+    return stream.read(size)
+
+
+def _validate_batches_sizes(batch_size: int,
+                            max_batch_size: _t.Optional[int]) -> None:
+    if max_batch_size is not None and max_batch_size < batch_size:
+        raise ValueError('Maximum batch size should not be less '
+                         f'than batch size {batch_size}, '
+                         f'but found {max_batch_size}.')
+
+
+def _read_batch_into(stream: _t.BinaryIO,
+                     buffer: bytearray,
+                     start: int,
+                     size: int) -> bytearray:
+    stream.seek(start)
+    read_into = _t.cast(_io.BufferedIOBase, stream).readinto
+    with memoryview(buffer) as view:
+        offset = 0
+        while offset < size:
+            # reads can be short, e.g. for raw streams
+            count = read_into(view[offset:size])
+            if not count:
+                break
+            offset += count
+    return buffer
+
+
+def _read_file_batch_into(file_descriptor: int,
+                          buffer: bytearray,
+                          start: int,
+                          size: int) -> bytearray:
+    with memoryview(buffer) as view:
+        offset = 0
+        while offset < size:
+            count = _pread_into(file_descriptor, view[offset:size],
+                                start + offset)
+            if not count:
+                break
+            offset += count
+    return buffer
+
+
+if hasattr(_os, 'preadv'):
+    def _pread_into(file_descriptor: int,
+                    view: memoryview,
+                    offset: int) -> int:
+        return _os.preadv(file_descriptor, [view], offset)
+else:
+    def _pread_into(file_descriptor: int,
+                    view: memoryview,
+                    offset: int) -> int:
+        chunk = _os.pread(file_descriptor, len(view), offset)
+        view[:len(chunk)] = chunk
+        return len(chunk)
+
+
+def _read_file_batch(file_descriptor: int, start: int, size: int) -> bytes:
+    result = _os.pread(file_descriptor, size, start)
+    while len(result) < size:
+        # reads can be short, e.g. on network filesystems
+        chunk = _os.pread(file_descriptor, size - len(result),
+                          start + len(result))
+        if not chunk:
+            break
+        result += chunk
+    return result
+
+
+def _to_file_descriptor(stream: _t.BinaryIO) -> _t.Optional[int]:
+    if not hasattr(_os, 'pread'):
+        return None
+    try:
+        return stream.fileno()
+    except (OSError, ValueError):
+        return None
+
+
+if hasattr(_os, 'posix_fadvise'):
+    _POSIX_FADV_NORMAL, _POSIX_FADV_RANDOM, _POSIX_FADV_WILLNEED = (
+        _os.POSIX_FADV_NORMAL, _os.POSIX_FADV_RANDOM, _os.POSIX_FADV_WILLNEED
+    )
+
+    def _advise_file(file_descriptor: int,
+                     offset: int,
+                     size: int,
+                     advice: int) -> None:
+        try:
+            _os.posix_fadvise(file_descriptor, offset, size, advice)
+        except OSError:
+            # advice is optional, e.g. it is not supported for pipes
+            pass
+else:
+    _POSIX_FADV_NORMAL = _POSIX_FADV_RANDOM = _POSIX_FADV_WILLNEED = 0
+
+    def _advise_file(file_descriptor: int,
+                     offset: int,
+                     size: int,
+                     advice: int) -> None:
+        pass
+
+
+_Window = _t.Union[bytes, bytearray, _mmap.mmap]
+_Line = _t.Union[bytes, memoryview]
+# finds the first line start in a window after which lines are known
+# to be split like the whole file, returns -1 if there is no such one
+_FindLinesStart = _t.Callable[..., int]
+# splits window into lines with separators starting before given stop,
+# returns them along with the stop of the last one
+_Split = _t.Callable[..., _t.Tuple[_t.List[bytes], int]]
+
+
+def _reverse_windows(read_window: _t.Callable[[int, int], _Window],
+                     size: int,
+                     *,
+                     batch_size: int,
+                     max_batch_size: _t.Optional[int],
+                     lines_separator: _t.Optional[bytes],
+                     keep_lines_separator: bool,
+                     code_unit_size: int,
+                     alignment: int = 1,
+                     prefetch: _t.Optional[_t.Callable[[int, int], None]]
+                     = None,
+                     views: bool = False) -> _t.Iterable[_Line]:
+    # windows are read from the end along with few first bytes
+    # of the part following them to find separators crossing their bounds,
+    # lines of a window are split from its first line start
+    # which does not depend on preceding contents,
+    # part preceding it is kept until previous line start is found,
+    # windows start at multiples of given alignment
+    overlap, find_lines_start, split = _to_lines_handlers(
+            lines_separator,
+            code_unit_size=code_unit_size
+    )
+    split_reversed = _functools.partial(_split_reversed, split,
+                                        keep=keep_lines_separator,
+                                        views=views)
+    position = size
+    # chunks of part which follows current window and is not split yet,
+    # in reversed order
+    tail_chunks: _t.List[bytes] = []
+    is_tail_last, tail_size = True, 0
+    while position:
+        start = max(position - batch_size, 0) // alignment * alignment
+        stop = position - start
+        window_size = stop + min(overlap, tail_size)
+        window = read_window(start, window_size)
+        lines_start = (find_lines_start(window, stop, window_size,
+                                        offset=start)
+                       if start
+                       else 0)
+        if lines_start < 0:
+            tail_chunks.append(_to_bytes(window, 0, stop))
+            tail_size += stop
+        else:
+            lines, lines_stop = split_reversed(window, lines_start, stop,
+                                               window_size,
+                                               offset=start,
+                                               is_last=False)
+            if tail_chunks:
+                if lines_stop > stop:
+                    # last separator of the window crosses its bound
+                    tail = b''.join(reversed(tail_chunks))
+                    rest = tail[lines_stop - stop:]
+                    tail_chunks = ([_to_bytes(window, 0, lines_start)]
+                                   if lines_start <= stop
+                                   else [tail[:lines_start - stop],
+                                         _to_bytes(window, 0, stop)])
                 else:
-                    add_part(part + keep_lines_separator * separator)
-                    part.clear()
-                    offset += len(separator)
-            add_part(part)
-            return result
-    stream_size = _value.seek(0, _io.SEEK_END)
-    batches_count = _ceil_division(stream_size, batch_size)
-    remaining_bytes_indicator = _itertools.islice(
-            _itertools.accumulate(
-                    _itertools.chain([stream_size],
-                                     _itertools.repeat(batch_size)),
-                    _operator.sub
-            ),
-            batches_count
+                    with memoryview(window) as view:
+                        rest = b''.join([view[lines_stop:stop],
+                                         *reversed(tail_chunks)])
+                    tail_chunks = [_to_bytes(window, 0, lines_start)]
+                yield from split_reversed(rest, 0, len(rest), len(rest),
+                                          offset=start + lines_stop,
+                                          is_last=is_tail_last)[0]
+            else:
+                yield from split_reversed(window, lines_stop, stop, stop,
+                                          offset=start,
+                                          is_last=is_tail_last)[0]
+                tail_chunks = [_to_bytes(window, 0, lines_start)]
+            yield from lines
+            is_tail_last, tail_size = False, lines_start
+        position = start
+        if max_batch_size is not None:
+            batch_size = min(2 * batch_size, max_batch_size)
+            if prefetch is not None and start:
+                # next window is fetched while this one is processed
+                prefetch(max(start - batch_size, 0), min(batch_size, start))
+
+
+def _to_bytes(window: _Window, start: int, stop: int) -> bytes:
+    with memoryview(window) as view:
+        return bytes(view[start:stop])
+
+
+def _split_reversed(split: _Split,
+                    window: _Window,
+                    start: int,
+                    stop: int,
+                    size: int,
+                    *,
+                    keep: bool,
+                    offset: int,
+                    is_last: bool,
+                    views: bool) -> _t.Tuple[_t.List[_Line], int]:
+    lines, lines_stop = split(window, start, stop, size,
+                              keep=keep,
+                              offset=offset,
+                              is_last=is_last)
+    result: _t.List[_Line]
+    if views:
+        # lines are sliced from the window one by one instead of copying
+        view = memoryview(window)
+        result = []
+        lines_with_separators = (lines
+                                 if keep
+                                 else split(window, start, stop, size,
+                                            keep=True,
+                                            offset=offset,
+                                            is_last=is_last)[0])
+        for line, line_with_separator in zip(lines, lines_with_separators):
+            result.append(view[start:start + len(line)])
+            start += len(line_with_separator)
+    else:
+        result = _t.cast(_t.List[_Line], lines)
+    result.reverse()
+    return result, lines_stop
+
+
+def _to_overlap(lines_separator: _t.Optional[bytes]) -> int:
+    # "\r\n" is a single line break,
+    # so one byte of the following part is needed,
+    # occurrences of the separator starting inside of the window
+    # should be checked against the ones preceding them
+    return (1
+            if lines_separator is None
+            else 2 * len(lines_separator) - 2)
+
+
+def _to_lines_handlers(lines_separator: _t.Optional[bytes],
+                       *,
+                       code_unit_size: int
+                       ) -> _t.Tuple[int, _FindLinesStart, _Split]:
+    overlap = _to_overlap(lines_separator)
+    if lines_separator is None:
+        return overlap, _find_lines_start, _split_lines
+    return (overlap,
+            _functools.partial(_find_parts_start,
+                               separator=lines_separator,
+                               code_unit_size=code_unit_size),
+            _functools.partial(_split_parts,
+                               separator=lines_separator,
+                               code_unit_size=code_unit_size))
+
+
+def _find_lines_start(window: _Window,
+                      stop: int,
+                      size: int,
+                      *,
+                      offset: int) -> int:
+    # line breaks are unambiguous,
+    # so any line start which is not the window start is suitable
+    line_feed_index = window.find(b'\n', 0, stop)
+    index = window.find(b'\r', 0, stop)
+    if index < 0 or 0 <= line_feed_index < index:
+        index = line_feed_index
+    elif window[index + 1:min(index + 2, size)] in (b'\n', b''):
+        # "\r" followed by "\n" is a part of "\r\n",
+        # the one at the end of the file starts no line
+        index = line_feed_index
+    return index + 1 if index >= 0 else -1
+
+
+def _split_lines(window: _Window,
+                 start: int,
+                 stop: int,
+                 size: int,
+                 *,
+                 keep: bool,
+                 offset: int,
+                 is_last: bool) -> _t.Tuple[_t.List[bytes], int]:
+    # follows `bytes.splitlines` with "\n", "\r" & "\r\n" line breaks
+    if is_last:
+        lines_stop = size
+    else:
+        index = max(window.rfind(b'\n', start, stop),
+                    window.rfind(b'\r', start, stop))
+        if index < 0:
+            return [], start
+        lines_stop = (index + 2
+                      if window[index:min(index + 2, size)] == b'\r\n'
+                      else index + 1)
+    return _to_bytes(window, start, lines_stop).splitlines(keep), lines_stop
+
+
+def _find_parts_start(window: _Window,
+                      stop: int,
+                      size: int,
+                      *,
+                      separator: bytes,
+                      code_unit_size: int,
+                      offset: int) -> int:
+    # occurrence of the separator is matched by `bytes.split`
+    # whatever precedes it if no other occurrence starts inside of it
+    # (then the search from the start of the sequence
+    # can not skip it by matching the overlapping one),
+    # so it is the first one in the window which can be checked
+    previous_index = -len(separator)
+    index = _find_aligned(window, separator, 0, size, code_unit_size,
+                          offset=offset)
+    while 0 <= index < stop + len(separator) - 1:
+        if (index >= len(separator) - 1
+                and index - previous_index >= len(separator)):
+            return index + len(separator)
+        previous_index = index
+        index = _find_aligned(window, separator, index + 1, size,
+                              code_unit_size,
+                              offset=offset)
+    return -1
+
+
+def _split_parts(window: _Window,
+                 start: int,
+                 stop: int,
+                 size: int,
+                 *,
+                 separator: bytes,
+                 code_unit_size: int,
+                 keep: bool,
+                 offset: int,
+                 is_last: bool) -> _t.Tuple[_t.List[bytes], int]:
+    # separators are matched from the start like by `bytes.split`
+    chunk_stop = (size
+                  if is_last
+                  else max(min(stop + len(separator) - 1, size), start))
+    chunk = _to_bytes(window, start, chunk_stop)
+    parts = (chunk.split(separator)
+             if code_unit_size == 1
+             else _split_aligned(chunk, separator, code_unit_size,
+                                 offset=offset + start))
+    last_part = parts.pop()
+    if keep:
+        parts = [part + separator for part in parts]
+    if is_last:
+        parts.append(last_part)
+        return parts, size
+    return parts, chunk_stop - len(last_part)
+
+
+def _split_aligned(byte_sequence: bytes,
+                   separator: bytes,
+                   code_unit_size: int,
+                   *,
+                   offset: int) -> _t.List[bytes]:
+    # separator should start at the boundary of a code unit
+    # with sequence starting from given offset in the stream
+    result: _t.List[bytes] = []
+    start = 0
+    while True:
+        index = _find_aligned(byte_sequence, separator, start,
+                              len(byte_sequence), code_unit_size,
+                              offset=offset)
+        if index < 0:
+            break
+        result.append(byte_sequence[start:index])
+        start = index + len(separator)
+    result.append(byte_sequence[start:])
+    return result
+
+
+def _find_aligned(byte_sequence: _Window,
+                  separator: bytes,
+                  start: int,
+                  stop: int,
+                  code_unit_size: int,
+                  *,
+                  offset: int) -> int:
+    index = byte_sequence.find(separator, start, stop)
+    while index >= 0 and (offset + index) % code_unit_size:
+        index = byte_sequence.find(separator, index + 1, stop)
+    return index
+
+
+def _rfind_aligned(byte_sequence: _Window,
+                   separator: bytes,
+                   stop: int,
+                   code_unit_size: int,
+                   *,
+                   offset: int,
+                   start: int = 0) -> int:
+    while True:
+        index = byte_sequence.rfind(separator, start, stop)
+        if index < 0 or not (offset + index) % code_unit_size:
+            return index
+        stop = index + len(separator) - 1
+
+
+@reverse.register(_io.BufferedReader)
+@reverse.register(_io.FileIO)
+def reverse_binary_file(
+        _value: _t.BinaryIO,
+        *,
+        batch_size: int = _io.DEFAULT_BUFFER_SIZE,
+        lines_separator: _t.Optional[bytes] = None,
+        keep_lines_separator: bool = True,
+        code_unit_size: int = 1,
+        max_batch_size: _t.Optional[int] = None,
+        parallel: bool = False,
+        views: bool = False
+) -> _t.Iterable[_t.Union[bytes, memoryview]]:
+    """
+    Returns reversed binary file.
+
+    Regular files are memory-mapped by windows instead of being read,
+    in parallel mode they are reversed by segments in a pool of threads
+    (which have fixed size, so maximum batch size is not supported).
+    """
+    lines: _t.Iterable[bytes]
+    if not _is_regular_file(_value):
+        lines = reverse_bytes_stream(
+                _value,
+                batch_size=batch_size,
+                lines_separator=lines_separator,
+                keep_lines_separator=keep_lines_separator,
+                code_unit_size=code_unit_size,
+                max_batch_size=max_batch_size
+        )
+    elif parallel:
+        if max_batch_size is not None:
+            raise ValueError('Maximum batch size is not supported '
+                             'for parallel reversal of regular files.')
+        lines = reverse_segmented_file(
+                _value,
+                lines_separator=lines_separator,
+                keep_lines_separator=keep_lines_separator,
+                code_unit_size=code_unit_size
+        )
+    else:
+        yield from reverse_mapped_file(
+                _value,
+                batch_size=batch_size,
+                lines_separator=lines_separator,
+                keep_lines_separator=keep_lines_separator,
+                code_unit_size=code_unit_size,
+                max_batch_size=max_batch_size,
+                views=views
+        )
+        return
+    if views:
+        yield from (memoryview(line) for line in lines)
+    else:
+        yield from lines
+
+
+def reverse_mapped_file(
+        _value: _t.BinaryIO,
+        *,
+        batch_size: int = _io.DEFAULT_BUFFER_SIZE,
+        lines_separator: _t.Optional[bytes] = None,
+        keep_lines_separator: bool = True,
+        code_unit_size: int = 1,
+        max_batch_size: _t.Optional[int] = None,
+        views: bool = False
+) -> _t.Iterable[_t.Union[bytes, memoryview]]:
+    """
+    Returns reversed lines of regular file memory-mapped by windows.
+
+    Windows are mapped from the end of the file one at a time,
+    they have at least given batch size
+    and start at multiples of ``mmap.ALLOCATIONGRANULARITY``.
+    If maximum batch size is given, windows grow like batches
+    in ``reverse_bytes_stream`` and the kernel is advised
+    to fetch the next window while the current one is processed.
+    Separators are matched like in ``reverse_bytes_stream``,
+    lines are produced as ``bytes`` or as ``memoryview``s
+    which are zero-copy unless lines cross windows bounds
+    (and keep their window mapped until they are released).
+
+    >>> import tempfile
+    >>> with tempfile.TemporaryFile() as file:
+    ...     _ = file.write(b'Hello\\nWorld!')
+    ...     file.flush()
+    ...     list(reverse_mapped_file(file))
+    [b'World!', b'Hello\\n']
+    """
+    _validate_batches_sizes(batch_size, max_batch_size)
+    file_descriptor = _value.fileno()
+    size = _os.fstat(file_descriptor).st_size
+    yield from _reverse_windows(
+            _functools.partial(_map_window, file_descriptor), size,
+            batch_size=batch_size,
+            max_batch_size=max_batch_size,
+            lines_separator=lines_separator,
+            keep_lines_separator=keep_lines_separator,
+            code_unit_size=code_unit_size,
+            alignment=_mmap.ALLOCATIONGRANULARITY,
+            prefetch=(None
+                      if max_batch_size is None
+                      else _functools.partial(_advise_file, file_descriptor,
+                                              advice=_POSIX_FADV_WILLNEED)),
+            views=views
     )
-    try:
-        remaining_bytes_count = next(remaining_bytes_indicator)
-    except StopIteration:
+
+
+def _map_window(file_descriptor: int, start: int, size: int) -> _mmap.mmap:
+    # window is unmapped when there are no references to it left
+    return _mmap.mmap(file_descriptor, size,
+                      access=_mmap.ACCESS_READ,
+                      offset=start)
+
+
+def reverse_segmented_file(
+        _value: _t.BinaryIO,
+        *,
+        backend: _Backend = 'thread',
+        lines_separator: _t.Optional[bytes] = None,
+        keep_lines_separator: bool = True,
+        code_unit_size: int = 1,
+        max_in_flight: _t.Optional[int] = None,
+        segment_size: int = 2 ** 24,
+        workers_count: _t.Optional[int] = None
+) -> _t.Iterable[bytes]:
+    """
+    Returns reversed lines of regular file
+    reversing its segments in parallel using pool of threads or processes.
+
+    File is split from the end into segments of at least given size
+    which start at lines bounds,
+    at most given number of segments is reversed at once
+    (twice the number of workers by default).
+    Threads read segments with positional reads,
+    processes (and threads on platforms without them)
+    reopen the file by its name.
+
+    >>> import tempfile
+    >>> with tempfile.TemporaryFile() as file:
+    ...     _ = file.write(b'Hello\\nWorld!\\n' * 2)
+    ...     file.flush()
+    ...     list(reverse_segmented_file(file,
+    ...                                 segment_size=5))
+    [b'World!\\n', b'Hello\\n', b'World!\\n', b'Hello\\n']
+    """
+    if segment_size < 1:
+        raise ValueError('Segment size should be positive, '
+                         f'but found {segment_size}.')
+    size = _os.fstat(_value.fileno()).st_size
+    if not size:
         return
+    mapped = _mmap.mmap(_value.fileno(), 0,
+                        access=_mmap.ACCESS_READ)
+    try:
+        find_segment_start: _t.Callable[[int], int] = (
+            _functools.partial(_find_line_start, mapped)
+            if lines_separator is None
+            else _functools.partial(_find_part_start, mapped,
+                                    separator=lines_separator,
+                                    code_unit_size=code_unit_size)
+        )
+        read_batch: _t.Callable[[int, int], bytes]
+        if backend == 'thread' and hasattr(_os, 'pread'):
+            read_batch = _functools.partial(_read_file_batch,
+                                            _value.fileno())
+        elif isinstance(_value.name, str):
+            read_batch = _functools.partial(_read_path_batch, _value.name)
+        else:
+            raise ValueError('File should have a path to be reopened '
+                             f'by workers, but found name {_value.name!r}.')
+        _, _, split = _to_lines_handlers(lines_separator,
+                                         code_unit_size=code_unit_size)
+        segments_lines = _parallel_map(
+                _functools.partial(_reverse_segment, read_batch,
+                                   size=size,
+                                   split=split,
+                                   keep=keep_lines_separator),
+                _to_reversed_segments_bounds(find_segment_start, size,
+                                             segment_size=segment_size),
+                backend=backend,
+                max_in_flight=max_in_flight,
+                workers_count=workers_count
+        )
+        for segment_lines in segments_lines:
+            yield from segment_lines
+    finally:
+        mapped.close()
 
-    def read_batch(position: int) -> bytes:
-        result = _read_batch_from_end(_value,
-                                      size=batch_size,
-                                      end_position=position)
-        while result.startswith(lines_separators):
-            try:
-                position = next(remaining_bytes_indicator)
-            except StopIteration:
-                break
-            result = (_read_batch_from_end(_value,
-                                           size=batch_size,
-                                           end_position=position)
-                      + result)
-        return result
-
-    batch = read_batch(remaining_bytes_count)
-    segment, *lines = lines_splitter(batch)
-    yield from reverse(lines)
-    for remaining_bytes_count in remaining_bytes_indicator:
-        batch = read_batch(remaining_bytes_count)
-        lines = lines_splitter(batch)
-        if batch.endswith(lines_separators):
-            yield segment
+
+def _is_regular_file(_value: _t.BinaryIO) -> bool:
+    try:
+        file_descriptor = _value.fileno()
+    except (OSError, ValueError):
+        return False
+    return _stat.S_ISREG(_os.fstat(file_descriptor).st_mode)
+
+
+def _find_line_start(mapped: _mmap.mmap, stop: int) -> int:
+    # line breaks are searched backwards by growing windows
+    # skipping "\r" which is followed by "\n" at the stop
+    window_stop, window_size = stop, _io.DEFAULT_BUFFER_SIZE
+    while window_stop:
+        window_start = max(window_stop - window_size, 0)
+        index = max(mapped.rfind(b'\n', window_start, window_stop),
+                    mapped.rfind(b'\r', window_start, window_stop))
+        if index < 0:
+            window_stop, window_size = window_start, 2 * window_size
+        elif index == stop - 1 and mapped[index:index + 2] == b'\r\n':
+            window_stop = index
+        else:
+            return index + 1
+    return 0
+
+
+def _find_part_start(mapped: _mmap.mmap,
+                     stop: int,
+                     *,
+                     separator: bytes,
+                     code_unit_size: int) -> int:
+    # separator is searched backwards by growing windows
+    # which overlap to find separators crossing their bounds,
+    # occurrence is matched from the start for sure
+    # only if no other one starts inside of it
+    # (like in `_find_parts_start`)
+    window_stop, window_size = stop, _io.DEFAULT_BUFFER_SIZE
+    search_stop = stop
+    while window_stop:
+        window_start = max(window_stop - window_size, 0)
+        index = _rfind_aligned(mapped, separator, search_stop,
+                               code_unit_size,
+                               offset=0,
+                               start=window_start)
+        if index < 0:
+            window_stop, window_size = window_start, 2 * window_size
+            search_stop = min(window_stop + len(separator) - 1, stop)
+        elif _rfind_aligned(mapped, separator,
+                            index + len(separator) - 1,
+                            code_unit_size,
+                            offset=0,
+                            start=max(index - len(separator) + 1, 0)) < 0:
+            return index + len(separator)
         else:
-            lines[-1] += segment
-        segment, *lines = lines
-        yield from reverse(lines)
-    yield segment
+            search_stop = index + len(separator) - 1
+    return 0
+
+
+def _to_reversed_segments_bounds(
+        find_segment_start: _t.Callable[[int], int],
+        size: int,
+        *,
+        segment_size: int
+) -> _t.Iterable[_t.Tuple[int, int]]:
+    stop = size
+    while stop:
+        start = find_segment_start(max(stop - segment_size, 0))
+        yield start, stop
+        stop = start
+
+
+def _reverse_segment(read_batch: _t.Callable[[int, int], bytes],
+                     bounds: _t.Tuple[int, int],
+                     *,
+                     size: int,
+                     split: _Split,
+                     keep: bool) -> _t.List[bytes]:
+    start, stop = bounds
+    batch = read_batch(start, stop - start)
+    # segments start & end at lines bounds
+    result, _ = split(batch, 0, len(batch), len(batch),
+                      keep=keep,
+                      offset=start,
+                      is_last=stop == size)
+    result.reverse()
+    return result
+
+
+def _read_path_batch(path: str, start: int, size: int) -> bytes:
+    with open(path, 'rb') as file:
+        return _read_batch(file, start, size)
@@ -0,0 +1,82 @@
+from functools import partial
+from operator import gt
+from typing import (Any,
+                    Callable,
+                    Iterable,
+                    List,
+                    Sequence,
+                    Tuple)
+
+from hypothesis import strategies
+
+from tests.strategies import (false_predicates,
+                              iterables,
+                              predicates,
+                              true_predicates)
+
+false_predicates = false_predicates
+iterables = iterables
+predicates = predicates
+true_predicates = true_predicates
+integers_lists = strategies.lists(strategies.integers())
+maxes_buffered = strategies.integers(0, 10)
+positive_maxes_buffered = strategies.integers(1, 10)
+
+
+def to_less_than(threshold: int) -> Callable[[int], bool]:
+    return partial(gt, threshold)
+
+
+monotone_predicates = strategies.integers().map(to_less_than)
+sorted_integers_lists = strategies.lists(strategies.integers()).map(sorted)
+
+
+def to_remainder(number: int,
+                 *,
+                 modulus: int) -> int:
+    return number % modulus
+
+
+def to_partition_key(
+        modulus: int
+) -> Tuple[Callable[[int], int], Sequence[int]]:
+    return partial(to_remainder,
+                   modulus=modulus), range(modulus)
+
+
+partition_keys = strategies.integers(1, 5).map(to_partition_key)
+
+
+def is_even(number: int) -> bool:
+    return number % 2 == 0
+
+
+def is_odd(number: int) -> bool:
+    return number % 2 == 1
+
+
+def are_even(numbers: Iterable[int]) -> List[bool]:
+    return [is_even(number) for number in numbers]
+
+
+def are_odd(numbers: Iterable[int]) -> List[bool]:
+    return [is_odd(number) for number in numbers]
+
+
+def to_even_mask(numbers: Any) -> Any:
+    # vectorized for NumPy arrays
+    return numbers % 2 == 0
+
+
+def to_odd_mask(numbers: Any) -> Any:
+    # vectorized for NumPy arrays
+    return numbers % 2 == 1
+
+
+int32_lists = strategies.lists(strategies.integers(-2 ** 31, 2 ** 31 - 1))
+batches_sizes = strategies.integers(1, 10)
+masks_predicates = strategies.sampled_from([(are_even, is_even),
+                                            (are_odd, is_odd)])
+vectorized_masks_predicates = strategies.sampled_from([
+    (to_even_mask, is_even), (to_odd_mask, is_odd)
+])
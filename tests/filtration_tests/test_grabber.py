@@ -1,16 +1,17 @@
 from typing import (Callable,
-                    Iterable)
+                    Iterable,
+                    List)
 
 import pytest
 from hypothesis import given
 
 from lz.filtration import grabber
 from lz.replication import duplicate
-from tests import strategies
 from tests.hints import Domain
 from tests.utils import (are_iterables_similar,
                          are_objects_similar,
                          is_empty)
+from . import strategies
 
 
 @given(strategies.iterables)
@@ -49,3 +50,16 @@ def test_true_predicate(iterable: Iterable[Domain],
     result = grab_all(target)
 
     assert are_iterables_similar(result, original)
+
+
+@given(strategies.sorted_integers_lists, strategies.monotone_predicates)
+def test_monotone(elements: List[int],
+                  monotone_predicate: Callable[[int], bool]) -> None:
+    grab = grabber(monotone_predicate)
+    monotone_grab = grabber(monotone_predicate,
+                            monotone=True)
+
+    result = monotone_grab(elements)
+
+    assert isinstance(result, list)
+    assert result == list(grab(elements))
@@ -1,16 +1,17 @@
 from typing import (Callable,
-                    Iterable)
+                    Iterable,
+                    List)
 
 import pytest
 from hypothesis import given
 
 from lz.filtration import kicker
 from lz.replication import duplicate
-from tests import strategies
 from tests.hints import Domain
 from tests.utils import (are_iterables_similar,
                          are_objects_similar,
                          is_empty)
+from . import strategies
 
 
 @given(strategies.iterables)
@@ -54,3 +55,16 @@ def test_true_predicate(iterable: Iterable[Domain],
     result = kick_all(iterable)
 
     assert is_empty(result)
+
+
+@given(strategies.sorted_integers_lists, strategies.monotone_predicates)
+def test_monotone(elements: List[int],
+                  monotone_predicate: Callable[[int], bool]) -> None:
+    kick = kicker(monotone_predicate)
+    monotone_kick = kicker(monotone_predicate,
+                           monotone=True)
+
+    result = monotone_kick(elements)
+
+    assert isinstance(result, list)
+    assert result == list(kick(elements))
@@ -0,0 +1,126 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import (Callable,
+                    List,
+                    Sequence,
+                    Tuple)
+
+import pytest
+from hypothesis import given
+
+from lz.filtration import partitioner
+from . import strategies
+
+PartitionKey = Tuple[Callable[[int], int], Sequence[int]]
+
+
+@given(strategies.integers_lists, strategies.partition_keys)
+def test_keys(elements: List[int], partition_key: PartitionKey) -> None:
+    key, keys = partition_key
+    partition = partitioner(key,
+                            keys=keys)
+
+    result = partition(elements)
+
+    assert [list(part) for part in result] == [
+        [element for element in elements if key(element) == part_key]
+        for part_key in keys
+    ]
+
+
+@given(strategies.integers_lists, strategies.partition_keys)
+def test_discovered_keys(elements: List[int],
+                         partition_key: PartitionKey) -> None:
+    key, _ = partition_key
+    partition = partitioner(key)
+
+    result = partition(elements)
+
+    assert list(result) == list(dict.fromkeys(map(key, elements)))
+    assert {part_key: list(part) for part_key, part in result.items()} == {
+        part_key: [element for element in elements if key(element) == part_key]
+        for part_key in map(key, elements)
+    }
+
+
+@given(strategies.integers_lists, strategies.partition_keys,
+       strategies.maxes_buffered)
+def test_spilling(elements: List[int],
+                  partition_key: PartitionKey,
+                  max_buffered: int) -> None:
+    key, keys = partition_key
+    partition = partitioner(key,
+                            keys=keys)
+    spilling_partition = partitioner(key,
+                                     keys=keys,
+                                     max_buffered=max_buffered)
+
+    result = partition(elements)
+    spilling_result = spilling_partition(elements)
+
+    assert ([list(part) for part in reversed(spilling_result)]
+            == [list(part) for part in reversed(result)])
+
+
+@given(strategies.integers_lists, strategies.partition_keys,
+       strategies.positive_maxes_buffered)
+def test_thread_safe(elements: List[int],
+                     partition_key: PartitionKey,
+                     max_buffered: int) -> None:
+    key, keys = partition_key
+    partition = partitioner(key,
+                            keys=keys)
+    thread_safe_partition = partitioner(key,
+                                        keys=keys,
+                                        max_buffered=max_buffered,
+                                        thread_safe=True)
+
+    result = partition(elements)
+    with ThreadPoolExecutor(len(keys)) as executor:
+        thread_safe_result = list(executor.map(
+                list, thread_safe_partition(elements)
+        ))
+
+    assert thread_safe_result == [list(part) for part in result]
+
+
+@given(strategies.integers_lists, strategies.partition_keys,
+       strategies.positive_maxes_buffered)
+def test_thread_safe_closed_before_start(elements: List[int],
+                                         partition_key: PartitionKey,
+                                         max_buffered: int) -> None:
+    key, keys = partition_key
+    thread_safe_partition = partitioner(key,
+                                        keys=keys,
+                                        max_buffered=max_buffered,
+                                        thread_safe=True)
+
+    first_part, *rest_parts = thread_safe_partition(elements)
+    for part in rest_parts:
+        part.close()
+
+    assert list(first_part) == [element
+                                for element in elements
+                                if key(element) == keys[0]]
+
+
+@given(strategies.integers_lists, strategies.partition_keys)
+def test_unknown_keys(elements: List[int],
+                      partition_key: PartitionKey) -> None:
+    key, keys = partition_key
+    known_keys = keys[:-1]
+    partition = partitioner(key,
+                            keys=known_keys)
+    thread_safe_partition = partitioner(key,
+                                        keys=known_keys,
+                                        thread_safe=True)
+
+    for result in (partition(elements), thread_safe_partition(elements)):
+        if all(key(element) in known_keys for element in elements):
+            assert [list(part) for part in result] == [
+                [element for element in elements if key(element) == part_key]
+                for part_key in known_keys
+            ]
+        else:
+            for part in result:
+                with pytest.raises(ValueError):
+                    list(part)
@@ -1,14 +1,23 @@
+from array import array
+from itertools import (chain,
+                       filterfalse)
 from operator import not_
 from typing import (Any,
                     Callable,
-                    Iterable)
+                    Iterable,
+                    List,
+                    Tuple)
 
+import pytest
 from hypothesis import given
 
 from lz.filtration import scavenger
+from lz.iterating import chop
 from lz.logical import negate
-from tests import strategies
 from tests.hints import Domain
+from . import strategies
+
+MaskPredicate = Tuple[Callable[[Any], Any], Callable[[int], bool]]
 
 
 @given(strategies.iterables)
@@ -28,3 +37,38 @@ def test_custom_predicate(iterable: Iterable[Domain],
     result = scavenge(iterable)
 
     assert all(map(negate(predicate), result))
+
+
+@given(strategies.int32_lists, strategies.batches_sizes,
+       strategies.masks_predicates)
+def test_batched(elements: List[int],
+                 size: int,
+                 mask_predicate: MaskPredicate) -> None:
+    mask, predicate = mask_predicate
+    scavenge = scavenger(mask,
+                         batched=True)
+
+    result = list(scavenge(chop(array('i', elements),
+                                size=size)))
+
+    assert all(isinstance(batch, array) for batch in result)
+    assert list(chain.from_iterable(result)) == list(filterfalse(predicate,
+                                                                 elements))
+
+
+@given(strategies.int32_lists, strategies.batches_sizes,
+       strategies.vectorized_masks_predicates)
+def test_batched_numpy_arrays(elements: List[int],
+                              size: int,
+                              mask_predicate: MaskPredicate) -> None:
+    numpy = pytest.importorskip('numpy')
+    mask, predicate = mask_predicate
+    scavenge = scavenger(mask,
+                         batched=True)
+
+    result = list(scavenge(chop(numpy.array(elements, dtype=numpy.int64),
+                                size=size)))
+
+    assert all(isinstance(batch, numpy.ndarray) for batch in result)
+    assert list(chain.from_iterable(result)) == list(filterfalse(predicate,
+                                                                 elements))
@@ -1,14 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
 from operator import not_
 from typing import (Any,
                     Callable,
-                    Iterable)
+                    Iterable,
+                    List)
 
 from hypothesis import given
 
 from lz.filtration import separator
 from lz.logical import negate
-from tests import strategies
 from tests.hints import Domain
+from . import strategies
 
 
 @given(strategies.iterables)
@@ -30,3 +32,70 @@ def test_custom_predicate(iterable: Iterable[Domain],
 
     assert all(map(negate(predicate), dissatisfied))
     assert all(map(predicate, satisfied))
+
+
+@given(strategies.predicates, strategies.integers_lists,
+       strategies.maxes_buffered)
+def test_spilling(predicate: Callable[[Domain], bool],
+                  elements: List[int],
+                  max_buffered: int) -> None:
+    separate = separator(predicate)
+    spilling_separate = separator(predicate,
+                                  max_buffered=max_buffered)
+
+    dissatisfied, satisfied = separate(elements)
+    spilling_dissatisfied, spilling_satisfied = spilling_separate(elements)
+
+    assert list(spilling_satisfied) == list(satisfied)
+    assert list(spilling_dissatisfied) == list(dissatisfied)
+
+
+@given(strategies.predicates, strategies.integers_lists,
+       strategies.positive_maxes_buffered)
+def test_thread_safe(predicate: Callable[[Domain], bool],
+                     elements: List[int],
+                     max_buffered: int) -> None:
+    separate = separator(predicate)
+    thread_safe_separate = separator(predicate,
+                                     max_buffered=max_buffered,
+                                     thread_safe=True)
+
+    dissatisfied, satisfied = separate(elements)
+    with ThreadPoolExecutor(2) as executor:
+        thread_safe_dissatisfied, thread_safe_satisfied = executor.map(
+                list, thread_safe_separate(elements)
+        )
+
+    assert thread_safe_satisfied == list(satisfied)
+    assert thread_safe_dissatisfied == list(dissatisfied)
+
+
+@given(strategies.predicates, strategies.integers_lists,
+       strategies.positive_maxes_buffered)
+def test_thread_safe_closed_before_start(predicate: Callable[[Domain], bool],
+                                         elements: List[int],
+                                         max_buffered: int) -> None:
+    thread_safe_separate = separator(predicate,
+                                     max_buffered=max_buffered,
+                                     thread_safe=True)
+
+    dissatisfied, satisfied = thread_safe_separate(elements)
+    dissatisfied.close()
+
+    assert list(satisfied) == [element
+                               for element in elements
+                               if predicate(element)]
+
+
+@given(strategies.predicates, strategies.integers_lists)
+def test_pure(predicate: Callable[[Domain], bool],
+              elements: List[int]) -> None:
+    separate = separator(predicate)
+    pure_separate = separator(predicate,
+                              pure=True)
+
+    dissatisfied, satisfied = separate(elements)
+    pure_dissatisfied, pure_satisfied = pure_separate(elements)
+
+    assert list(pure_satisfied) == list(satisfied)
+    assert list(pure_dissatisfied) == list(dissatisfied)
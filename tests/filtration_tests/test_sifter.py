@@ -1,12 +1,20 @@
+from array import array
+from itertools import chain
 from typing import (Any,
                     Callable,
-                    Iterable)
+                    Iterable,
+                    List,
+                    Tuple)
 
+import pytest
 from hypothesis import given
 
 from lz.filtration import sifter
-from tests import strategies
+from lz.iterating import chop
 from tests.hints import Domain
+from . import strategies
+
+MaskPredicate = Tuple[Callable[[Any], Any], Callable[[int], bool]]
 
 
 @given(strategies.iterables)
@@ -26,3 +34,38 @@ def test_custom_predicate(iterable: Iterable[Domain],
     result = sift(iterable)
 
     assert all(map(predicate, result))
+
+
+@given(strategies.int32_lists, strategies.batches_sizes,
+       strategies.masks_predicates)
+def test_batched(elements: List[int],
+                 size: int,
+                 mask_predicate: MaskPredicate) -> None:
+    mask, predicate = mask_predicate
+    sift = sifter(mask,
+                  batched=True)
+
+    result = list(sift(chop(array('i', elements),
+                            size=size)))
+
+    assert all(isinstance(batch, array) for batch in result)
+    assert list(chain.from_iterable(result)) == list(filter(predicate,
+                                                            elements))
+
+
+@given(strategies.int32_lists, strategies.batches_sizes,
+       strategies.vectorized_masks_predicates)
+def test_batched_numpy_arrays(elements: List[int],
+                              size: int,
+                              mask_predicate: MaskPredicate) -> None:
+    numpy = pytest.importorskip('numpy')
+    mask, predicate = mask_predicate
+    sift = sifter(mask,
+                  batched=True)
+
+    result = list(sift(chop(numpy.array(elements, dtype=numpy.int64),
+                            size=size)))
+
+    assert all(isinstance(batch, numpy.ndarray) for batch in result)
+    assert list(chain.from_iterable(result)) == list(filter(predicate,
+                                                            elements))
@@ -0,0 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+
+from hypothesis import given
+
+from lz.functional import cleave
+from tests.hints import CleavageCall
+from tests.utils import (are_iterables_similar,
+                         round_trip_pickle)
+from . import strategies
+
+
+@given(strategies.cleavage_calls)
+def test_basic(cleavage_call: CleavageCall) -> None:
+    maps, argument = cleavage_call
+    cleavage = cleave(*maps)
+    lazy_cleavage = cleave(*maps,
+                           lazy=True)
+
+    result = lazy_cleavage(argument)
+
+    assert are_iterables_similar(result, cleavage(argument))
+
+
+@given(strategies.cleavage_calls)
+def test_concurrent_first_calls(cleavage_call: CleavageCall) -> None:
+    maps, argument = cleavage_call
+    cleavage = cleave(*maps)
+    lazy_cleavage = cleave(*maps,
+                           lazy=True)
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lazy_cleavage, repeat(argument, 16)))
+
+    assert all(are_iterables_similar(result, cleavage(argument))
+               for result in results)
+
+
+@given(strategies.cleavage_calls)
+def test_pickle(cleavage_call: CleavageCall) -> None:
+    maps, argument = cleavage_call
+    cleavage = cleave(*maps)
+    lazy_cleavage = cleave(*maps,
+                           lazy=True)
+
+    result = round_trip_pickle(cleavage)
+    lazy_result = round_trip_pickle(lazy_cleavage)
+
+    assert hasattr(result, '_function')
+    assert not hasattr(lazy_result, '_function')
+    assert repr(result) == repr(cleavage)
+    assert repr(lazy_result) == repr(lazy_cleavage)
+    assert are_iterables_similar(lazy_result(argument), cleavage(argument))
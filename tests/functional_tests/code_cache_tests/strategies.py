@@ -0,0 +1,13 @@
+from hypothesis import strategies
+
+from tests.strategies import (maps,
+                              maps_arguments,
+                              to_homogeneous_sequences)
+
+maps_pairs_calls = strategies.tuples(
+        strategies.tuples(to_homogeneous_sequences(maps,
+                                                   min_size=1),
+                          to_homogeneous_sequences(maps,
+                                                   min_size=1)),
+        maps_arguments
+)
@@ -0,0 +1,40 @@
+from typing import (Any,
+                    Callable,
+                    Sequence,
+                    Tuple)
+
+from hypothesis import given
+
+from lz.functional import (cleave,
+                           clear_code_cache,
+                           code_cache_info)
+from . import strategies
+
+
+@given(strategies.maps_pairs_calls)
+def test_reuse(maps_pairs_call: Tuple[Tuple[Sequence[Callable[[Any], Any]],
+                                            Sequence[Callable[[Any], Any]]],
+                                      Any]) -> None:
+    maps_pair, argument = maps_pairs_call
+    first_maps, second_maps = (maps_pair[0],
+                               maps_pair[1][:1] * len(maps_pair[0]))
+    clear_code_cache()
+
+    first_cleavage, second_cleavage = [cleave(*maps_)
+                                       for maps_ in (first_maps, second_maps)]
+
+    cache_info = code_cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 1)
+    assert tuple(first_cleavage(argument)) == tuple(map_(argument)
+                                                    for map_ in first_maps)
+    assert tuple(second_cleavage(argument)) == tuple(map_(argument)
+                                                     for map_ in second_maps)
+
+
+def test_clear() -> None:
+    cleave(abs)
+
+    clear_code_cache()
+
+    cache_info = code_cache_info()
+    assert cache_info.hits == cache_info.misses == cache_info.currsize == 0
@@ -0,0 +1,55 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from hypothesis import given
+
+from lz.functional import combine
+from tests.hints import CombinationCall
+from tests.utils import (are_iterables_similar,
+                         round_trip_pickle)
+from . import strategies
+
+
+@given(strategies.combinations_calls)
+def test_basic(combination_call: CombinationCall) -> None:
+    maps, arguments = combination_call
+    combination = combine(*maps)
+    lazy_combination = combine(*maps,
+                               lazy=True)
+
+    result = lazy_combination(*arguments)
+
+    assert are_iterables_similar(result, combination(*arguments))
+
+
+@given(strategies.combinations_calls)
+def test_concurrent_first_calls(combination_call: CombinationCall) -> None:
+    maps, arguments = combination_call
+    combination = combine(*maps)
+    lazy_combination = combine(*maps,
+                               lazy=True)
+
+    with ThreadPoolExecutor(4) as executor:
+        futures = [executor.submit(lazy_combination, *arguments)
+                   for _ in range(16)]
+    results = [future.result() for future in futures]
+
+    assert all(are_iterables_similar(result, combination(*arguments))
+               for result in results)
+
+
+@given(strategies.combinations_calls)
+def test_pickle(combination_call: CombinationCall) -> None:
+    maps, arguments = combination_call
+    combination = combine(*maps)
+    lazy_combination = combine(*maps,
+                               lazy=True)
+
+    result = round_trip_pickle(combination)
+    lazy_result = round_trip_pickle(lazy_combination)
+
+    assert hasattr(result, '_function')
+    assert not hasattr(lazy_result, '_function')
+    assert repr(result) == repr(combination)
+    assert repr(lazy_result) == repr(lazy_combination)
+    assert are_iterables_similar(lazy_result(*arguments),
+                                 combination(*arguments))
@@ -0,0 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+
+from hypothesis import given
+
+from lz.functional import compose
+from tests.hints import CompositionCall
+from tests.utils import round_trip_pickle
+from . import strategies
+
+
+@given(strategies.two_or_more_maps_calls)
+def test_basic(maps_chain_call: CompositionCall) -> None:
+    various_suitable_maps, map_argument = maps_chain_call
+    composition = compose(*various_suitable_maps)
+    lazy_composition = compose(*various_suitable_maps,
+                               lazy=True)
+
+    result = lazy_composition(map_argument)
+
+    assert result == composition(map_argument)
+
+
+@given(strategies.two_or_more_maps_calls)
+def test_concurrent_first_calls(maps_chain_call: CompositionCall) -> None:
+    various_suitable_maps, map_argument = maps_chain_call
+    composition = compose(*various_suitable_maps)
+    lazy_composition = compose(*various_suitable_maps,
+                               lazy=True)
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lazy_composition,
+                                    repeat(map_argument, 16)))
+
+    assert results == [composition(map_argument)] * len(results)
+
+
+@given(strategies.two_or_more_maps_calls)
+def test_pickle(maps_chain_call: CompositionCall) -> None:
+    various_suitable_maps, map_argument = maps_chain_call
+    composition = compose(*various_suitable_maps)
+    lazy_composition = compose(*various_suitable_maps,
+                               lazy=True)
+
+    result = round_trip_pickle(composition)
+    lazy_result = round_trip_pickle(lazy_composition)
+
+    assert hasattr(result, '_function')
+    assert not hasattr(lazy_result, '_function')
+    assert repr(result) == repr(composition)
+    assert repr(lazy_result) == repr(lazy_composition)
+    assert (result(map_argument) == lazy_result(map_argument)
+            == composition(map_argument))
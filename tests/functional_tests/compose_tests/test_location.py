@@ -0,0 +1,58 @@
+import traceback
+from typing import Set
+
+import pytest
+from hypothesis import given
+
+from lz.functional import (compose,
+                           set_location_capture)
+from tests.hints import CompositionCall
+from . import strategies
+
+
+@given(strategies.two_maps_calls)
+def test_capture(maps_chain_call: CompositionCall) -> None:
+    various_suitable_maps, map_argument = maps_chain_call
+    composition = compose(fail, *various_suitable_maps)
+
+    with pytest.raises(ValueError) as error_info:
+        composition(map_argument)
+
+    assert __file__ in to_files_names(error_info.value)
+
+
+@given(strategies.two_maps_calls)
+def test_no_capture(maps_chain_call: CompositionCall) -> None:
+    various_suitable_maps, map_argument = maps_chain_call
+    composition = compose(fail, *various_suitable_maps,
+                          capture_location=False)
+
+    with pytest.raises(ValueError) as error_info:
+        composition(map_argument)
+
+    assert __file__ not in to_files_names(error_info.value)
+
+
+@given(strategies.two_maps_calls)
+def test_global_setting(maps_chain_call: CompositionCall) -> None:
+    various_suitable_maps, map_argument = maps_chain_call
+    set_location_capture(False)
+    try:
+        composition = compose(fail, *various_suitable_maps)
+    finally:
+        set_location_capture(True)
+
+    with pytest.raises(ValueError) as error_info:
+        composition(map_argument)
+
+    assert __file__ not in to_files_names(error_info.value)
+
+
+def fail(*_: object) -> None:
+    raise ValueError()
+
+
+def to_files_names(error: BaseException) -> Set[str]:
+    return {frame_summary.filename
+            for frame_summary in traceback.extract_tb(error.__traceback__)
+            if frame_summary.name == 'composition'}
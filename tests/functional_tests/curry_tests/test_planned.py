@@ -0,0 +1,94 @@
+import pytest
+from hypothesis import given
+
+from lz._core.functional import (Curry,
+                                 PlannedCurry)
+from lz.functional import curry
+from tests import strategies
+from tests.hints import (FunctionCall,
+                         PartitionedFunctionCall)
+from tests.utils import round_trip_pickle
+
+
+@given(strategies.transparent_functions_calls)
+def test_valid_call(function_call: FunctionCall) -> None:
+    function, args, kwargs = function_call
+    curried = curry(function,
+                    planned=True)
+
+    result = curried(*args, **kwargs)
+
+    assert result == function(*args, **kwargs)
+
+
+@given(strategies.partitioned_transparent_functions_calls)
+def test_partial_application(
+        partitioned_function_call: PartitionedFunctionCall
+) -> None:
+    (function,
+     (first_args_part, second_args_part),
+     (first_kwargs_part, second_kwargs_part)) = partitioned_function_call
+    curried = curry(function)
+    planned_curried = curry(function,
+                            planned=True)
+
+    try:
+        expected = curried(*first_args_part, **first_kwargs_part)
+    except TypeError:
+        with pytest.raises(TypeError):
+            planned_curried(*first_args_part, **first_kwargs_part)
+    else:
+        if isinstance(expected, Curry):
+            try:
+                result = planned_curried(*first_args_part,
+                                         **first_kwargs_part)
+            except TypeError:
+                # unlike probing, planning does not distinguish overloads
+                # by arguments types, only by their number & names,
+                # so it fails early for arguments
+                # which eager curry rejects on completion
+                with pytest.raises(TypeError):
+                    expected(*second_args_part, **second_kwargs_part)
+            else:
+                assert isinstance(result, PlannedCurry)
+                assert (result(*second_args_part, **second_kwargs_part)
+                        == expected(*second_args_part,
+                                    **second_kwargs_part))
+        else:
+            result = planned_curried(*first_args_part, **first_kwargs_part)
+            assert result == expected
+
+
+@given(strategies.non_variadic_transparent_functions_calls_with_invalid_args)
+def test_invalid_args_call(
+        function_call_with_invalid_args: FunctionCall
+) -> None:
+    function, invalid_args, kwargs = function_call_with_invalid_args
+    curried = curry(function,
+                    planned=True)
+
+    with pytest.raises(TypeError):
+        curried(*invalid_args, **kwargs)
+
+
+@given(strategies.non_variadic_transparent_functions_calls_with_invalid_kwargs)
+def test_invalid_kwargs_call(
+        function_call_with_invalid_kwargs: FunctionCall
+) -> None:
+    function, args, invalid_kwargs = function_call_with_invalid_kwargs
+    curried = curry(function,
+                    planned=True)
+
+    with pytest.raises(TypeError):
+        curried(*args, **invalid_kwargs)
+
+
+@given(strategies.transparent_functions_calls)
+def test_pickle(function_call: FunctionCall) -> None:
+    function, args, kwargs = function_call
+    curried = curry(function,
+                    planned=True)
+
+    result = round_trip_pickle(curried)
+
+    assert result(*args, **kwargs) == curried(*args, **kwargs)
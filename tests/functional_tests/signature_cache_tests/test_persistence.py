@@ -0,0 +1,71 @@
+import copyreg
+import faulthandler
+import io
+import pickle
+from pathlib import Path
+from typing import ForwardRef
+
+from lz._core.signatures import (_SignaturesPickler,
+                                 to_signature)
+from lz.functional import (clear_signature_cache,
+                           load_signature_cache,
+                           save_signature_cache,
+                           signature_cache_info)
+
+
+def test_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / 'signatures.pickle'
+    clear_signature_cache()
+    signature = to_signature(len)
+
+    save_signature_cache(path)
+    clear_signature_cache()
+    load_signature_cache(path)
+
+    assert to_signature(len) == signature
+    cache_info = signature_cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 0)
+
+
+def test_forward_references(tmp_path: Path) -> None:
+    path = tmp_path / 'signatures.pickle'
+    clear_signature_cache()
+    # annotation of the second parameter has forward reference
+    signature = to_signature(isinstance)
+
+    save_signature_cache(path)
+    clear_signature_cache()
+    load_signature_cache(path)
+
+    assert to_signature(isinstance) == signature
+    cache_info = signature_cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 0)
+
+
+def test_standard_streams(tmp_path: Path) -> None:
+    path = tmp_path / 'signatures.pickle'
+    clear_signature_cache()
+    # default of the `file` parameter is the standard error stream
+    signature = to_signature(faulthandler.enable)
+
+    save_signature_cache(path)
+    clear_signature_cache()
+    load_signature_cache(path)
+
+    assert to_signature(faulthandler.enable) == signature
+    cache_info = signature_cache_info()
+    assert (cache_info.hits, cache_info.misses) == (1, 0)
+
+
+def test_forward_references_fields() -> None:
+    forward_reference = ForwardRef('int',
+                                   is_argument=False)
+    stream = io.BytesIO()
+
+    _SignaturesPickler(stream).dump(forward_reference)
+    result = pickle.loads(stream.getvalue())
+
+    assert all(getattr(result, name) == getattr(forward_reference, name)
+               for name in ForwardRef.__slots__
+               if name != '__forward_code__')
+    assert ForwardRef not in copyreg.dispatch_table
@@ -0,0 +1,87 @@
+import functools
+import gc
+from typing import (Any,
+                    Callable)
+
+from hypothesis import given
+from paradigm.base import signature_from_callable
+
+from lz._core.signatures import to_signature
+from lz.functional import (clear_signature_cache,
+                           signature_cache_info)
+from tests import strategies
+
+
+@given(strategies.callables)
+def test_basic(callable_: Callable[..., Any]) -> None:
+    clear_signature_cache()
+
+    first_result = to_signature(callable_)
+    second_result = to_signature(callable_)
+
+    cache_info = signature_cache_info()
+    assert first_result == second_result == signature_from_callable(callable_)
+    assert cache_info.hits + cache_info.misses == 2
+
+
+def test_weak_references() -> None:
+    def function(argument: Any) -> Any:
+        return argument
+
+    clear_signature_cache()
+    to_signature(function)
+    first_cache_info = signature_cache_info()
+
+    del function
+    gc.collect()
+
+    second_cache_info = signature_cache_info()
+    assert first_cache_info.currsize == 1
+    assert second_cache_info.currsize == 0
+
+
+def test_equal_callables() -> None:
+    def function(first: Any, second: Any, third: Any) -> Any:
+        return first, second, third
+
+    unary, binary = (EqualPartial(function, None, None),
+                     EqualPartial(function, None))
+
+    clear_signature_cache()
+    first_result = to_signature(unary)
+    second_result = to_signature(binary)
+
+    cache_info = signature_cache_info()
+    assert first_result == signature_from_callable(unary)
+    assert second_result == signature_from_callable(binary)
+    assert (cache_info.hits, cache_info.misses) == (0, 2)
+
+
+def test_bound_methods() -> None:
+    class Class:
+        def method(self, argument: Any) -> Any:
+            return argument
+
+    instance = Class()
+
+    clear_signature_cache()
+    first_result = to_signature(instance.method)
+    second_result = to_signature(instance.method)
+
+    cache_info = signature_cache_info()
+    assert first_result == second_result
+    assert (cache_info.hits, cache_info.misses) == (1, 1)
+    assert cache_info.currsize == 1
+
+    del instance
+    gc.collect()
+
+    assert signature_cache_info().currsize == 0
+
+
+class EqualPartial(functools.partial):  # type: ignore[type-arg]
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, EqualPartial)
+
+    def __hash__(self) -> int:
+        return 0
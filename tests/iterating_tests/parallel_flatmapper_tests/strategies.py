@@ -0,0 +1,13 @@
+from hypothesis import strategies
+
+from lz.iterating import expand
+from tests.strategies import to_homogeneous_iterables
+
+backends = strategies.sampled_from(['process', 'thread'])
+chunks_sizes = strategies.integers(1, 10)
+maxes_buffered = strategies.integers(1, 10)
+maxes_in_flight = strategies.none() | strategies.integers(1, 10)
+maps = strategies.sampled_from([expand, range])
+maps_arguments_iterables = to_homogeneous_iterables(
+        strategies.integers(0, 100)
+)
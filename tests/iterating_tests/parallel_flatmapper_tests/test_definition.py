@@ -0,0 +1,94 @@
+from pickle import PicklingError
+from typing import (Callable,
+                    Iterable,
+                    Optional)
+
+import pytest
+from hypothesis import given
+
+from lz.functional import flatmap
+from lz.iterating import (header,
+                          parallel_flatmapper)
+from lz.replication import duplicate
+from tests.hints import (Domain,
+                         Range)
+from . import strategies
+
+
+@given(strategies.maps, strategies.maps_arguments_iterables,
+       strategies.backends, strategies.chunks_sizes,
+       strategies.maxes_buffered, strategies.maxes_in_flight)
+def test_basic(map_: Callable[[Domain], Iterable[Range]],
+               arguments: Iterable[Domain],
+               backend: str,
+               chunk_size: int,
+               max_buffered: int,
+               max_in_flight: Optional[int]) -> None:
+    original, target = duplicate(arguments)
+    flatmap_iterable = parallel_flatmapper(map_,
+                                           backend=backend,
+                                           chunk_size=chunk_size,
+                                           max_buffered=max_buffered,
+                                           max_in_flight=max_in_flight)
+
+    result = flatmap_iterable(target)
+
+    assert list(result) == list(flatmap(map_, original))
+
+
+@given(strategies.chunks_sizes, strategies.maxes_buffered)
+def test_unbounded_expansions(chunk_size: int, max_buffered: int) -> None:
+    flatmap_iterable = parallel_flatmapper(_to_naturals_from,
+                                           chunk_size=chunk_size,
+                                           max_buffered=max_buffered)
+
+    result = list(header(max_buffered)(flatmap_iterable([0, 1])))
+
+    assert result == list(range(max_buffered))
+
+
+def test_error() -> None:
+    flatmap_iterable = parallel_flatmapper(_to_failing_expansion)
+
+    with pytest.raises(ValueError):
+        list(flatmap_iterable(range(10)))
+
+
+@given(strategies.backends)
+def test_unpicklable_map(backend: str) -> None:
+    flatmap_iterable = parallel_flatmapper(lambda value: range(value),
+                                           backend=backend)
+
+    if backend == 'process':
+        with pytest.raises((AttributeError, PicklingError)):
+            list(flatmap_iterable(range(3)))
+    else:
+        assert list(flatmap_iterable(range(3))) == [0, 0, 1]
+
+
+@given(strategies.backends)
+def test_interruption(backend: str) -> None:
+    flatmap_iterable = parallel_flatmapper(_to_interrupted_expansion,
+                                           backend=backend)
+
+    with pytest.raises(Interruption):
+        list(flatmap_iterable(range(3)))
+
+
+class Interruption(BaseException):
+    pass
+
+
+def _to_interrupted_expansion(value: int) -> Iterable[int]:
+    raise Interruption(value)
+
+
+def _to_failing_expansion(value: int) -> Iterable[int]:
+    yield value
+    raise ValueError(value)
+
+
+def _to_naturals_from(value: int) -> Iterable[int]:
+    while True:
+        yield value
+        value += 1
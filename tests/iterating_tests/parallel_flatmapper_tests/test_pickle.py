@@ -0,0 +1,23 @@
+from typing import (Callable,
+                    Iterable)
+
+from hypothesis import given
+
+from lz.iterating import parallel_flatmapper
+from lz.replication import duplicate
+from tests.hints import (Domain,
+                         Range)
+from tests.utils import (are_iterables_similar,
+                         round_trip_pickle)
+from . import strategies
+
+
+@given(strategies.maps, strategies.maps_arguments_iterables)
+def test_round_trip(map_: Callable[[Domain], Iterable[Range]],
+                    arguments: Iterable[Domain]) -> None:
+    original, target = duplicate(arguments)
+    flatmap_iterable = parallel_flatmapper(map_)
+
+    result = round_trip_pickle(flatmap_iterable)
+
+    assert are_iterables_similar(result(target), flatmap_iterable(original))
@@ -0,0 +1,13 @@
+from hypothesis import strategies
+
+from tests.strategies import (empty,
+                              maps,
+                              maps_arguments,
+                              to_homogeneous_iterables)
+
+backends = strategies.sampled_from(['process', 'thread'])
+chunks_sizes = strategies.integers(1, 10)
+maxes_in_flight = strategies.none() | strategies.integers(1, 10)
+empty_iterables = empty.iterables
+maps = maps
+maps_arguments_iterables = to_homogeneous_iterables(maps_arguments)
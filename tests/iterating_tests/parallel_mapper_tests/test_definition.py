@@ -0,0 +1,87 @@
+import os
+from typing import (Callable,
+                    Iterable,
+                    Optional)
+
+from hypothesis import given
+
+from lz.iterating import (header,
+                          parallel_mapper)
+from lz.replication import duplicate
+from tests.hints import (Domain,
+                         Range)
+from tests.utils import is_empty
+from . import strategies
+
+
+@given(strategies.maps, strategies.empty_iterables, strategies.backends)
+def test_base_case(map_: Callable[[Domain], Range],
+                   empty_iterable: Iterable[Domain],
+                   backend: str) -> None:
+    map_iterable = parallel_mapper(map_,
+                                   backend=backend)
+
+    result = map_iterable(empty_iterable)
+
+    assert is_empty(result)
+
+
+@given(strategies.maps, strategies.maps_arguments_iterables,
+       strategies.backends, strategies.chunks_sizes,
+       strategies.maxes_in_flight)
+def test_ordered(map_: Callable[[Domain], Range],
+                 arguments: Iterable[Domain],
+                 backend: str,
+                 chunk_size: int,
+                 max_in_flight: Optional[int]) -> None:
+    original, target = duplicate(arguments)
+    map_iterable = parallel_mapper(map_,
+                                   backend=backend,
+                                   chunk_size=chunk_size,
+                                   max_in_flight=max_in_flight)
+
+    result = map_iterable(target)
+
+    assert list(result) == list(map(map_, original))
+
+
+@given(strategies.maps, strategies.maps_arguments_iterables,
+       strategies.chunks_sizes, strategies.maxes_in_flight)
+def test_unordered(map_: Callable[[Domain], Range],
+                   arguments: Iterable[Domain],
+                   chunk_size: int,
+                   max_in_flight: Optional[int]) -> None:
+    original, target = duplicate(arguments)
+    map_iterable = parallel_mapper(map_,
+                                   chunk_size=chunk_size,
+                                   max_in_flight=max_in_flight,
+                                   ordered=False)
+
+    result = map_iterable(target)
+
+    assert sorted(map(repr, result)) == sorted(map(repr, map(map_, original)))
+
+
+@given(strategies.maps, strategies.chunks_sizes, strategies.maxes_in_flight)
+def test_laziness(map_: Callable[[Domain], Range],
+                  chunk_size: int,
+                  max_in_flight: Optional[int]) -> None:
+    consumed = []
+
+    def to_arguments() -> Iterable[int]:
+        index = 0
+        while True:
+            consumed.append(index)
+            yield index
+            index += 1
+
+    map_iterable = parallel_mapper(map_,
+                                   chunk_size=chunk_size,
+                                   max_in_flight=max_in_flight)
+
+    result = list(header(1)(map_iterable(to_arguments())))
+
+    assert result == [map_(0)]
+    assert len(consumed) <= chunk_size * (
+            (max_in_flight or 2 * (os.cpu_count() or 1)) + 1
+    )
@@ -72,3 +72,30 @@ def test_associativity(left_predicate: Callable[[Domain], bool],
 
     assert (first_conjunction(predicate_argument)
             is second_conjunction(predicate_argument))
+
+
+@given(strategies.false_predicates, strategies.predicates_arguments)
+def test_short_circuit(false_predicate: Callable[[Domain], bool],
+                       predicate_argument: Domain) -> None:
+    def failing_predicate(_argument: Domain) -> bool:
+        raise AssertionError('Predicate should not be evaluated.')
+
+    conjunction = conjoin(false_predicate, failing_predicate)
+
+    result = conjunction(predicate_argument)
+
+    assert result is False
+
+
+@given(strategies.predicates, strategies.predicates,
+       strategies.predicates_arguments)
+def test_adaptive(left_predicate: Callable[[Domain], bool],
+                  right_predicate: Callable[[Domain], bool],
+                  predicate_argument: Domain) -> None:
+    conjunction = conjoin(left_predicate, right_predicate)
+    adaptive_conjunction = conjoin(left_predicate, right_predicate,
+                                   adaptive=True)
+
+    assert all(adaptive_conjunction(predicate_argument)
+               is conjunction(predicate_argument)
+               for _ in range(100))
@@ -72,3 +72,30 @@ def test_associativity(left_predicate: Callable[[Domain], bool],
 
     assert (first_disjunction(predicate_argument)
             is second_disjunction(predicate_argument))
+
+
+@given(strategies.true_predicates, strategies.predicates_arguments)
+def test_short_circuit(true_predicate: Callable[[Domain], bool],
+                       predicate_argument: Domain) -> None:
+    def failing_predicate(_argument: Domain) -> bool:
+        raise AssertionError('Predicate should not be evaluated.')
+
+    disjunction = disjoin(true_predicate, failing_predicate)
+
+    result = disjunction(predicate_argument)
+
+    assert result is True
+
+
+@given(strategies.predicates, strategies.predicates,
+       strategies.predicates_arguments)
+def test_adaptive(left_predicate: Callable[[Domain], bool],
+                  right_predicate: Callable[[Domain], bool],
+                  predicate_argument: Domain) -> None:
+    disjunction = disjoin(left_predicate, right_predicate)
+    adaptive_disjunction = disjoin(left_predicate, right_predicate,
+                                   adaptive=True)
+
+    assert all(adaptive_disjunction(predicate_argument)
+               is disjunction(predicate_argument)
+               for _ in range(100))
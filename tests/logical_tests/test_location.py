@@ -0,0 +1,63 @@
+import traceback
+from typing import (Callable,
+                    Set)
+
+import pytest
+from hypothesis import given
+
+from lz.logical import (conjoin,
+                        disjoin,
+                        exclusive_disjoin,
+                        negate)
+from tests import strategies
+from tests.hints import Domain
+
+JUNCTIONS_NAMES = {'conjunction', 'disjunction', 'exclusive_disjunction'}
+
+
+@given(strategies.predicates, strategies.predicates_arguments)
+def test_capture(predicate: Callable[[Domain], bool],
+                 predicate_argument: Domain) -> None:
+    junctions = [conjoin(fail, predicate),
+                 conjoin(fail, predicate,
+                         adaptive=True),
+                 disjoin(fail, predicate),
+                 disjoin(fail, predicate,
+                         adaptive=True),
+                 exclusive_disjoin(fail, predicate),
+                 negate(fail)]
+
+    for junction in junctions:
+        with pytest.raises(ValueError) as error_info:
+            junction(predicate_argument)
+
+        assert __file__ in to_files_names(error_info.value)
+
+
+@given(strategies.predicates, strategies.predicates_arguments)
+def test_no_capture(predicate: Callable[[Domain], bool],
+                    predicate_argument: Domain) -> None:
+    junctions = [conjoin(fail, predicate,
+                         capture_location=False),
+                 disjoin(fail, predicate,
+                         capture_location=False),
+                 exclusive_disjoin(fail, predicate,
+                                   capture_location=False),
+                 negate(fail,
+                        capture_location=False)]
+
+    for junction in junctions:
+        with pytest.raises(ValueError) as error_info:
+            junction(predicate_argument)
+
+        assert __file__ not in to_files_names(error_info.value)
+
+
+def fail(*_: object) -> bool:
+    raise ValueError()
+
+
+def to_files_names(error: BaseException) -> Set[str]:
+    return {frame_summary.filename
+            for frame_summary in traceback.extract_tb(error.__traceback__)
+            if frame_summary.name in JUNCTIONS_NAMES}
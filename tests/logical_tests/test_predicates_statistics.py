@@ -0,0 +1,43 @@
+from typing import Callable
+
+import pytest
+from hypothesis import given
+
+from lz.logical import (conjoin,
+                        disjoin,
+                        predicates_statistics)
+from tests import strategies
+from tests.hints import Domain
+
+
+@given(strategies.true_predicates, strategies.false_predicates,
+       strategies.predicates_arguments)
+def test_reordering(true_predicate: Callable[[Domain], bool],
+                    false_predicate: Callable[[Domain], bool],
+                    predicate_argument: Domain) -> None:
+    conjunction = conjoin(true_predicate, false_predicate,
+                          adaptive=True)
+    disjunction = disjoin(false_predicate, true_predicate,
+                          adaptive=True)
+
+    for _ in range(10_000):
+        conjunction(predicate_argument)
+        disjunction(predicate_argument)
+
+    conjunction_statistics = predicates_statistics(conjunction)
+    disjunction_statistics = predicates_statistics(disjunction)
+    assert [statistics.predicate
+            for statistics in conjunction_statistics] == [false_predicate,
+                                                          true_predicate]
+    assert [statistics.predicate
+            for statistics in disjunction_statistics] == [true_predicate,
+                                                          false_predicate]
+    assert all(0 <= statistics.stops_count <= statistics.calls_count
+               for statistics in [*conjunction_statistics,
+                                  *disjunction_statistics])
+
+
+@given(strategies.predicates)
+def test_non_adaptive(predicate: Callable[[Domain], bool]) -> None:
+    with pytest.raises(TypeError):
+        predicates_statistics(conjoin(predicate))
@@ -1,3 +1,6 @@
+from array import array
+from functools import partial
+
 from hypothesis import strategies
 
 from tests.strategies import (iterables,
@@ -6,3 +9,18 @@ from tests.strategies import (iterables,
 scalars = scalars
 iterables = iterables
 sizes = strategies.integers(0, 100)
+immutable_tuples = strategies.tuples(
+        strategies.integers(), strategies.floats(allow_nan=False),
+        strategies.text(), strategies.binary(), strategies.none(),
+        strategies.tuples(strategies.booleans(), strategies.text())
+)
+lags = strategies.integers(0, 20)
+max_buffered = strategies.integers(0, 10)
+mutable_elements_lists = strategies.lists(
+        strategies.lists(strategies.integers())
+)
+buffers = (strategies.binary().map(bytearray)
+           | strategies.lists(strategies.integers(-2 ** 31, 2 ** 31 - 1))
+           .map(partial(array, 'i'))
+           | strategies.binary().map(bytearray).map(memoryview))
+booleans = strategies.booleans()
@@ -1,8 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import (Any,
-                    Iterable)
+                    Iterable,
+                    List,
+                    Tuple)
 
 from hypothesis import given
 
+from lz import replication
 from lz.replication import replicator
 from tests.utils import (are_iterables_similar,
                          is_empty)
@@ -28,3 +33,200 @@ def test_step(object_: Any, iterable: Iterable[Any], size: int) -> None:
         assert are_iterables_similar(replicator(size)
                                      (next(result_iterator)),
                                      result_iterator)
+
+
+@given(strategies.sizes)
+def test_lagging_replicas(size: int) -> None:
+    replicate = replicator(size + 2)
+    leading_replica, *lagging_replicas = replicate(iter(range(size)))
+
+    leading_elements = list(leading_replica)
+
+    assert all(list(replica) == leading_elements
+               for replica in lagging_replicas)
+
+
+@given(strategies.immutable_tuples, strategies.sizes)
+def test_immutable_elements(immutable_tuple: Tuple[Any, ...],
+                            size: int) -> None:
+    replicate = replicator(size)
+
+    result = replicate(iter(immutable_tuple))
+
+    assert all(all(element is original_element
+                   for element, original_element in zip(replica,
+                                                        immutable_tuple))
+               for replica in result)
+    assert all(replica is immutable_tuple
+               for replica in replicate(immutable_tuple))
+
+
+@given(strategies.sizes, strategies.sizes)
+def test_mutated_elements(size: int, elements_count: int) -> None:
+    def to_mutated_prefixes() -> Iterable[List[int]]:
+        prefix: List[int] = []
+        for element in range(elements_count):
+            prefix.append(element)
+            yield prefix
+
+    replicate = replicator(size + 1)
+
+    result = [list(replica)
+              for replica in replicate(to_mutated_prefixes())]
+
+    assert all(replica_elements == [list(range(index + 1))
+                                    for index in range(elements_count)]
+               for replica_elements in result)
+
+
+@given(strategies.mutable_elements_lists, strategies.sizes,
+       strategies.max_buffered, strategies.lags)
+def test_spilling(elements: List[List[int]],
+                  size: int,
+                  max_buffered: int,
+                  lag: int) -> None:
+    replicate = replicator(size + 2,
+                           max_buffered=max_buffered)
+    leading_replica, *lagging_replicas = replicate(iter(elements))
+
+    leading_elements = list(islice(leading_replica, lag))
+    lagging_elements = [list(replica) for replica in lagging_replicas]
+    leading_elements += leading_replica
+
+    assert leading_elements == elements
+    assert all(replica_elements == elements
+               for replica_elements in lagging_elements)
+    assert all(replica_element is not element
+               for replica_elements in lagging_elements
+               for replica_element, element in zip(replica_elements,
+                                                   elements))
+
+
+@given(strategies.mutable_elements_lists, strategies.sizes,
+       strategies.max_buffered)
+def test_thread_safe(elements: List[List[int]],
+                     size: int,
+                     max_buffered: int) -> None:
+    replicate = replicator(size + 1,
+                           max_buffered=max_buffered + 1,
+                           thread_safe=True)
+
+    with ThreadPoolExecutor(size + 1) as executor:
+        result = list(executor.map(list, replicate(iter(elements))))
+
+    assert all(replica_elements == elements
+               for replica_elements in result)
+    assert all(replica_element is not element
+               for replica_elements in result[1:]
+               for replica_element, element in zip(replica_elements,
+                                                   elements))
+
+
+@given(strategies.mutable_elements_lists, strategies.sizes,
+       strategies.max_buffered)
+def test_thread_safe_closed_before_start(elements: List[List[int]],
+                                         size: int,
+                                         max_buffered: int) -> None:
+    replicate = replicator(size + 2,
+                           max_buffered=max_buffered + 1,
+                           thread_safe=True)
+
+    first_replica, *rest_replicas = replicate(iter(elements))
+    for replica in rest_replicas:
+        replica.close()
+
+    assert list(first_replica) == elements
+
+
+@given(strategies.mutable_elements_lists, strategies.sizes)
+def test_containers(elements: List[List[int]], size: int) -> None:
+    replicate = replicator(size)
+    mapping = dict(enumerate(elements))
+
+    lists_replicas = list(replicate(elements))
+    mappings_replicas = list(replicate(mapping))
+
+    assert all(replica == elements and replica is not elements
+               for replica in lists_replicas)
+    assert all(replica == mapping and replica is not mapping
+               for replica in mappings_replicas)
+    assert all(replica_element is not element
+               for replica in lists_replicas
+               for replica_element, element in zip(replica, elements))
+    assert all(replica[key] is not value
+               for replica in mappings_replicas
+               for key, value in mapping.items())
+
+
+@given(strategies.buffers, strategies.sizes)
+def test_buffers(buffer: Any, size: int) -> None:
+    replicate = replicator(size)
+
+    result = list(replicate(buffer))
+
+    assert all(replica == buffer for replica in result)
+    assert all(replica is not buffer for replica in result)
+
+
+@given(strategies.buffers, strategies.sizes)
+def test_read_only_buffers(buffer: Any, size: int) -> None:
+    replicate = replicator(size,
+                           read_only=True)
+
+    result = list(replicate(buffer))
+
+    assert all(isinstance(replica, memoryview) and replica.readonly
+               for replica in result)
+    assert all(replica.tobytes() == memoryview(buffer).tobytes()
+               for replica in result)
+
+
+@given(strategies.buffers, strategies.sizes)
+def test_read_only_buffers_release(buffer: Any, size: int) -> None:
+    replicate = replicator(size + 2,
+                           read_only=True)
+    released_replica, *rest_replicas = replicate(buffer)
+
+    released_replica.release()
+
+    assert all(replica.tobytes() == memoryview(buffer).tobytes()
+               for replica in rest_replicas)
+
+
+@given(strategies.buffers, strategies.sizes)
+def test_copies_of_read_only_views(buffer: Any, size: int) -> None:
+    replicate = replicator(size)
+    original = bytearray(memoryview(buffer).tobytes())
+    view = memoryview(original).toreadonly()
+
+    result = list(replicate(view))
+    original[:] = bytes(len(original))
+
+    assert all(replica.tobytes() == memoryview(buffer).tobytes()
+               for replica in result)
+
+
+@given(strategies.mutable_elements_lists, strategies.sizes,
+       strategies.booleans)
+def test_read_only_non_buffers(elements: List[List[int]],
+                               size: int,
+                               read_only: bool) -> None:
+    iterators_replicas = [list(replica)
+                          for replica in replication.replicate(
+                                  iter(elements),
+                                  count=size,
+                                  read_only=read_only
+                          )]
+    ranges_replicas = [list(replica)
+                       for replica in replication.replicate(
+                               range(len(elements)),
+                               count=size,
+                               read_only=read_only
+                       )]
+    lists_replicas = list(replicator(size,
+                                     read_only=read_only)(elements))
+
+    assert all(replica == elements for replica in iterators_replicas)
+    assert all(replica == list(range(len(elements)))
+               for replica in ranges_replicas)
+    assert all(replica == elements for replica in lists_replicas)
@@ -1,3 +1,4 @@
+import mmap
 import os
 from functools import partial
 from typing import (Any,
@@ -71,3 +72,30 @@ byte_streams_with_reverse_parameters = (
 text_streams_with_reverse_parameters = (
     encodings.flatmap(to_text_streams).flatmap(
             to_stream_with_reverse_parameters))
+files_contents_chunks = strategies.sampled_from([b'a', b'bc', b'\r', b'\n',
+                                                 b'\r\n', b'<>'])
+files_contents = strategies.lists(files_contents_chunks).map(b''.join)
+# contents span few windows of memory mapping
+large_files_contents = (strategies.lists(files_contents_chunks,
+                                         min_size=1)
+                        .map(b''.join)
+                        .map(lambda contents: contents
+                             * (2 * mmap.ALLOCATIONGRANULARITY
+                                // len(contents) + 1)))
+windows_batches_sizes = strategies.integers(1,
+                                            2 * mmap.ALLOCATIONGRANULARITY)
+files_lines_separators = strategies.sampled_from([None, b'\n', b'\r\n',
+                                                  b'<>'])
+booleans = strategies.booleans()
+batches_sizes = strategies.integers(1, 100)
+small_batches_sizes = strategies.integers(1, 8)
+repetitive_bytes = strategies.sampled_from([b'|', b'a', b'\n'])
+repetitive_contents = strategies.lists(
+        repetitive_bytes | repetitive_bytes.map(lambda byte: byte * 2)
+).map(b''.join)
+# self-overlapping separators are the ones prone to be matched twice
+repetitive_separators = (strategies.sampled_from([b'||', b'|||', b'|a|',
+                                                  b'\n\n'])
+                         | strategies.lists(repetitive_bytes,
+                                            min_size=1,
+                                            max_size=3).map(b''.join))
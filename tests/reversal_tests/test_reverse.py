@@ -1,5 +1,9 @@
+import io
+import tempfile
 from collections import abc
 from typing import (Any,
+                    List,
+                    Optional,
                     Sequence)
 
 import pytest
@@ -8,7 +12,10 @@ from hypothesis import given
 from lz.iterating import (first,
                           last)
 from lz.replication import duplicate
-from lz.reversal import reverse
+from lz.reversal import (reverse,
+                         reverse_bytes_stream,
+                         reverse_mapped_file,
+                         reverse_segmented_file)
 from tests.hints import (ByteSequence,
                          StreamWithReverseParameters)
 from tests.utils import (are_iterables_similar,
@@ -98,6 +105,242 @@ def remove_newline_characters_from_string(string: str) -> str:
     return string.translate(str.maketrans({'\r': None, '\n': None}))
 
 
+@given(strategies.files_contents, strategies.files_lines_separators,
+       strategies.booleans, strategies.booleans)
+def test_mapped_file(contents: bytes,
+                     lines_separator: Optional[bytes],
+                     keep_separator: bool,
+                     views: bool) -> None:
+    with tempfile.TemporaryFile() as file:
+        file.write(contents)
+        file.flush()
+        file.seek(0)
+        with open(file.fileno(), 'rb',
+                  closefd=False) as reader:
+            result = [bytes(line)
+                      for line in reverse(reader,
+                                          lines_separator=lines_separator,
+                                          keep_lines_separator=keep_separator,
+                                          views=views)]
+
+    assert result == split_lines(contents, lines_separator,
+                                 keep_separator)[::-1]
+
+
+@given(strategies.large_files_contents, strategies.files_lines_separators,
+       strategies.booleans, strategies.booleans,
+       strategies.windows_batches_sizes)
+def test_mapped_file_windows(contents: bytes,
+                             lines_separator: Optional[bytes],
+                             keep_separator: bool,
+                             views: bool,
+                             batch_size: int) -> None:
+    with tempfile.TemporaryFile() as file:
+        file.write(contents)
+        file.flush()
+        result = [bytes(line)
+                  for line in reverse_mapped_file(
+                        file,
+                        batch_size=batch_size,
+                        lines_separator=lines_separator,
+                        keep_lines_separator=keep_separator,
+                        views=views
+                )]
+
+    assert result == split_lines(contents, lines_separator,
+                                 keep_separator)[::-1]
+
+
+@given(strategies.files_contents, strategies.files_lines_separators,
+       strategies.booleans, strategies.batches_sizes)
+def test_byte_stream_lines(contents: bytes,
+                           lines_separator: Optional[bytes],
+                           keep_separator: bool,
+                           batch_size: int) -> None:
+    result = reverse(io.BytesIO(contents),
+                     batch_size=batch_size,
+                     lines_separator=lines_separator,
+                     keep_lines_separator=keep_separator)
+
+    assert list(result) == split_lines(contents, lines_separator,
+                                       keep_separator)[::-1]
+
+
+@given(strategies.files_contents, strategies.files_lines_separators,
+       strategies.booleans, strategies.batches_sizes)
+def test_adaptive_batches(contents: bytes,
+                          lines_separator: Optional[bytes],
+                          keep_separator: bool,
+                          batch_size: int) -> None:
+    with tempfile.TemporaryFile() as file:
+        file.write(contents)
+        file.flush()
+        result = list(reverse_bytes_stream(
+                file,
+                batch_size=batch_size,
+                lines_separator=lines_separator,
+                keep_lines_separator=keep_separator,
+                max_batch_size=4 * batch_size
+        ))
+
+    assert result == split_lines(contents, lines_separator,
+                                 keep_separator)[::-1]
+
+
+@given(strategies.large_files_contents, strategies.files_lines_separators,
+       strategies.booleans, strategies.windows_batches_sizes)
+def test_adaptive_windows(contents: bytes,
+                          lines_separator: Optional[bytes],
+                          keep_separator: bool,
+                          batch_size: int) -> None:
+    with tempfile.TemporaryFile() as file:
+        file.write(contents)
+        file.flush()
+        file.seek(0)
+        with open(file.fileno(), 'rb',
+                  closefd=False) as reader:
+            result = list(reverse(reader,
+                                  batch_size=batch_size,
+                                  lines_separator=lines_separator,
+                                  keep_lines_separator=keep_separator,
+                                  max_batch_size=4 * batch_size))
+
+    assert result == split_lines(contents, lines_separator,
+                                 keep_separator)[::-1]
+
+
+@given(strategies.files_contents, strategies.batches_sizes)
+def test_parallel_max_batch_size(contents: bytes, batch_size: int) -> None:
+    with tempfile.TemporaryFile() as file:
+        file.write(contents)
+        file.flush()
+        with open(file.fileno(), 'rb',
+                  closefd=False) as reader:
+            with pytest.raises(ValueError):
+                list(reverse(reader,
+                             batch_size=batch_size,
+                             max_batch_size=batch_size,
+                             parallel=True))
+
+
+@given(strategies.files_contents, strategies.files_lines_separators,
+       strategies.booleans, strategies.batches_sizes)
+def test_segmented_file(contents: bytes,
+                        lines_separator: Optional[bytes],
+                        keep_separator: bool,
+                        segment_size: int) -> None:
+    with tempfile.TemporaryFile() as file:
+        file.write(contents)
+        file.flush()
+        result = list(reverse_segmented_file(
+                file,
+                lines_separator=lines_separator,
+                keep_lines_separator=keep_separator,
+                segment_size=segment_size,
+                workers_count=2
+        ))
+
+    assert result == split_lines(contents, lines_separator,
+                                 keep_separator)[::-1]
+
+
+@given(strategies.repetitive_contents, strategies.repetitive_separators,
+       strategies.small_batches_sizes)
+def test_byte_stream_contents(contents: bytes,
+                              lines_separator: bytes,
+                              batch_size: int) -> None:
+    result = reverse(io.BytesIO(contents),
+                     batch_size=batch_size,
+                     lines_separator=lines_separator)
+
+    assert b''.join(reversed(list(result))) == contents
+
+
+@given(strategies.repetitive_contents, strategies.repetitive_separators,
+       strategies.booleans, strategies.small_batches_sizes)
+def test_mapped_file_and_byte_stream(contents: bytes,
+                                     lines_separator: bytes,
+                                     keep_separator: bool,
+                                     batch_size: int) -> None:
+    with tempfile.TemporaryFile() as file:
+        file.write(contents)
+        file.flush()
+        file.seek(0)
+        with open(file.fileno(), 'rb',
+                  closefd=False) as reader:
+            result = list(reverse(reader,
+                                  lines_separator=lines_separator,
+                                  keep_lines_separator=keep_separator))
+
+    assert result == list(reverse(io.BytesIO(contents),
+                                  batch_size=batch_size,
+                                  lines_separator=lines_separator,
+                                  keep_lines_separator=keep_separator))
+
+
+@given(strategies.repetitive_contents, strategies.repetitive_separators,
+       strategies.booleans, strategies.small_batches_sizes)
+def test_segmented_and_mapped_file(contents: bytes,
+                                   lines_separator: bytes,
+                                   keep_separator: bool,
+                                   segment_size: int) -> None:
+    with tempfile.TemporaryFile() as file:
+        file.write(contents)
+        file.flush()
+        with open(file.fileno(), 'rb',
+                  closefd=False) as reader:
+            parallel_result = list(reverse(reader,
+                                           lines_separator=lines_separator,
+                                           keep_lines_separator=keep_separator,
+                                           parallel=True))
+            serial_result = list(reverse(reader,
+                                         lines_separator=lines_separator,
+                                         keep_lines_separator=keep_separator))
+        segmented_result = list(reverse_segmented_file(
+                file,
+                lines_separator=lines_separator,
+                keep_lines_separator=keep_separator,
+                segment_size=segment_size,
+                workers_count=2
+        ))
+
+    assert parallel_result == segmented_result == serial_result
+
+
+def test_self_overlapping_separator() -> None:
+    contents, lines_separator = b'x\n\n\ny', b'\n\n'
+    with tempfile.TemporaryFile() as file:
+        file.write(contents)
+        file.flush()
+        with open(file.fileno(), 'rb',
+                  closefd=False) as reader:
+            mapped_result = list(reverse(reader,
+                                         lines_separator=lines_separator))
+            segmented_result = list(reverse(reader,
+                                            lines_separator=lines_separator,
+                                            parallel=True))
+    stream_results = [list(reverse(io.BytesIO(contents),
+                                   batch_size=batch_size,
+                                   lines_separator=lines_separator))
+                      for batch_size in range(1, len(contents) + 1)]
+
+    assert mapped_result == segmented_result == [b'\ny', b'x\n\n']
+    assert all(stream_result == mapped_result
+               for stream_result in stream_results)
+
+
+def split_lines(contents: bytes,
+                lines_separator: Optional[bytes],
+                keep_separator: bool) -> List[bytes]:
+    if lines_separator is None:
+        return contents.splitlines(keep_separator)
+    elif not contents:
+        return []
+    *lines, last_line = contents.split(lines_separator)
+    return [line + keep_separator * lines_separator
+            for line in lines] + [last_line]
+
+
 @given(strategies.scalars)
 def test_unsupported_type(object_: Any) -> None:
     with pytest.raises(TypeError):
@@ -0,0 +1,21 @@
+from hypothesis import given
+
+from lz import right
+from lz._core.signatures import to_signature
+from tests import strategies
+from tests.hints import PartitionedFunctionCall
+
+
+@given(strategies.partitioned_transparent_functions_calls)
+def test_basic(partitioned_function_call: PartitionedFunctionCall) -> None:
+    (function,
+     (first_args_part, second_args_part),
+     (first_kwargs_part, second_kwargs_part)) = partitioned_function_call
+    applied = right.applier(function,
+                            *second_args_part,
+                            **first_kwargs_part)
+
+    result = to_signature(applied)
+
+    assert result.expects(*first_args_part, **second_kwargs_part)
+    assert result.all_set(*first_args_part, **second_kwargs_part)
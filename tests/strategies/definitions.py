@@ -1,5 +1,6 @@
 import importlib
 import inspect
+import io
 import pickle
 from functools import partial
 from types import ModuleType
@@ -14,6 +15,7 @@ from paradigm._core.catalog import path_to_string
 from paradigm._core.discovery import supported_stdlib_modules_paths
 from paradigm.base import signature_from_callable
 
+from lz._core.signatures import _SignaturesPickler
 from tests.hints import Domain
 from tests.utils import flatmap
 
@@ -28,7 +30,7 @@ def is_supported(value: Any) -> bool:
         return False
     else:
         try:
-            pickle.dumps(signature)
+            _SignaturesPickler(io.BytesIO()).dump(signature)
         except (AttributeError, pickle.PicklingError):
             return False
         else: